@@ -30,7 +30,6 @@ from pydantic import BaseModel, Field
 sys.path.insert(0, os.path.dirname(__file__))
 
 from core.database import db
-from core.legal_rag import search_legal_context
 
 logger = logging.getLogger("api")
 
@@ -280,6 +279,10 @@ def rag_search(
     x_user_id: Optional[str] = Header(None),
 ):
     """RAG 벡터 검색 (TF-IDF 코사인 유사도)"""
+    # sklearn 등 무거운 의존성은 RAG 엔드포인트가 실제로 호출될 때만 로드
+    # (앱 import·테스트 수집 시 비용 없음)
+    from core.legal_rag import search_legal_context
+
     results = search_legal_context(
         query=q,
         top_k=top_k,
@@ -11,10 +11,24 @@ Red Team #1 대응: CSS/JS 노이즈로 오염된 판례 데이터를 검증하
 
 import json
 import os
+import shutil
 import sys
-import re
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
+# 선택 의존성: orjson — 직렬화 가속 (C 확장)
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# 선택 의존성: ijson — 대형 JSON 증분 파싱 (파일 전체를 메모리에 들지 않음)
+try:
+    import ijson as _ijson
+except ImportError:
+    _ijson = None
+
 # 프로젝트 루트를 path에 추가
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
@@ -26,10 +40,61 @@ from core.legal_rag import (
 )
 
 
+def _iter_docs(file_path: str):
+    """(doc_id, doc) 증분 순회 — ijson이 있으면 O(1) 메모리로 스트리밍"""
+    if _ijson is not None:
+        with open(file_path, "rb") as f:
+            yield from _ijson.kvitems(f, "")
+    else:
+        with open(file_path, "r", encoding="utf-8") as f:
+            yield from json.load(f).items()
+
+
+def _dumps(obj) -> bytes:
+    if _orjson is not None:
+        return _orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+# 프로세스 풀 배치 크기 — 스트리밍 파싱의 메모리 상한이자 풀 제출 단위
+_VALIDATE_BATCH = 1024
+
+
+def _validate_one(item: tuple) -> tuple:
+    """(doc_id, doc) 검증 — 순수 CPU 작업이라 프로세스 풀 워커에서 실행 가능"""
+    doc_id, doc = item
+    text = doc.get("text", "")
+    md = doc.get("metadata") or {}
+
+    # 싼 검사부터 순서대로: O(1) 길이 → 노이즈 정규식 → 문서 검증
+    is_valid = (
+        len(text) >= 10
+        and not _is_noise_text(text)
+        and validate_legal_document(text, md.get("source_type", "precedent"))
+    )
+    return doc_id, doc, is_valid
+
+
+def _batched(iterable, size: int):
+    """이터러블을 size 단위 리스트로 분할 (마지막 배치는 잔여분)"""
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
 def clean_precedents(apply: bool = False) -> dict:
     """
     precedents.json에서 노이즈 데이터를 제거
 
+    전체를 dict로 적재하지 않고 문서 단위로 스트리밍 검증하며,
+    --apply 시 유효 문서를 임시 파일에 증분 기록한 뒤 원자적으로
+    교체합니다(백업은 원본 바이트 복사).
+
     Args:
         apply: True면 실제로 파일을 수정, False면 검증만 수행
 
@@ -42,37 +107,77 @@ def clean_precedents(apply: bool = False) -> dict:
         print(f"[!] 파일이 존재하지 않습니다: {file_path}")
         return {"status": "file_not_found"}
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        docs = json.load(f)
-
-    total = len(docs)
-    valid_docs = {}
-    removed_docs = {}
-
-    for doc_id, doc in docs.items():
-        text = doc.get("text", "")
-        source_type = doc.get("metadata", {}).get("source_type", "precedent")
-
-        is_valid = True
-
-        # 1. 노이즈 패턴 검사
-        if _is_noise_text(text):
-            is_valid = False
-
-        # 2. 법률 문서 유효성 검증
-        if is_valid and not validate_legal_document(text, source_type):
-            is_valid = False
-
-        if is_valid:
-            valid_docs[doc_id] = doc
-        else:
-            removed_docs[doc_id] = {
-                "case_name": doc.get("metadata", {}).get("case_name", "?"),
-                "text_preview": text[:100] if text else "(empty)",
-            }
-
-    removed_count = len(removed_docs)
-    valid_count = len(valid_docs)
+    tmp = None
+    if apply:
+        # 백업은 재직렬화 대신 원본 파일 복사 (더 빠르고 바이트 동일)
+        backup_path = file_path.replace(
+            ".json", f"_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        )
+        shutil.copyfile(file_path, backup_path)
+        print(f"[*] 백업 저장: {backup_path}")
+
+        tmp = tempfile.NamedTemporaryFile(
+            "wb", dir=os.path.dirname(file_path), suffix=".tmp", delete=False
+        )
+
+    total = 0
+    valid_count = 0
+    removed_count = 0
+    removed_preview = []  # 출력용 상위 20건만 보관 (제거 건수는 별도 집계)
+
+    # 검증(정규식)은 순수 CPU이고 문서 간 독립 — 프로세스 풀로 분산하되,
+    # 스트림을 배치로 잘라 제출해 메모리는 배치 크기로 유지
+    try:
+        pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    except Exception as e:
+        print(f"[!] 프로세스 풀 기동 실패 — 순차 검증으로 폴백: {e}")
+        pool = None
+
+    try:
+        first = True
+        if tmp is not None:
+            tmp.write(b"{")
+
+        for batch in _batched(_iter_docs(file_path), _VALIDATE_BATCH):
+            if pool is not None and len(batch) >= 64:
+                results = pool.map(_validate_one, batch, chunksize=64)
+            else:
+                results = map(_validate_one, batch)
+
+            for doc_id, doc, is_valid in results:
+                total += 1
+                if is_valid:
+                    valid_count += 1
+                    if tmp is not None:
+                        if not first:
+                            tmp.write(b",")
+                        tmp.write(_dumps(doc_id) + b":" + _dumps(doc))
+                        first = False
+                else:
+                    removed_count += 1
+                    if len(removed_preview) < 20:
+                        text = doc.get("text", "")
+                        md = doc.get("metadata") or {}
+                        removed_preview.append(
+                            {
+                                "case_name": md.get("case_name", "?"),
+                                "text_preview": text[:100] if text else "(empty)",
+                            }
+                        )
+
+        if tmp is not None:
+            tmp.write(b"}")
+            tmp.flush()
+            os.fsync(tmp.fileno())
+            tmp.close()
+    except BaseException:
+        if tmp is not None:
+            tmp.close()
+            os.unlink(tmp.name)
+        raise
+    finally:
+        if pool is not None:
+            pool.shutdown()
 
     print(f"\n{'='*60}")
     print(f"판례 데이터 정화 결과")
@@ -82,24 +187,17 @@ def clean_precedents(apply: bool = False) -> dict:
     print(f"  제거 대상: {removed_count}건")
     print(f"{'='*60}")
 
-    if removed_docs:
+    if removed_count:
         print(f"\n제거 대상 문서:")
-        for doc_id, info in list(removed_docs.items())[:20]:
+        for info in removed_preview:
             print(f"  - [{info['case_name']}] {info['text_preview'][:60]}...")
-        if len(removed_docs) > 20:
-            print(f"  ... 외 {len(removed_docs) - 20}건")
+        if removed_count > len(removed_preview):
+            print(f"  ... 외 {removed_count - len(removed_preview)}건")
 
     if apply:
-        # 백업 생성
-        backup_path = file_path.replace(".json", f"_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
-        with open(backup_path, "w", encoding="utf-8") as f:
-            json.dump(docs, f, ensure_ascii=False, indent=2)
-        print(f"\n[*] 백업 저장: {backup_path}")
-
-        # 정화된 데이터 저장
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(valid_docs, f, ensure_ascii=False, indent=2)
-        print(f"[*] 정화 완료: {file_path} ({valid_count}건 유지)")
+        # 정화된 데이터로 원자적 교체 (임시 파일에 이미 증분 기록됨)
+        os.replace(tmp.name, file_path)
+        print(f"\n[*] 정화 완료: {file_path} ({valid_count}건 유지)")
     else:
         print(f"\n[!] dry-run 모드: 실제 변경 없음")
         print(f"    실제 적용하려면: python clean_precedents.py --apply")
@@ -27,6 +27,12 @@ from datetime import datetime, timezone
 from typing import Optional
 from contextlib import contextmanager
 
+# 선택 의존성: orjson — 대량 적재 시 메타데이터 직렬화 가속
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
 logger = logging.getLogger("database")
 if not logger.handlers:
     _handler = logging.StreamHandler()
@@ -39,7 +45,11 @@ if not logger.handlers:
 # ─────────────────────────────────────────────────────────────
 
 DATABASE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "database")
-DATABASE_PATH = os.path.join(DATABASE_DIR, "safelaunch.db")
+# SLDB_PATH 환경변수로 DB 파일 경로를 덮어쓸 수 있음 — 병렬 테스트
+# (pytest-xdist)에서 워커별 독립 DB를 쓰기 위한 훅
+DATABASE_PATH = os.environ.get("SLDB_PATH") or os.path.join(
+    DATABASE_DIR, "safelaunch.db"
+)
 SCHEMA_PATH = os.path.join(DATABASE_DIR, "schema.sql")
 
 
@@ -62,10 +72,23 @@ class DatabaseManager:
 
     def __init__(self, db_path: str = DATABASE_PATH):
         self.db_path = db_path
+        # SQLite URI(예: file:...?mode=memory&cache=shared) 지원 —
+        # 테스트에서 fsync 없는 인메모리 DB를 쓰기 위한 경로
+        self._uri = db_path.startswith("file:")
         self._ensure_database()
 
     def _ensure_database(self) -> None:
         """데이터베이스 파일 및 스키마 존재 확인, 없으면 생성"""
+        if self._uri:
+            # URI 경로는 파일 검사가 무의미 — 테이블 유무로만 판단
+            with self.connection() as conn:
+                table_count = conn.execute(
+                    "SELECT count(*) FROM sqlite_master WHERE type='table'"
+                ).fetchone()[0]
+            if table_count < 5:
+                self._init_schema()
+            return
+
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
 
         if not os.path.exists(self.db_path) or os.path.getsize(self.db_path) == 0:
@@ -80,6 +103,23 @@ class DatabaseManager:
                 if table_count < 5:
                     logger.info("테이블이 부족합니다. 스키마를 재초기화합니다.")
                     self._init_schema()
+                else:
+                    self._migrate_schema(conn)
+
+    def _migrate_schema(self, conn: sqlite3.Connection) -> None:
+        """기존 DB에 누락된 컬럼·인덱스를 추가 (executescript는 IF NOT EXISTS만 처리)"""
+        columns = {
+            row["name"]
+            for row in conn.execute("PRAGMA table_info(document_chunks)")
+        }
+        for col in ("meta_store", "meta_section", "meta_case_name"):
+            if col not in columns:
+                conn.execute(f"ALTER TABLE document_chunks ADD COLUMN {col} TEXT")
+                logger.info("document_chunks.%s 컬럼 추가", col)
+        conn.execute(
+            """CREATE INDEX IF NOT EXISTS idx_chunks_store_section
+               ON document_chunks(meta_store, meta_section) WHERE meta_store IS NOT NULL"""
+        )
 
     def _init_schema(self) -> None:
         """schema.sql 파일을 실행하여 테이블 생성"""
@@ -99,7 +139,7 @@ class DatabaseManager:
     @contextmanager
     def connection(self):
         """SQLite 연결 컨텍스트 매니저"""
-        conn = sqlite3.connect(self.db_path)
+        conn = sqlite3.connect(self.db_path, uri=self._uri)
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA journal_mode=WAL")
         conn.execute("PRAGMA foreign_keys=ON")
@@ -220,6 +260,53 @@ class DatabaseManager:
             "regions": regions or [],
         }
 
+    def create_projects_many(self, user_id: str, projects: list[dict]) -> list[dict]:
+        """
+        프로젝트 일괄 생성 — 단일 트랜잭션 + executemany
+
+        create_project를 반복 호출하면 건당 연결·커밋(fsync)이 발생하므로
+        대량 생성 경로에서는 배치 전체를 1회 커밋합니다.
+
+        Args:
+            projects: create_project와 동일한 키(name 필수, description/
+                      app_category/platforms/regions/features 선택)의 dict 목록
+
+        Returns:
+            생성된 프로젝트 요약 dict 목록 (create_project 반환 형식)
+        """
+        now = _now()
+        created = []
+        rows = []
+        for spec in projects:
+            project_id = _new_id()
+            rows.append((
+                project_id, user_id, spec["name"],
+                spec.get("description"), spec.get("app_category"),
+                json.dumps(spec.get("platforms") or [], ensure_ascii=False),
+                json.dumps(spec.get("regions") or [], ensure_ascii=False),
+                json.dumps(spec.get("features") or {}, ensure_ascii=False),
+                now, now,
+            ))
+            created.append({
+                "id": project_id,
+                "name": spec["name"],
+                "user_id": user_id,
+                "platforms": spec.get("platforms") or [],
+                "regions": spec.get("regions") or [],
+            })
+
+        if rows:
+            with self.connection() as conn:
+                conn.executemany(
+                    """INSERT INTO projects
+                       (id, user_id, name, description, app_category,
+                        platforms, regions, features, created_at, updated_at)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                    rows,
+                )
+            logger.info(f"프로젝트 일괄 생성: {len(rows)}건 (user={user_id})")
+        return created
+
     def get_project(self, project_id: str) -> Optional[dict]:
         """프로젝트 상세 조회 (JSON 파싱 포함)"""
         with self.connection() as conn:
@@ -478,39 +565,83 @@ class DatabaseManager:
         **kwargs,
     ) -> str:
         """스토어 정책 추가/갱신"""
-        now = _now()
-
         with self.connection() as conn:
-            existing = conn.execute(
-                "SELECT id FROM store_policies WHERE store=? AND section=? AND COALESCE(subsection,'')=?",
-                (store, section, subsection or ""),
-            ).fetchone()
+            return self._upsert_store_policy(
+                conn, store, section, subsection, content, **kwargs
+            )
 
-            if existing:
-                db_id = existing["id"]
-                conn.execute(
-                    """UPDATE store_policies SET content=?,
-                       effective_date=COALESCE(?, effective_date), updated_at=?
-                       WHERE id=?""",
-                    (content, kwargs.get("effective_date"), now, db_id),
-                )
-                return db_id
-            else:
-                db_id = _new_id()
-                conn.execute(
-                    """INSERT INTO store_policies
-                       (id, store, policy_name, section, subsection,
-                        content, effective_date, created_at, updated_at)
-                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                    (
-                        db_id, store,
-                        kwargs.get("policy_name", f"{store.title()} Policy"),
-                        section, subsection, content,
-                        kwargs.get("effective_date"),
-                        now, now,
-                    ),
+    def upsert_store_policies_many(self, policies: list[dict]) -> list[str]:
+        """
+        스토어 정책 일괄 추가/갱신 — 연결·커밋 1회로 전체 배치 처리
+
+        Args:
+            policies: [{"store": str, "section": str, "subsection": str,
+                        "content": str, ...upsert_store_policy kwargs}, ...]
+
+        Returns:
+            입력 순서대로의 정책 DB ID 리스트
+        """
+        if not policies:
+            return []
+        with self.connection() as conn:
+            return [
+                self._upsert_store_policy(
+                    conn,
+                    p["store"],
+                    p["section"],
+                    p.get("subsection", ""),
+                    p["content"],
+                    **{
+                        k: v
+                        for k, v in p.items()
+                        if k not in ("store", "section", "subsection", "content")
+                    },
                 )
-                return db_id
+                for p in policies
+            ]
+
+    def _upsert_store_policy(
+        self,
+        conn,
+        store: str,
+        section: str,
+        subsection: str,
+        content: str,
+        **kwargs,
+    ) -> str:
+        """upsert_store_policy 본체 — 호출 측이 연결을 소유"""
+        now = _now()
+
+        existing = conn.execute(
+            "SELECT id FROM store_policies WHERE store=? AND section=? AND COALESCE(subsection,'')=?",
+            (store, section, subsection or ""),
+        ).fetchone()
+
+        if existing:
+            db_id = existing["id"]
+            conn.execute(
+                """UPDATE store_policies SET content=?,
+                   effective_date=COALESCE(?, effective_date), updated_at=?
+                   WHERE id=?""",
+                (content, kwargs.get("effective_date"), now, db_id),
+            )
+            return db_id
+        else:
+            db_id = _new_id()
+            conn.execute(
+                """INSERT INTO store_policies
+                   (id, store, policy_name, section, subsection,
+                    content, effective_date, created_at, updated_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                (
+                    db_id, store,
+                    kwargs.get("policy_name", f"{store.title()} Policy"),
+                    section, subsection, content,
+                    kwargs.get("effective_date"),
+                    now, now,
+                ),
+            )
+            return db_id
 
     # ─────────────────────────────────────────────────────────
     # C. RAG 검색
@@ -535,20 +666,80 @@ class DatabaseManager:
                 return existing["id"]
 
             chunk_id = _new_id()
+            meta = metadata or {}
             conn.execute(
                 """INSERT INTO document_chunks
                    (id, chunk_hash, source_type, source_id, chunk_index,
-                    content, content_length, metadata_json, created_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                    content, content_length, metadata_json,
+                    meta_store, meta_section, meta_case_name, created_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
                 (
                     chunk_id, chunk_hash, source_type, source_id,
                     chunk_index, content, len(content),
                     json.dumps(metadata, ensure_ascii=False) if metadata else None,
+                    meta.get("store"), meta.get("section"), meta.get("case_name"),
                     _now(),
                 ),
             )
             return chunk_id
 
+    def upsert_chunks_many(self, chunks: list[dict]) -> int:
+        """
+        문서 청크 일괄 추가 — 단일 트랜잭션 + executemany
+
+        upsert_chunk를 청크 수만큼 호출하면 연결·커밋이 청크당 1회씩
+        발생하므로, 대량 적재 경로에서는 배치 전체를 1회 커밋합니다.
+        이미 존재하는 chunk_hash는 건너뜁니다(UNIQUE + INSERT OR IGNORE).
+
+        Args:
+            chunks: [{"chunk_hash": str, "source_type": str, "source_id": str,
+                      "chunk_index": int, "content": str, "metadata": dict}, ...]
+
+        Returns:
+            실제 삽입된 행 수
+        """
+        if not chunks:
+            return 0
+
+        # 메타데이터 인코딩은 트랜잭션 밖에서 1패스로 수행
+        # (orjson이 있으면 C 확장 경로, 없으면 stdlib)
+        if _orjson is not None:
+            encode_meta = lambda m: _orjson.dumps(m).decode()  # noqa: E731
+        else:
+            encode_meta = lambda m: json.dumps(m, ensure_ascii=False)  # noqa: E731
+
+        now = _now()
+        rows = []
+        for c in chunks:
+            meta = c.get("metadata") or {}
+            rows.append(
+                (
+                    _new_id(),
+                    c["chunk_hash"],
+                    c["source_type"],
+                    c["source_id"],
+                    c.get("chunk_index", 0),
+                    c["content"],
+                    len(c["content"]),
+                    encode_meta(meta) if meta else None,
+                    meta.get("store"), meta.get("section"), meta.get("case_name"),
+                    now,
+                )
+            )
+        with self.connection() as conn:
+            # 대량 삽입 중간 산출물(인덱스 정렬 등)은 메모리에 유지
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-64000")
+            cursor = conn.executemany(
+                """INSERT OR IGNORE INTO document_chunks
+                   (id, chunk_hash, source_type, source_id, chunk_index,
+                    content, content_length, metadata_json,
+                    meta_store, meta_section, meta_case_name, created_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                rows,
+            )
+            return cursor.rowcount
+
     def log_search(
         self,
         query_text: str,
@@ -8,16 +8,50 @@ SafeLaunch AI 프로젝트용 Python 버전
 import requests
 import xmltodict
 import json
-import time
 import logging
-from typing import Optional, Literal
+import time
+import xml.etree.ElementTree as _ET
+from requests.adapters import HTTPAdapter
+from typing import Literal, Optional
 from dataclasses import dataclass, field
+from urllib3.util.retry import Retry
+
+# 선택 의존성: diskcache — 응답 캐시를 디스크에 영속 (실행 간 공유)
+try:
+    import diskcache as _diskcache
+except ImportError:
+    _diskcache = None
 
 LAW_API_BASE_URL = "https://www.law.go.kr"
 
+# GET 호출은 멱등이므로 동일 질의 응답을 하루 동안 캐시
+# (반복 실행되는 test_api.py·인제스트 스크립트의 네트워크 왕복 제거)
+_CACHE_TTL = 86400
+_disk_cache = _diskcache.Cache(".law_api_cache") if _diskcache is not None else None
+_mem_cache: dict = {}  # diskcache 부재 시 프로세스 내 TTL 폴백
+
 # Red Team #9: 재시도 설정
 MAX_RETRIES = 3
-RETRY_DELAY_BASE = 2  # 초 (지수 백오프: 2, 4, 8)
+
+# 공유 세션 — 호출마다 TCP+TLS 핸드셰이크를 새로 하지 않도록 커넥션 풀을
+# 재사용하고, 재시도는 urllib3 Retry에 위임 (지수 백오프 + 지터,
+# Retry-After 헤더 존중, 429/5xx 한정 — 수동 재시도 루프 대체)
+_SESSION = requests.Session()
+_SESSION.mount(
+    LAW_API_BASE_URL,
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=MAX_RETRIES,
+            backoff_factor=1.0,
+            backoff_jitter=1.0,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"],
+            respect_retry_after_header=True,
+        ),
+    ),
+)
 
 logger = logging.getLogger("law_api")
 if not logger.handlers:
@@ -55,10 +89,65 @@ class LawApiParams:
         return params
 
 
+def _cache_get(key):
+    if _disk_cache is not None:
+        return _disk_cache.get(key)
+    entry = _mem_cache.get(key)
+    if entry is not None:
+        if entry[0] > time.monotonic():
+            return entry[1]
+        del _mem_cache[key]
+    return None
+
+
+def _cache_set(key, value):
+    if _disk_cache is not None:
+        _disk_cache.set(key, value, expire=_CACHE_TTL)
+    else:
+        _mem_cache[key] = (time.monotonic() + _CACHE_TTL, value)
+
+
+def _parse_search_xml(content: bytes) -> Optional[dict]:
+    """
+    lawSearch.do 검색 응답 전용 고속 파서
+
+    xmltodict는 요소마다 파이썬 콜백을 타서 느리다. 검색 응답은
+    루트 스칼라 + 반복 항목(law/prec)의 2단 평탄 구조라 ElementTree
+    (C 구현)로 동일한 dict 형태를 만들 수 있다. 예상 밖 중첩이
+    보이면 None을 반환해 xmltodict 경로로 폴백한다.
+    """
+    try:
+        root = _ET.fromstring(content)
+    except _ET.ParseError:
+        return None
+
+    out: dict = {}
+    items = []
+    item_tag = None
+    for child in root:
+        if len(child):  # 반복 항목 (law / prec)
+            entry = {}
+            for field_el in child:
+                if len(field_el):
+                    return None  # 항목 내부 중첩 — 일반 파서로 폴백
+                entry[field_el.tag] = field_el.text
+            items.append(entry)
+            item_tag = child.tag
+        else:
+            out[child.tag] = child.text
+    if item_tag is not None:
+        # xmltodict와 동일하게 단일 항목은 dict, 복수는 list
+        out[item_tag] = items if len(items) > 1 else items[0]
+    return {root.tag: out}
+
+
 def law_api_call(url_path: str, params: LawApiParams, timeout: int = 30) -> dict:
     """
     법제처 API 요청 (Red Team #9: 재시도 + 지수 백오프)
 
+    재시도는 _SESSION에 장착된 urllib3 Retry가 수행하고,
+    구조화 응답(XML/JSON)은 (경로, 파라미터) 키로 TTL 캐시됩니다.
+
     Args:
         url_path: API URL 경로 (예: "/DRF/lawSearch.do")
         params: LawApiParams 객체
@@ -68,39 +157,47 @@ def law_api_call(url_path: str, params: LawApiParams, timeout: int = 30) -> dict
         dict: 파싱된 응답 (XML→dict 또는 JSON→dict)
 
     Raises:
-        requests.exceptions.RequestException: MAX_RETRIES 초과 시
+        requests.exceptions.RequestException: 재시도 소진 시
     """
+    cache_key = None
+    if params.type in ("XML", "JSON"):
+        cache_key = (
+            url_path,
+            tuple(sorted((k, str(v)) for k, v in params.to_dict().items())),
+        )
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return cached
+
     url = LAW_API_BASE_URL + url_path
-    last_error: Optional[Exception] = None
-
-    for attempt in range(1, MAX_RETRIES + 1):
-        try:
-            response = requests.get(url, params=params.to_dict(), timeout=timeout)
-            response.raise_for_status()
-
-            if params.type == "XML":
-                return xmltodict.parse(response.content)
-            elif params.type == "JSON":
-                return response.json()
-            else:
-                return {"html": response.text}
-
-        except requests.exceptions.RequestException as e:
-            last_error = e
-            if attempt < MAX_RETRIES:
-                delay = RETRY_DELAY_BASE ** attempt
-                logger.warning(
-                    f"API 요청 실패 (시도 {attempt}/{MAX_RETRIES}): {e} "
-                    f"→ {delay}초 후 재시도"
-                )
-                time.sleep(delay)
-            else:
-                logger.error(
-                    f"API 요청 최종 실패 ({MAX_RETRIES}회 시도): "
-                    f"url={url_path}, params={params.extra_params}, error={e}"
-                )
-
-    raise last_error  # type: ignore[misc]
+    try:
+        response = _SESSION.get(url, params=params.to_dict(), timeout=timeout)
+        response.raise_for_status()
+
+        if params.type == "XML":
+            result = None
+            if url_path.endswith("lawSearch.do"):
+                # 검색 응답은 평탄 스키마 — ElementTree 고속 경로 우선
+                result = _parse_search_xml(response.content)
+            if result is None:
+                # 본문 조회(lawService.do)는 소비자가 전체 트리를 순회하므로
+                # 일반 파서 유지
+                result = xmltodict.parse(response.content)
+        elif params.type == "JSON":
+            result = response.json()
+        else:
+            return {"html": response.text}
+
+        if cache_key is not None:
+            _cache_set(cache_key, result)
+        return result
+
+    except requests.exceptions.RequestException as e:
+        logger.error(
+            f"API 요청 최종 실패 ({MAX_RETRIES}회 재시도 포함): "
+            f"url={url_path}, params={params.extra_params}, error={e}"
+        )
+        raise
 
 
 # ─────────────────────────────────────────────────────────────
@@ -18,11 +18,14 @@ import os
 import re
 import hashlib
 import logging
+import threading
 import numpy as np
-from typing import Optional
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Iterable, Optional
 from datetime import datetime, timezone
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfVectorizer
+from sklearn.preprocessing import normalize
 
 from core.law_api import (
     search_laws,
@@ -31,6 +34,12 @@ from core.law_api import (
     get_precedent_detail,
 )
 
+# 선택 의존성: orjson — Rust 구현 JSON 직렬화 (stdlib 대비 수 배 빠름)
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
 # DB 연동 (SQLite — database.py와 이중 적재)
 try:
     from core.database import db as _db
@@ -92,6 +101,158 @@ LEGAL_KEYWORDS_PRECEDENT = [
 ]
 LEGAL_KEYWORDS_POLICY = ["앱", "정책", "가이드", "심사", "콘텐츠", "데이터", "사용자"]
 
+_KEYWORD_MAP = {
+    "law": LEGAL_KEYWORDS_LAW,
+    "precedent": LEGAL_KEYWORDS_PRECEDENT,
+    "store_policy": LEGAL_KEYWORDS_POLICY,
+}
+
+# 선택 의존성: pyahocorasick — 키워드별 substring 검색 대신 단일 선형 스캔.
+# 소스 타입별 오토마톤을 모듈 로드 시 1회 구성한다.
+try:
+    import ahocorasick as _ahocorasick
+
+    def _build_kw_automaton(keywords: list[str]):
+        automaton = _ahocorasick.Automaton()
+        for i, kw in enumerate(keywords):
+            automaton.add_word(kw, i)
+        automaton.make_automaton()
+        return automaton
+
+    _KW_AUTOMATA = {k: _build_kw_automaton(v) for k, v in _KEYWORD_MAP.items()}
+except ImportError:
+    _KW_AUTOMATA = {}
+
+
+def _count_keyword_hits(text: str, source_type: str) -> int:
+    """텍스트에 포함된 검증 키워드 수를 집계 (임계치 2에 도달하면 즉시 반환)"""
+    automaton = _KW_AUTOMATA.get(source_type)
+    if automaton is not None:
+        seen: set[int] = set()
+        for _, kw_idx in automaton.iter(text):
+            seen.add(kw_idx)
+            if len(seen) >= 2:
+                return 2
+        return len(seen)
+
+    hits = 0
+    for kw in _KEYWORD_MAP.get(source_type, LEGAL_KEYWORDS_LAW):
+        if kw in text:
+            hits += 1
+            if hits >= 2:
+                return hits
+    return hits
+
+# 조문 경계(제N조) 분할 패턴 — 문서마다 재컴파일하지 않도록 모듈 로드 시 1회 컴파일
+_ARTICLE_SPLIT_RX = re.compile(r"(?=제\d+조[\s(])")
+
+# 판례 섹션 헤더 — 분할 패턴과 멤버십 검사를 모듈 로드 시 1회 구성
+_PREC_SECTION_HEADERS = (
+    "판시사항", "판결요지", "참조조문", "참조판례", "판례내용", "이유", "주문", "청구취지",
+)
+_PREC_SECTION_HEADER_SET = frozenset(_PREC_SECTION_HEADERS)
+_PREC_SPLIT_RX = re.compile(r"(?=\[(" + "|".join(_PREC_SECTION_HEADERS) + r")\])")
+
+# 상세 조회 API 동시 호출 수 (순차 호출 시 네트워크 지연이 문서 수만큼 누적됨)
+_FETCH_WORKERS = 16
+
+# 이 건수 미만이면 프로세스 풀 기동 비용이 병렬화 이득보다 크므로 순차 처리
+_CPU_POOL_MIN_ITEMS = 8
+
+# 하이브리드 점수 가중치 (단어 60% + 문자 40%)
+_WORD_WEIGHT = 0.6
+_CHAR_WEIGHT = 0.4
+
+# 문자 n-gram 해싱 벡터라이저 — 상태가 없어 프로세스당 1개를 공유
+_CHAR_HASHER = HashingVectorizer(
+    analyzer="char_wb",
+    ngram_range=(2, 4),
+    n_features=2**15,
+    alternate_sign=False,
+    norm="l2",
+)
+
+
+def _csc_query_scores(csc_matrix, query_vec, inv_scale=None) -> np.ndarray:
+    """
+    쿼리 희소 벡터의 비영 항(term) 열만 순회하며 내적 점수 누적
+
+    문서 행렬을 CSC로 두면 쿼리에 등장한 소수의 항에 해당하는
+    열 슬라이스만 읽으므로, 전체 행렬 곱 대비 접근 범위가
+    O(쿼리 항 수 × 해당 포스팅 길이)로 줄어듭니다.
+
+    inv_scale이 주어지면 행렬 데이터를 행별 int8 양자화된 값으로 보고
+    누적 시점에 복원 계수를 곱해 float 점수로 되돌립니다.
+    """
+    scores = np.zeros(csc_matrix.shape[0])
+    indptr = csc_matrix.indptr
+    indices = csc_matrix.indices
+    data = csc_matrix.data
+    for t, w in zip(query_vec.indices, query_vec.data):
+        start, end = indptr[t], indptr[t + 1]
+        if start != end:
+            rows = indices[start:end]
+            if inv_scale is not None:
+                scores[rows] += w * (data[start:end] * inv_scale[rows])
+            else:
+                scores[rows] += w * data[start:end]
+    return scores
+
+
+def _fuse_and_topk_numpy(
+    word_sim: np.ndarray, char_sim: np.ndarray, k: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """하이브리드 점수 합산 + 상위 k 선별 (argpartition 기반 폴백 구현)"""
+    scores = word_sim * _WORD_WEIGHT + char_sim * _CHAR_WEIGHT
+    n = scores.shape[0]
+    k = min(k, n)
+    if k <= 0:
+        return np.empty(0, dtype=np.int64), np.empty(0)
+    idx = np.argpartition(-scores, k - 1)[:k]
+    idx = idx[np.argsort(scores[idx])[::-1]]
+    return idx, scores[idx]
+
+
+try:
+    import numba as _numba
+
+    @_numba.njit(cache=True, fastmath=True)
+    def _fuse_and_topk(word_sim, char_sim, k):  # pragma: no cover - JIT 코드
+        """점수 합산과 부분 top-k 선별을 단일 루프로 융합 (JIT 컴파일)"""
+        n = word_sim.shape[0]
+        if k > n:
+            k = n
+        top_idx = np.full(k, -1, np.int64)
+        top_scores = np.full(k, -1.0, np.float64)
+        for i in range(n):
+            s = word_sim[i] * 0.6 + char_sim[i] * 0.4
+            if s > top_scores[k - 1]:
+                j = k - 1
+                while j > 0 and top_scores[j - 1] < s:
+                    top_scores[j] = top_scores[j - 1]
+                    top_idx[j] = top_idx[j - 1]
+                    j -= 1
+                top_scores[j] = s
+                top_idx[j] = i
+        return top_idx, top_scores
+except ImportError:
+    _fuse_and_topk = _fuse_and_topk_numpy
+
+# 선택 의존성: sparse_dot_topn — 멀티스레드 희소 행렬곱 + top-k 융합 커널.
+# 설치되어 있으면 대형 컬렉션 검색에서 행렬별 상위 후보만 선별하는
+# 고속 경로를 사용하고, 없으면 기존 CSC 누적 커널로 동작한다.
+try:
+    from sparse_dot_topn import sp_matmul_topn as _sp_matmul_topn  # 1.x
+
+    def _cossim_topn(a, b, ntop, n_jobs=-1):
+        threads = os.cpu_count() if n_jobs == -1 else max(n_jobs, 1)
+        return _sp_matmul_topn(a, b, top_n=ntop, n_threads=threads, sort=True)
+except ImportError:
+    try:
+        from sparse_dot_topn import awesome_cossim_topn as _cossim_topn  # 0.3.x
+    except ImportError:
+        _cossim_topn = None
+
 
 # ─────────────────────────────────────────────────────────────
 # Step 1: 벡터 스토어 (JSON 기반 영속 저장)
@@ -102,7 +263,7 @@ class VectorStore:
     TF-IDF 기반 벡터 스토어
 
     - database/<collection>.json 파일에 문서·메타데이터를 저장
-    - 검색 시 TF-IDF 벡터라이저를 즉시 생성하여 코사인 유사도 계산
+    - TF-IDF 인덱스는 문서 변경 후 첫 검색 시 1회 구축하여 캐시
     - upsert로 중복 방지 (문서 ID 기반)
     """
 
@@ -110,23 +271,160 @@ class VectorStore:
         self.name = name
         self.db_path = db_path
         self._file_path = os.path.join(db_path, f"{name}.json")
-        self._docs: dict[str, dict] = {}  # id → {"text", "metadata"}
+        # 문서 저장소 — AoS(문서별 dict) 대신 SoA(컬럼 단위 리스트)로 유지.
+        # 문서마다 dict 헤더·중복 키 문자열을 할당하지 않아 힙 사용량이 줄고,
+        # 인덱스 재구축 시 텍스트 컬럼을 그대로 넘길 수 있다.
+        self._ids: list[str] = []
+        self._texts: list[str] = []
+        self._meta_cols: dict[str, list] = {}  # 메타데이터 키 → 값 컬럼 (결측=None)
+        self._id_pos: dict[str, int] = {}  # id → 행 위치 (중복 방지/덮어쓰기용)
+        # TF-IDF 인덱스 캐시 — upsert/clear 시 무효화, query 시 지연 재구축
+        self._doc_ids: list[str] = []
+        self._char_vectorizer: Optional[TfidfVectorizer] = None
+        self._word_vectorizer: Optional[TfidfVectorizer] = None
+        self._char_matrix = None
+        self._word_matrix = None
+        self._char_inv_scale = None
+        self._index_dirty = True
+        # 디스크 직렬화 필요 여부 — 내용이 실제로 바뀐 경우에만 True
+        self._docs_dirty = False
         self._load()
+        if self._ids:
+            self._load_index()
+
+    def _set_doc(self, doc_id: str, text: str, metadata: dict) -> bool:
+        """문서 1건을 SoA 컬럼에 추가/덮어쓰기 (내용 변경 여부 반환)"""
+        pos = self._id_pos.get(doc_id)
+        if (
+            pos is not None
+            and self._texts[pos] == text
+            and self._metadata_at(pos) == metadata
+        ):
+            # 재적재 시 동일 내용이면 쓰기·재직렬화·인덱스 무효화를 모두 생략
+            return False
+        if pos is None:
+            pos = len(self._ids)
+            self._ids.append(doc_id)
+            self._texts.append("")
+            for col in self._meta_cols.values():
+                col.append(None)
+            self._id_pos[doc_id] = pos
+        self._texts[pos] = text
+        for key, col in self._meta_cols.items():
+            col[pos] = metadata.get(key)
+        for key, value in metadata.items():
+            if key not in self._meta_cols:
+                col = [None] * len(self._ids)
+                col[pos] = value
+                self._meta_cols[key] = col
+        self._docs_dirty = True
+        return True
+
+    def _metadata_at(self, pos: int) -> dict:
+        """행 위치의 메타데이터를 dict로 복원 (결측 컬럼 제외)"""
+        return {
+            key: col[pos]
+            for key, col in self._meta_cols.items()
+            if col[pos] is not None
+        }
 
     def _load(self) -> None:
         """JSON 파일에서 기존 데이터 로드"""
         if os.path.exists(self._file_path):
             try:
-                with open(self._file_path, "r", encoding="utf-8") as f:
-                    self._docs = json.load(f)
-            except (json.JSONDecodeError, OSError):
-                self._docs = {}
+                with open(self._file_path, "rb") as f:
+                    raw = f.read()
+                data = _orjson.loads(raw) if _orjson is not None else json.loads(raw)
+            except (ValueError, OSError):
+                return
+            for doc_id, entry in data.items():
+                self._set_doc(doc_id, entry["text"], entry["metadata"])
 
     def _save(self) -> None:
-        """현재 데이터를 JSON 파일에 저장"""
+        """현재 데이터를 JSON 파일에 저장 (디스크 포맷은 기존 id→문서 dict 유지)"""
         os.makedirs(self.db_path, exist_ok=True)
-        with open(self._file_path, "w", encoding="utf-8") as f:
-            json.dump(self._docs, f, ensure_ascii=False, indent=2)
+        payload = {
+            doc_id: {"text": self._texts[i], "metadata": self._metadata_at(i)}
+            for i, doc_id in enumerate(self._ids)
+        }
+        if _orjson is not None:
+            with open(self._file_path, "wb") as f:
+                f.write(_orjson.dumps(payload, option=_orjson.OPT_INDENT_2))
+        else:
+            with open(self._file_path, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False, indent=2)
+        self._docs_dirty = False
+
+    # ── 인덱스 영속화 (프로세스 재시작 시 전체 재적합 회피) ──
+
+    def _index_paths(self) -> tuple[str, str, str]:
+        base = os.path.join(self.db_path, self.name)
+        return base + "_char.npz", base + "_word.npz", base + "_index.pkl"
+
+    def _save_index(self) -> None:
+        """fit된 행렬·벡터라이저를 사이드카 파일로 저장"""
+        try:
+            import pickle
+            from scipy import sparse
+
+            char_path, word_path, meta_path = self._index_paths()
+            os.makedirs(self.db_path, exist_ok=True)
+            if self._char_matrix is not None:
+                sparse.save_npz(char_path, self._char_matrix)
+            if self._word_matrix is not None:
+                sparse.save_npz(word_path, self._word_matrix)
+            with open(meta_path, "wb") as f:
+                pickle.dump(
+                    {
+                        "doc_ids": self._doc_ids,
+                        "char_vectorizer": self._char_vectorizer,
+                        "word_vectorizer": self._word_vectorizer,
+                        "char_df": getattr(self, "_char_df", None),
+                        "word_df": getattr(self, "_word_df", None),
+                        "n_samples": getattr(self, "_n_samples", 0),
+                        "fitted_samples": getattr(self, "_fitted_samples", 0),
+                    },
+                    f,
+                )
+        except Exception as e:
+            logger.warning("인덱스 사이드카 저장 실패 (무시): %s", e)
+
+    def _load_index(self) -> bool:
+        """사이드카 인덱스를 로드. 문서 집합과 일치할 때만 사용"""
+        try:
+            import pickle
+            from scipy import sparse
+
+            char_path, word_path, meta_path = self._index_paths()
+            if not os.path.exists(meta_path):
+                return False
+            with open(meta_path, "rb") as f:
+                meta = pickle.load(f)
+            if set(meta["doc_ids"]) != set(self._ids):
+                return False
+
+            self._doc_ids = meta["doc_ids"]
+            self._char_vectorizer = meta["char_vectorizer"]
+            self._word_vectorizer = meta["word_vectorizer"]
+            self._char_df = meta["char_df"]
+            self._word_df = meta["word_df"]
+            self._n_samples = meta["n_samples"]
+            self._fitted_samples = meta["fitted_samples"]
+            self._char_matrix = (
+                sparse.load_npz(char_path) if os.path.exists(char_path) else None
+            )
+            self._word_matrix = (
+                sparse.load_npz(word_path) if os.path.exists(word_path) else None
+            )
+            self._char_csc, self._char_inv_scale = self._build_char_csc()
+            self._word_csc = (
+                self._word_matrix.tocsc() if self._word_matrix is not None else None
+            )
+            self._index_dirty = False
+            return True
+        except Exception as e:
+            logger.warning("인덱스 사이드카 로드 실패 — 재구축: %s", e)
+            return False
 
     def upsert(
         self,
@@ -135,12 +433,178 @@ class VectorStore:
         metadatas: list[dict],
     ) -> None:
         """문서 추가/갱신 (ID 기반 중복 방지)"""
+        # 기존 인덱스가 유효하고 전부 신규 문서이면 증분 갱신 경로 사용
+        # (어휘가 고정되므로 최초 대량 적재 후에만 적용 — 소규모 코퍼스는 전체 재적합)
+        can_incremental = (
+            not self._index_dirty
+            and self._char_vectorizer is not None
+            and getattr(self, "_fitted_samples", 0) >= 100
+            and all(doc_id not in self._id_pos for doc_id in ids)
+        )
+        changed = False
         for doc_id, text, meta in zip(ids, documents, metadatas):
-            self._docs[doc_id] = {"text": text, "metadata": meta}
+            changed |= self._set_doc(doc_id, text, meta)
+        if not changed:
+            return
+        if can_incremental:
+            self._incremental_index_update(list(ids), list(documents))
+        else:
+            self._index_dirty = True
         self._save()
 
+    def upsert_many_deferred(
+        self,
+        ids: list[str],
+        documents: list[str],
+        metadatas: list[dict],
+    ) -> None:
+        """
+        문서 추가/갱신 (저장 지연 — 대량 적재 경로용)
+
+        upsert와 달리 JSON 파일을 즉시 다시 쓰지 않습니다.
+        적재 루프가 끝난 뒤 flush()를 한 번 호출해야 합니다.
+        """
+        changed = False
+        for doc_id, text, meta in zip(ids, documents, metadatas):
+            changed |= self._set_doc(doc_id, text, meta)
+        if changed:
+            self._index_dirty = True
+
+    def flush(self) -> None:
+        """지연된 변경 사항을 JSON 파일에 1회 기록 (변경 없으면 무시)"""
+        if self._docs_dirty:
+            self._save()
+
     def count(self) -> int:
-        return len(self._docs)
+        return len(self._ids)
+
+    def _build_char_csc(self):
+        """쿼리용 char CSC 사본과 int8 복원 계수 구성.
+
+        코사인 점수는 상대 크기만 중요하므로 행별 최대값 기준으로 데이터를
+        int8로 양자화해 가장 큰 구조물의 메모리를 1/8로 줄인다(float64 대비).
+        복원 계수(행별 float32)는 점수 누적 시점에 곱한다.
+        sparse_dot_topn 경로는 행렬을 커널에 직접 넘기므로 float를 유지한다.
+        """
+        if self._char_matrix is None:
+            return None, None
+        csc = self._char_matrix.tocsc()
+        if _cossim_topn is not None:
+            return csc, None
+        row_max = np.asarray(self._char_matrix.max(axis=1).todense()).ravel()
+        row_max[row_max <= 0] = 1.0
+        scale = 127.0 / row_max
+        csc.data = np.rint(csc.data * scale[csc.indices]).astype(np.int8)
+        return csc, (row_max / 127.0).astype(np.float32)
+
+    def _rebuild_index(self) -> None:
+        """
+        TF-IDF 인덱스 재구축 (Red Team #5 하이브리드 유지)
+
+        코퍼스 전체 fit은 문서 변경 후 첫 query에서 1회만 수행하고,
+        이후 query는 쿼리문 transform 1회 + 행렬 곱만 수행합니다.
+        """
+        self._doc_ids = list(self._ids)
+        doc_texts = self._texts
+
+        # 1) 문자 단위 벡터라이저 (한글 부분 매칭에 강점)
+        #    HashingVectorizer는 어휘 사전이 없어 fit이 불필요하고(stateless)
+        #    sublinear_tf 이중 로그 감쇠도 제거됨 — 문자 n-gram에는 충분
+        char_vectorizer = _CHAR_HASHER
+
+        # 2) 단어 단위 벡터라이저 (의미 단위 매칭에 강점)
+        word_vectorizer = TfidfVectorizer(
+            analyzer="word",
+            ngram_range=(1, 2),
+            max_features=15000,
+            sublinear_tf=True,
+        )
+
+        try:
+            # 행을 L2 정규화해 두면 코사인 유사도가 단순 내적으로 환원됨
+            self._char_matrix = normalize(
+                char_vectorizer.transform(doc_texts), norm="l2", copy=False
+            )
+            self._char_vectorizer = char_vectorizer
+        except ValueError:
+            self._char_matrix = None
+            self._char_vectorizer = None
+
+        try:
+            self._word_matrix = normalize(
+                word_vectorizer.fit_transform(doc_texts), norm="l2", copy=False
+            )
+            self._word_vectorizer = word_vectorizer
+        except ValueError:
+            self._word_matrix = None
+            self._word_vectorizer = None
+
+        # 쿼리 시 열 단위 조회용 CSC 사본 (문서=행, 항=열)
+        self._char_csc, self._char_inv_scale = self._build_char_csc()
+        self._word_csc = (
+            self._word_matrix.tocsc() if self._word_matrix is not None else None
+        )
+
+        # 증분 갱신용 DF 누적 상태 (partial_fit 방식)
+        # 문자 파이프라인은 해싱 기반(IDF 없음)이라 단어 쪽만 DF를 추적
+        self._n_samples = len(doc_texts)
+        self._fitted_samples = max(len(doc_texts), 1)
+        self._char_df = None
+        self._word_df = (
+            np.asarray((self._word_matrix != 0).sum(axis=0)).ravel().astype(np.float64)
+            if self._word_matrix is not None
+            else None
+        )
+
+        self._index_dirty = False
+        self._save_index()
+
+    def _incremental_index_update(self, new_ids: list[str], new_texts: list[str]) -> None:
+        """
+        신규 문서만 고정 어휘로 변환해 인덱스에 추가 (전체 재적합 회피)
+
+        - 어휘는 직전 전체 fit 시점에 고정
+        - 문서 빈도(DF)와 표본 수를 누적해 IDF를 지연 재계산
+        - 증분 누적으로 코퍼스가 50% 이상 커지면 다음 query에서 전체 재구축
+        """
+        try:
+            from scipy.sparse import vstack as _sp_vstack
+
+            for attr in ("_char", "_word"):
+                vectorizer = getattr(self, attr + "_vectorizer")
+                if vectorizer is None:
+                    continue
+                rows = vectorizer.transform(new_texts)
+                matrix = getattr(self, attr + "_matrix")
+                stacked = _sp_vstack([matrix, rows], format="csr")
+                setattr(self, attr + "_matrix", stacked)
+                if attr == "_char":
+                    self._char_csc, self._char_inv_scale = self._build_char_csc()
+                else:
+                    self._word_csc = stacked.tocsc()
+                df = getattr(self, attr + "_df")
+                if df is not None:
+                    df += np.asarray((rows != 0).sum(axis=0)).ravel()
+
+            self._n_samples += len(new_texts)
+            self._doc_ids.extend(new_ids)
+
+            # IDF 드리프트가 한도를 넘으면 전체 재적합 예약
+            if self._n_samples > self._fitted_samples * 1.5:
+                self._index_dirty = True
+                return
+
+            # 누적 DF 기반 IDF 갱신 (smooth_idf 공식과 동일)
+            for attr in ("_char", "_word"):
+                vectorizer = getattr(self, attr + "_vectorizer")
+                df = getattr(self, attr + "_df")
+                if vectorizer is not None and df is not None:
+                    vectorizer.idf_ = np.log((1 + self._n_samples) / (1 + df)) + 1.0
+
+            self._save_index()
+        except Exception as e:
+            logger.warning("증분 인덱스 갱신 실패 — 전체 재구축으로 폴백: %s", e)
+            self._index_dirty = True
 
     def query(
         self,
@@ -157,79 +621,210 @@ class VectorStore:
             [{"text": str, "metadata": dict, "score": float}, ...]
             score가 높을수록 유사 (0~1)
         """
-        if not self._docs:
+        if not self._ids:
             return []
 
-        doc_ids = list(self._docs.keys())
-        doc_texts = [self._docs[d]["text"] for d in doc_ids]
+        if self._index_dirty:
+            self._rebuild_index()
 
-        # 1) 문자 단위 벡터라이저 (한글 부분 매칭에 강점)
-        char_vectorizer = TfidfVectorizer(
-            analyzer="char_wb",
-            ngram_range=(2, 4),
-            max_features=15000,
-            sublinear_tf=True,
-        )
+        doc_ids = self._doc_ids
 
-        # 2) 단어 단위 벡터라이저 (의미 단위 매칭에 강점)
-        word_vectorizer = TfidfVectorizer(
-            analyzer="word",
-            ngram_range=(1, 2),
-            max_features=15000,
-            sublinear_tf=True,
-        )
+        # sparse_dot_topn이 설치된 경우: 멀티스레드 top-k 커널 고속 경로
+        if _cossim_topn is not None:
+            return self._query_topn(query_text, n_results)
 
-        try:
-            char_matrix = char_vectorizer.fit_transform(doc_texts)
-            char_query = char_vectorizer.transform([query_text])
-            char_sim = cosine_similarity(char_query, char_matrix).flatten()
-        except ValueError:
+        # 문서 행렬이 L2 정규화되어 있으므로 코사인 = 희소 내적
+        if self._char_vectorizer is not None:
+            char_query = normalize(
+                self._char_vectorizer.transform([query_text]), norm="l2", copy=False
+            )
+            char_sim = _csc_query_scores(self._char_csc, char_query, self._char_inv_scale)
+        else:
             char_sim = np.zeros(len(doc_ids))
 
-        try:
-            word_matrix = word_vectorizer.fit_transform(doc_texts)
-            word_query = word_vectorizer.transform([query_text])
-            word_sim = cosine_similarity(word_query, word_matrix).flatten()
-        except ValueError:
+        if self._word_vectorizer is not None:
+            word_query = normalize(
+                self._word_vectorizer.transform([query_text]), norm="l2", copy=False
+            )
+            word_sim = _csc_query_scores(self._word_csc, word_query)
+        else:
             word_sim = np.zeros(len(doc_ids))
 
-        # 하이브리드 점수: 단어 60% + 문자 40%
-        similarities = (word_sim * 0.6) + (char_sim * 0.4)
+        # 하이브리드 점수 합산 + 상위 n_results 선별 (융합 커널)
+        top_indices, top_scores = _fuse_and_topk(word_sim, char_sim, n_results)
+
+        results = []
+        for idx, score in zip(top_indices, top_scores):
+            score = float(score)
+            if idx < 0 or score <= 0:
+                continue
+            pos = self._id_pos[doc_ids[idx]]
+            results.append(
+                {
+                    "text": self._texts[pos],
+                    "metadata": self._metadata_at(pos),
+                    "score": round(score, 4),
+                }
+            )
+
+        return results
 
-        # 상위 n_results 인덱스 (내림차순)
-        top_indices = np.argsort(similarities)[::-1][:n_results]
+    def _query_topn(self, query_text: str, n_results: int) -> list[dict]:
+        """sparse_dot_topn 기반 고속 검색 경로.
 
+        전체 유사도 벡터를 구하는 대신 행렬별 상위 후보만 멀티스레드
+        SpMV로 뽑아 후보 합집합 위에서 가중 점수를 융합한다. ntop을
+        넉넉히 잡아(최소 50, n_results의 10배) 근사 오차를 무시 가능한
+        수준으로 유지한다.
+        """
+        ntop = min(len(self._doc_ids), max(50, n_results * 10))
+        fused: dict[int, float] = {}
+
+        for vectorizer, csc, weight in (
+            (self._word_vectorizer, self._word_csc, _WORD_WEIGHT),
+            (self._char_vectorizer, self._char_csc, _CHAR_WEIGHT),
+        ):
+            if vectorizer is None or csc is None:
+                continue
+            q = normalize(vectorizer.transform([query_text]), norm="l2", copy=False)
+            # CSC의 전치는 복사 없는 CSR 뷰 — (피처 × 문서) 행렬로 바로 사용
+            hits = _cossim_topn(q.tocsr(), csc.T, ntop=ntop, n_jobs=-1).tocoo()
+            for idx, sim in zip(hits.col, hits.data):
+                idx = int(idx)
+                fused[idx] = fused.get(idx, 0.0) + weight * float(sim)
+
+        ranked = sorted(fused.items(), key=lambda kv: kv[1], reverse=True)[:n_results]
         results = []
-        for idx in top_indices:
-            score = float(similarities[idx])
+        for idx, score in ranked:
             if score <= 0:
                 continue
-            did = doc_ids[idx]
+            pos = self._id_pos[self._doc_ids[idx]]
             results.append(
                 {
-                    "text": self._docs[did]["text"],
-                    "metadata": self._docs[did]["metadata"],
+                    "text": self._texts[pos],
+                    "metadata": self._metadata_at(pos),
                     "score": round(score, 4),
                 }
             )
-
         return results
 
+    def query_many(self, query_texts: list[str], n_results: int = 5) -> list[list[dict]]:
+        """
+        여러 쿼리를 일괄 검색 — 쿼리별 결과 리스트를 입력 순서대로 반환
+
+        벡터라이저 transform과 top-k 커널을 쿼리당 1회가 아니라 배치당
+        1회로 묶어, 테스트 스크립트처럼 쿼리 목록을 연속 실행하는
+        경로의 반복 오버헤드를 줄입니다.
+        """
+        if not query_texts:
+            return []
+        if not self._ids:
+            return [[] for _ in query_texts]
+
+        if self._index_dirty:
+            self._rebuild_index()
+
+        doc_ids = self._doc_ids
+
+        def _hit(idx: int, score: float) -> dict:
+            pos = self._id_pos[doc_ids[idx]]
+            return {
+                "text": self._texts[pos],
+                "metadata": self._metadata_at(pos),
+                "score": round(float(score), 4),
+            }
+
+        # sparse_dot_topn 경로: 쿼리 행렬 전체를 한 번의 커널 호출로 처리
+        if _cossim_topn is not None:
+            ntop = min(len(doc_ids), max(50, n_results * 10))
+            fused: list[dict[int, float]] = [{} for _ in query_texts]
+            for vectorizer, csc, weight in (
+                (self._word_vectorizer, self._word_csc, _WORD_WEIGHT),
+                (self._char_vectorizer, self._char_csc, _CHAR_WEIGHT),
+            ):
+                if vectorizer is None or csc is None:
+                    continue
+                q = normalize(
+                    vectorizer.transform(query_texts), norm="l2", copy=False
+                )
+                hits = _cossim_topn(q.tocsr(), csc.T, ntop=ntop, n_jobs=-1).tocoo()
+                for qi, idx, sim in zip(hits.row, hits.col, hits.data):
+                    scores = fused[qi]
+                    idx = int(idx)
+                    scores[idx] = scores.get(idx, 0.0) + weight * float(sim)
+
+            batched = []
+            for scores in fused:
+                ranked = sorted(scores.items(), key=lambda kv: kv[1], reverse=True)
+                batched.append(
+                    [_hit(idx, s) for idx, s in ranked[:n_results] if s > 0]
+                )
+            return batched
+
+        # 폴백 경로: transform만 일괄 수행하고 채점은 쿼리 행별로
+        char_q = (
+            normalize(self._char_vectorizer.transform(query_texts), norm="l2", copy=False)
+            if self._char_vectorizer is not None
+            else None
+        )
+        word_q = (
+            normalize(self._word_vectorizer.transform(query_texts), norm="l2", copy=False)
+            if self._word_vectorizer is not None
+            else None
+        )
+
+        batched = []
+        for qi in range(len(query_texts)):
+            char_sim = (
+                _csc_query_scores(self._char_csc, char_q[qi], self._char_inv_scale)
+                if char_q is not None
+                else np.zeros(len(doc_ids))
+            )
+            word_sim = (
+                _csc_query_scores(self._word_csc, word_q[qi])
+                if word_q is not None
+                else np.zeros(len(doc_ids))
+            )
+            top_indices, top_scores = _fuse_and_topk(word_sim, char_sim, n_results)
+            batched.append(
+                [
+                    _hit(idx, score)
+                    for idx, score in zip(top_indices, top_scores)
+                    if idx >= 0 and score > 0
+                ]
+            )
+        return batched
+
     def clear(self) -> None:
         """컬렉션 초기화"""
-        self._docs = {}
+        self._ids = []
+        self._texts = []
+        self._meta_cols = {}
+        self._id_pos = {}
+        self._index_dirty = True
+        self._docs_dirty = False
         if os.path.exists(self._file_path):
             os.remove(self._file_path)
+        for path in self._index_paths():
+            if os.path.exists(path):
+                os.remove(path)
 
 
 # 컬렉션 캐시 (싱글톤)
 _stores: dict[str, VectorStore] = {}
+_stores_lock = threading.Lock()
+
+# 스토어·DB 쓰기 구간 직렬화용 — 적재 함수를 여러 스레드에서 동시에
+# 호출해도(reingest 스크립트 등) 네트워크 조회는 겹치고 쓰기만 순차화
+_ingest_write_lock = threading.Lock()
 
 
 def get_or_create_collection(name: str) -> VectorStore:
-    """컬렉션(VectorStore) 반환 — 없으면 생성"""
+    """컬렉션(VectorStore) 반환 — 없으면 생성 (스레드 안전)"""
     if name not in _stores:
-        _stores[name] = VectorStore(name)
+        with _stores_lock:
+            if name not in _stores:
+                _stores[name] = VectorStore(name)
     return _stores[name]
 
 
@@ -241,13 +836,15 @@ def _is_noise_text(text: str) -> bool:
     """CSS/JS/HTML 노이즈 텍스트인지 판별 (Red Team #1, #4)"""
     if not text or len(text.strip()) < 10:
         return True
-    # 노이즈 패턴 매칭 횟수가 전체 문장 대비 과다하면 노이즈
-    matches = NOISE_PATTERNS.findall(text)
-    if len(matches) >= 3:
-        return True
+    # 노이즈 패턴 3회 매칭 시 즉시 판정 — findall처럼 전체 매치 리스트를
+    # 만들지 않고 finditer로 3번째 매치에서 중단
+    count = 0
+    for _ in NOISE_PATTERNS.finditer(text):
+        count += 1
+        if count >= 3:
+            return True
     # 텍스트 대비 경로 구분자(/) 비율이 높으면 노이즈
-    slash_ratio = text.count("/") / max(len(text), 1)
-    if slash_ratio > 0.05:
+    if text.count("/") > len(text) * 0.05:
         return True
     return False
 
@@ -276,35 +873,46 @@ def validate_legal_document(text: str, source_type: str) -> bool:
     if len(text.strip()) < min_len:
         return False
 
-    # 3. 소스 타입별 법률 키워드 포함 여부
-    keyword_map = {
-        "law": LEGAL_KEYWORDS_LAW,
-        "precedent": LEGAL_KEYWORDS_PRECEDENT,
-        "store_policy": LEGAL_KEYWORDS_POLICY,
-    }
-    keywords = keyword_map.get(source_type, LEGAL_KEYWORDS_LAW)
-    keyword_hits = sum(1 for kw in keywords if kw in text)
-    if keyword_hits < 2:
+    # 3. 소스 타입별 법률 키워드 포함 여부 (Aho-Corasick 단일 스캔)
+    if _count_keyword_hits(text, source_type) < 2:
         return False
 
     return True
 
 
+# HTML 정제 패턴 — 스크립트/스타일 블록, 태그, 엔티티를 한 번의 치환으로 처리
+_HTML_NOISE_RX = re.compile(
+    r"<script[^>]*>.*?</script>|<style[^>]*>.*?</style>|<[^>]+>|(&[a-zA-Z]+;)",
+    re.DOTALL | re.IGNORECASE,
+)
+_WHITESPACE_RX = re.compile(r"\s+")
+
+
 def _clean_html(text: str) -> str:
-    """HTML 태그 및 노이즈 제거"""
-    # 스크립트/스타일 블록 전체 제거
-    text = re.sub(r"<script[^>]*>.*?</script>", "", text, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r"<style[^>]*>.*?</style>", "", text, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r"<[^>]+>", "", text)
-    text = re.sub(r"&[a-zA-Z]+;", " ", text)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
+    """HTML 태그 및 노이즈 제거 (단일 패스 치환 + 공백 정리)"""
+    # 엔티티(&amp; 등)는 공백으로, 태그/블록은 제거
+    text = _HTML_NOISE_RX.sub(lambda m: " " if m.lastindex else "", text)
+    return _WHITESPACE_RX.sub(" ", text).strip()
+
+
+# 비암호화 ID용 고속 해시 — xxhash가 있으면 xxh3, 없으면 stdlib blake2b 사용
+# 128비트(32 hex)로 기존 MD5 ID와 동일한 폭을 유지해 SQLite chunk_hash
+# 컬럼 등 하위 소비처와 호환
+try:
+    import xxhash as _xxhash
+
+    def _fast_hash(raw: str) -> str:
+        return _xxhash.xxh3_128_hexdigest(raw)
+except ImportError:
+
+    def _fast_hash(raw: str) -> str:
+        return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
 
 
 def _generate_chunk_id(source_id: str, chunk_index: int) -> str:
     """청크 고유 ID 생성 (중복 적재 방지용)"""
     raw = f"{source_id}_chunk_{chunk_index}"
-    return hashlib.md5(raw.encode()).hexdigest()
+    return _fast_hash(raw)
 
 
 def chunk_law_text(
@@ -334,42 +942,79 @@ def chunk_law_text(
 
     source_id = metadata.get("source_id", "unknown")
 
+    # 순수 분할 결과는 내용 해시로 메모이즈 — 스토어 정책처럼 정적인
+    # 본문을 재적재할 때 정리·분할을 반복하지 않음 (ID·메타데이터는
+    # 호출마다 새로 구성)
+    cache_key = f"{_fast_hash(cleaned)}|{chunk_size}|{overlap}"
+    texts = _chunk_split_cache.get(cache_key)
+    if texts is None:
+        texts = _split_chunk_texts(cleaned, chunk_size, overlap)
+        _chunk_split_cache[cache_key] = texts
+        if len(_chunk_split_cache) > _CHUNK_SPLIT_CACHE_MAX:
+            _chunk_split_cache.popitem(last=False)
+    else:
+        _chunk_split_cache.move_to_end(cache_key)
+
+    chunks: list[dict] = []
+    for chunk_text in texts:
+        _append_chunk(chunks, chunk_text, metadata, source_id)
+    return chunks
+
+
+# 분할 결과 캐시 (내용 해시 → 청크 텍스트 목록), LRU 상한
+_CHUNK_SPLIT_CACHE_MAX = 2048
+_chunk_split_cache: "OrderedDict[str, list[str]]" = OrderedDict()
+
+# 판례 상세 조회 메모 (일련번호 → 응답) — 키워드 간 중복 조회 방지
+_DETAIL_CACHE_MAX = 256
+_precedent_detail_cache: "OrderedDict[str, dict]" = OrderedDict()
+_detail_cache_lock = threading.Lock()
+
+
+def _split_chunk_texts(cleaned: str, chunk_size: int, overlap: int) -> list[str]:
+    """정제된 텍스트를 조문 경계 우선으로 분할해 청크 텍스트 목록 반환"""
     # 조문 경계(제N조) 기준 분할 시도
-    segments = re.split(r"(?=제\d+조[\s(])", cleaned)
+    segments = _ARTICLE_SPLIT_RX.split(cleaned)
     segments = [s.strip() for s in segments if s.strip()]
 
     # 경계 분할 결과가 없으면 원본을 그대로 사용
     if not segments:
         segments = [cleaned]
 
-    chunks: list[dict] = []
-    current = ""
+    texts: list[str] = []
+    # 반복 문자열 연결(O(길이) 재할당) 대신 조각 리스트에 누적 후 join
+    current_parts: list[str] = []
+    current_len = 0
 
     for segment in segments:
         # 현재 버퍼 + 세그먼트가 한도 내이면 합치기
-        if len(current) + len(segment) + 1 <= chunk_size:
-            current += (" " if current else "") + segment
+        if current_len + len(segment) + 1 <= chunk_size:
+            current_parts.append(segment)
+            current_len += len(segment) + 1
             continue
 
         # 버퍼가 찼으면 청크로 확정
-        if current:
-            _append_chunk(chunks, current, metadata, source_id)
+        if current_parts:
+            texts.append(" ".join(current_parts))
 
         # 세그먼트 자체가 한도 초과이면 글자 수 기반 분할
         if len(segment) > chunk_size:
             for i in range(0, len(segment), chunk_size - overlap):
                 sub = segment[i : i + chunk_size].strip()
                 if sub:
-                    _append_chunk(chunks, sub, metadata, source_id)
-            current = ""
+                    texts.append(sub)
+            current_parts = []
+            current_len = 0
         else:
-            current = segment
+            current_parts = [segment]
+            current_len = len(segment)
 
     # 마지막 잔여 버퍼
-    if current.strip():
-        _append_chunk(chunks, current.strip(), metadata, source_id)
+    remainder = " ".join(current_parts).strip()
+    if remainder:
+        texts.append(remainder)
 
-    return chunks
+    return texts
 
 
 def _append_chunk(
@@ -417,14 +1062,13 @@ def chunk_precedent_text(
     source_id = metadata.get("source_id", "unknown")
 
     # 판례 섹션 헤더 기반 분할 (판시사항, 판결요지, 참조조문, 판례내용 등)
-    section_pattern = r"(?=\[(판시사항|판결요지|참조조문|참조판례|판례내용|이유|주문|청구취지)\])"
-    segments = re.split(section_pattern, cleaned)
+    segments = _PREC_SPLIT_RX.split(cleaned)
     # re.split with group captures: merge header + content pairs
     merged_segments: list[str] = []
     i = 0
     while i < len(segments):
         seg = segments[i].strip()
-        if seg in ("판시사항", "판결요지", "참조조문", "참조판례", "판례내용", "이유", "주문", "청구취지"):
+        if seg in _PREC_SECTION_HEADER_SET:
             # 이 헤더는 다음 세그먼트 앞에 붙여야 함
             if i + 1 < len(segments):
                 merged_segments.append(f"[{seg}] {segments[i + 1].strip()}")
@@ -442,15 +1086,18 @@ def chunk_precedent_text(
         merged_segments = [cleaned]
 
     chunks: list[dict] = []
-    current = ""
+    # 반복 문자열 연결 대신 조각 리스트에 누적 후 join
+    current_parts: list[str] = []
+    current_len = 0
 
     for segment in merged_segments:
-        if len(current) + len(segment) + 1 <= chunk_size:
-            current += (" " if current else "") + segment
+        if current_len + len(segment) + 1 <= chunk_size:
+            current_parts.append(segment)
+            current_len += len(segment) + 1
             continue
 
-        if current:
-            _append_chunk(chunks, current, metadata, source_id)
+        if current_parts:
+            _append_chunk(chunks, " ".join(current_parts), metadata, source_id)
 
         # 세그먼트가 한도 초과 시 글자 수 기반 분할
         if len(segment) > chunk_size:
@@ -458,12 +1105,15 @@ def chunk_precedent_text(
                 sub = segment[j : j + chunk_size].strip()
                 if sub:
                     _append_chunk(chunks, sub, metadata, source_id)
-            current = ""
+            current_parts = []
+            current_len = 0
         else:
-            current = segment
+            current_parts = [segment]
+            current_len = len(segment)
 
-    if current.strip():
-        _append_chunk(chunks, current.strip(), metadata, source_id)
+    remainder = " ".join(current_parts).strip()
+    if remainder:
+        _append_chunk(chunks, remainder, metadata, source_id)
 
     return chunks
 
@@ -512,6 +1162,27 @@ def _extract_law_text(detail: dict) -> str:
     return "\n".join(parts)
 
 
+# 정제 전 원문에서 바로 식별 가능한 노이즈 마커 (str.find는 C 구현으로 저비용)
+_RAW_NOISE_MARKERS = ("<style", "<script", "font-family:", "/DRF/", "resources/css", "jquery")
+
+
+def _looks_like_noise_raw(text: str) -> bool:
+    """
+    정제 전 원문 앞 2KB만 훑어 CSS/JS 노이즈를 선별 (Red Team #1, #4)
+
+    _clean_html의 정규식 다중 패스를 타기 전에 명백한 노이즈를
+    걸러내기 위한 저비용 사전 검사. 마커 2종 이상 발견 시 노이즈로 판정.
+    """
+    head = text[:2048]
+    hits = 0
+    for marker in _RAW_NOISE_MARKERS:
+        if marker in head:
+            hits += 1
+            if hits >= 2:
+                return True
+    return False
+
+
 def _extract_precedent_text(detail: dict) -> str:
     """
     판례 상세 응답에서 본문 텍스트 추출 (Red Team #1, #4 개선)
@@ -532,29 +1203,50 @@ def _extract_precedent_text(detail: dict) -> str:
     parts: list[str] = []
     field_keys = ["판시사항", "판결요지", "참조조문", "참조판례", "판례내용"]
 
-    for key in field_keys:
-        value = prec.get(key, "")
-        # dict/OrderedDict인 경우 내부 텍스트 재귀 추출
+    def _prepare_value(value: object) -> str:
+        """값 하나를 정제·노이즈 검증. 결과는 키별로 캐시해 재검사 방지"""
         if isinstance(value, dict):
-            extracted = _extract_text_recursive(value)
-            if extracted and not _is_noise_text(extracted):
-                parts.append(f"[{key}]\n{extracted}")
-        elif isinstance(value, str):
+            # 리프 단위에서 이미 정제·노이즈 필터링됨
+            return _extract_text_recursive(value)
+        if isinstance(value, str):
+            # 명백한 CSS/JS 노이즈는 정제 비용을 들이기 전에 제외
+            if _looks_like_noise_raw(value):
+                return ""
             cleaned = _clean_html(value)
-            if cleaned and len(cleaned) > 20 and not _is_noise_text(cleaned):
-                parts.append(f"[{key}]\n{cleaned}")
+            if cleaned and _is_noise_text(cleaned):
+                return ""
+            return cleaned
+        return ""
+
+    prepared: dict[str, str] = {}
+
+    for key in field_keys:
+        value = prec.get(key, "")
+        text = _prepare_value(value)
+        prepared[key] = text
+        if not text:
+            continue
+        if isinstance(value, str) and len(text) <= 20:
+            continue
+        parts.append(f"[{key}]\n{text}")
 
     # 구조화 필드 실패 시: 모든 값에서 유효 텍스트 수집
+    # (field_keys에서 이미 정제한 값은 캐시를 재사용)
     if not parts:
         for key, value in prec.items():
-            if isinstance(value, str) and len(value) > 50:
-                cleaned = _clean_html(value)
-                if cleaned and not _is_noise_text(cleaned):
-                    parts.append(cleaned)
-            elif isinstance(value, dict):
-                extracted = _extract_text_recursive(value)
-                if extracted and len(extracted) > 50 and not _is_noise_text(extracted):
-                    parts.append(extracted)
+            if isinstance(value, str):
+                if len(value) <= 50:
+                    continue
+            elif not isinstance(value, dict):
+                continue
+            text = prepared.get(key)
+            if text is None:
+                text = _prepare_value(value)
+            if not text:
+                continue
+            if isinstance(value, dict) and len(text) <= 50:
+                continue
+            parts.append(text)
 
     # HTML 응답 폴백 (노이즈 검증 강화)
     if not parts and "html" in detail:
@@ -562,38 +1254,40 @@ def _extract_precedent_text(detail: dict) -> str:
         if html_text and not _is_noise_text(html_text):
             parts.append(html_text)
 
-    result = "\n\n".join(parts)
-
-    # 최종 노이즈 검증
-    if _is_noise_text(result):
-        return ""
-
-    return result
+    # 개별 파트가 이미 노이즈 검증을 통과했으므로 합본 재검사는 불필요
+    return "\n\n".join(parts)
 
 
 def _extract_text_recursive(obj: object) -> str:
-    """dict/list 구조에서 텍스트를 재귀적으로 추출"""
-    texts: list[str] = []
+    """dict/list 구조에서 텍스트를 추출 (명시적 스택 기반 반복 탐색)
 
-    if isinstance(obj, str):
-        cleaned = _clean_html(obj)
-        if cleaned and len(cleaned) > 10 and not _is_noise_text(cleaned):
-            texts.append(cleaned)
-    elif isinstance(obj, dict):
-        # #text 키는 XML 텍스트 노드
-        if "#text" in obj:
-            val = obj["#text"]
+    깊은 XML dict에서 프레임마다 부분 리스트를 만들고 join하는 재귀 대신,
+    출력 리스트 하나에 문서 순서대로 누적하고 마지막에 한 번만 join한다.
+    """
+    out: list[str] = []
+    stack: list[object] = [obj]
+
+    while stack:
+        node = stack.pop()
+        if isinstance(node, str):
+            cleaned = _clean_html(node)
+            if cleaned and len(cleaned) > 10 and not _is_noise_text(cleaned):
+                out.append(cleaned)
+        elif isinstance(node, dict):
+            # #text 키는 XML 텍스트 노드 — 여기서 처리했으므로 다시 push하지 않음
+            val = node.get("#text")
             if isinstance(val, str):
                 cleaned = _clean_html(val)
                 if cleaned and not _is_noise_text(cleaned):
-                    texts.append(cleaned)
-        for v in obj.values():
-            texts.append(_extract_text_recursive(v))
-    elif isinstance(obj, list):
-        for item in obj:
-            texts.append(_extract_text_recursive(item))
+                    out.append(cleaned)
+            # LIFO 스택이므로 역순으로 push해야 원래 순회 순서 유지
+            stack.extend(
+                v for k, v in reversed(list(node.items())) if k != "#text"
+            )
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
 
-    return " ".join(t for t in texts if t.strip())
+    return " ".join(out)
 
 
 def _extract_text_from_html_dict(html_dict: dict) -> str:
@@ -603,30 +1297,146 @@ def _extract_text_from_html_dict(html_dict: dict) -> str:
     노이즈 필터링을 강화하여 CSS/JS 경로가 저장되지 않도록 합니다.
     """
     texts: list[str] = []
+    stack: list[object] = [html_dict]
 
-    def _walk(obj: object) -> None:
-        if isinstance(obj, str):
-            cleaned = _clean_html(obj)
+    while stack:
+        node = stack.pop()
+        if isinstance(node, str):
+            # 명백한 CSS/JS 노이즈는 정제 전에 제외
+            if _looks_like_noise_raw(node):
+                continue
+            cleaned = _clean_html(node)
             # 최소 길이 + 노이즈 패턴 검증
             if cleaned and len(cleaned) > 30 and not _is_noise_text(cleaned):
                 texts.append(cleaned)
-        elif isinstance(obj, dict):
-            if "#text" in obj:
-                val = obj["#text"]
-                if isinstance(val, str):
-                    cleaned = _clean_html(val)
-                    if cleaned and len(cleaned) > 30 and not _is_noise_text(cleaned):
-                        texts.append(cleaned)
-            for v in obj.values():
-                _walk(v)
-        elif isinstance(obj, list):
-            for item in obj:
-                _walk(item)
-
-    _walk(html_dict)
+        elif isinstance(node, dict):
+            # #text 키는 여기서 처리했으므로 다시 push하지 않음
+            val = node.get("#text")
+            if isinstance(val, str):
+                cleaned = _clean_html(val)
+                if cleaned and len(cleaned) > 30 and not _is_noise_text(cleaned):
+                    texts.append(cleaned)
+            # LIFO 스택이므로 역순으로 push해야 원래 순회 순서 유지
+            stack.extend(
+                v for k, v in reversed(list(node.items())) if k != "#text"
+            )
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+
     return "\n".join(texts)
 
 
+def _map_cpu(func, items: list) -> list:
+    """CPU 바운드 문서 준비 작업을 프로세스 풀로 분산.
+
+    건수가 적으면 프로세스 생성 비용이 더 크므로 순차 처리하고,
+    풀 기동이 불가능한 환경에서는 순차 처리로 폴백한다.
+    """
+    if len(items) < _CPU_POOL_MIN_ITEMS:
+        return [func(item) for item in items]
+    try:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+            return list(ex.map(func, items, chunksize=8))
+    except Exception as e:
+        logger.warning("프로세스 풀 실행 실패 — 순차 처리로 폴백: %s", e)
+        return [func(item) for item in items]
+
+
+def _iter_cpu(func, items: list):
+    """_map_cpu의 스트리밍 버전 — 결과를 완료 순서대로(입력 순서 유지) 산출.
+
+    생산자(워커의 CPU 준비)와 소비자(메인 프로세스의 스토어·DB 쓰기)가
+    파이프라인으로 겹쳐 수행되어 총 소요 시간이 두 단계의 합이 아니라
+    max(준비, 쓰기)에 수렴한다.
+    """
+    if len(items) < _CPU_POOL_MIN_ITEMS:
+        for item in items:
+            yield func(item)
+        return
+    try:
+        ex = ProcessPoolExecutor(max_workers=os.cpu_count())
+    except Exception as e:
+        logger.warning("프로세스 풀 기동 실패 — 순차 처리로 폴백: %s", e)
+        for item in items:
+            yield func(item)
+        return
+    try:
+        yield from ex.map(func, items, chunksize=8)
+    finally:
+        ex.shutdown()
+
+
+def _prepare_law_document(item: tuple) -> dict:
+    """법령 1건의 본문 추출 → 품질 검증 → 청킹.
+
+    순수 CPU 작업만 수행하는 최상위 함수라 프로세스 풀 워커에서 실행 가능.
+    스토어/DB 쓰기는 호출 측(메인 프로세스)에서 처리한다.
+    """
+    law, detail = item
+    try:
+        law_content = _extract_law_text(detail)
+        if not law_content:
+            return {"status": "empty"}
+
+        # Red Team #6: 데이터 품질 검증
+        if not validate_legal_document(law_content, "law"):
+            return {"status": "invalid"}
+
+        law_id = law.get("법령일련번호", "")
+        law_name = law.get("법령명한글", "")
+        metadata = {
+            "source_type": "law",
+            "source_id": f"law_{law_id}",
+            "law_id": str(law_id),
+            "law_name": str(law_name),
+            "proclamation_date": str(law.get("공포일자", "")),
+            "enforcement_date": str(law.get("시행일자", "")),
+            "source_url": f"https://www.law.go.kr/법령/{law_name}",
+        }
+        chunks = chunk_law_text(law_content, metadata)
+        return {"status": "ok", "content": law_content, "metadata": metadata, "chunks": chunks}
+    except Exception as e:
+        return {"status": "error", "reason": str(e)}
+
+
+def _prepare_precedent_document(item: tuple) -> dict:
+    """판례 1건의 본문 추출 → 품질 검증 → 청킹 (프로세스 풀 워커용)."""
+    prec, detail = item
+    try:
+        prec_content = _extract_precedent_text(detail)
+
+        # Red Team #1: 빈 내용 또는 노이즈만 추출된 경우 스킵
+        if not prec_content:
+            return {"status": "empty"}
+
+        # Red Team #6: 데이터 품질 검증
+        if not validate_legal_document(prec_content, "precedent"):
+            return {"status": "invalid"}
+
+        prec_seq = prec.get("판례일련번호", "")
+        case_name = prec.get("사건명", "")
+
+        # Red Team #7: 메타데이터 보강
+        prec_detail = detail.get("PrecService", {}) or detail.get("판례", {}) or {}
+        metadata = {
+            "source_type": "precedent",
+            "source_id": f"prec_{prec_seq}",
+            "precedent_seq": str(prec_seq),
+            "case_name": str(case_name),
+            "court_name": str(prec.get("법원명", "")),
+            "judgment_date": str(prec.get("선고일자", "")),
+            "case_number": str(prec.get("사건번호", prec_detail.get("사건번호", ""))),
+            "case_type": str(prec.get("사건종류명", prec_detail.get("사건종류명", ""))),
+            "source_url": f"https://www.law.go.kr/판례/{case_name}",
+        }
+
+        # 판례용 청킹 (Red Team #10)
+        chunks = chunk_precedent_text(prec_content, metadata)
+        return {"status": "ok", "content": prec_content, "metadata": metadata, "chunks": chunks}
+    except Exception as e:
+        return {"status": "error", "reason": str(e)}
+
+
 def ingest_laws(query: str, max_items: int = 100) -> int:
     """
     법령 검색 → 상세 조회 → 품질 검증 → 청킹 → 벡터 스토어 저장
@@ -648,78 +1458,95 @@ def ingest_laws(query: str, max_items: int = 100) -> int:
         if not isinstance(laws, list):
             laws = [laws] if laws else []
     except Exception as e:
-        logger.error(f"법령 검색 실패: {e}")
+        logger.error("법령 검색 실패: %s", e)
         return 0
 
-    for law in laws[:max_items]:
+    # 상세 조회는 순수 I/O — 스레드 풀로 병렬 수행 후 순서대로 처리
+    def _fetch(law: dict):
+        law_id = law.get("법령일련번호", "")
+        if not law_id:
+            return law, None, None
+        try:
+            return law, get_law_detail(law_id), None
+        except Exception as e:
+            return law, None, e
+
+    with ThreadPoolExecutor(max_workers=_FETCH_WORKERS) as ex:
+        fetched = list(ex.map(_fetch, laws[:max_items]))
+
+    to_prepare: list[tuple] = []
+    for law, detail, fetch_err in fetched:
         law_id = law.get("법령일련번호", "")
         law_name = law.get("법령명한글", "")
         if not law_id:
             continue
+        if fetch_err is not None:
+            logger.error("법령 상세 조회 실패 (%s): %s", law_name, fetch_err)
+            failed_items.append({"id": law_id, "name": law_name, "reason": str(fetch_err)})
+            continue
+        to_prepare.append((law, detail))
 
-        try:
-            detail = get_law_detail(law_id)
-            law_content = _extract_law_text(detail)
-            if not law_content:
-                continue
+    # 정제·검증·청킹은 CPU 바운드 — 프로세스 풀에서 준비하며 결과를
+    # 스트리밍 소비해 스토어·DB 쓰기와 겹친다
+    prepared = _iter_cpu(_prepare_law_document, to_prepare)
 
-            # Red Team #6: 데이터 품질 검증
-            if not validate_legal_document(law_content, "law"):
-                logger.warning(f"법령 품질 검증 실패 (스킵): {law_name}")
-                failed_items.append({"id": law_id, "name": law_name, "reason": "validation_failed"})
-                continue
+    for (law, _detail), prep in zip(to_prepare, prepared):
+        law_id = law.get("법령일련번호", "")
+        law_name = law.get("법령명한글", "")
 
-            metadata = {
-                "source_type": "law",
-                "source_id": f"law_{law_id}",
-                "law_id": str(law_id),
-                "law_name": str(law_name),
-                "proclamation_date": str(law.get("공포일자", "")),
-                "enforcement_date": str(law.get("시행일자", "")),
-                "source_url": f"https://www.law.go.kr/법령/{law_name}",
-            }
+        if prep["status"] == "empty":
+            continue
+        if prep["status"] == "invalid":
+            logger.warning("법령 품질 검증 실패 (스킵): %s", law_name)
+            failed_items.append({"id": law_id, "name": law_name, "reason": "validation_failed"})
+            continue
+        if prep["status"] == "error":
+            logger.error("법령 처리 실패 (%s): %s", law_name, prep["reason"])
+            failed_items.append({"id": law_id, "name": law_name, "reason": prep["reason"]})
+            continue
 
-            chunks = chunk_law_text(law_content, metadata)
-            if chunks:
-                store.upsert(
-                    ids=[c["id"] for c in chunks],
-                    documents=[c["text"] for c in chunks],
-                    metadatas=[c["metadata"] for c in chunks],
-                )
-                total_chunks += len(chunks)
+        law_content = prep["content"]
+        metadata = prep["metadata"]
+        chunks = prep["chunks"]
+        if chunks:
+            store.upsert_many_deferred(
+                ids=[c["id"] for c in chunks],
+                documents=[c["text"] for c in chunks],
+                metadatas=[c["metadata"] for c in chunks],
+            )
+            total_chunks += len(chunks)
 
-                # SQLite DB 동시 적재
-                if _db:
-                    try:
-                        db_law_id = _db.upsert_law(
-                            law_id=str(law_id),
-                            law_name=str(law_name),
-                            raw_content=law_content,
-                            proclamation_date=metadata.get("proclamation_date"),
-                            enforcement_date=metadata.get("enforcement_date"),
-                            source_url=metadata.get("source_url"),
+            # SQLite DB 동시 적재
+            if _db:
+                try:
+                    db_law_id = _db.upsert_law(
+                        law_id=str(law_id),
+                        law_name=str(law_name),
+                        raw_content=law_content,
+                        proclamation_date=metadata.get("proclamation_date"),
+                        enforcement_date=metadata.get("enforcement_date"),
+                        source_url=metadata.get("source_url"),
+                    )
+                    for chunk in chunks:
+                        _db.upsert_chunk(
+                            chunk_hash=chunk["id"],
+                            source_type="law",
+                            source_id=db_law_id,
+                            chunk_index=chunk["metadata"].get("chunk_index", 0),
+                            content=chunk["text"],
+                            metadata=chunk["metadata"],
                         )
-                        for chunk in chunks:
-                            _db.upsert_chunk(
-                                chunk_hash=chunk["id"],
-                                source_type="law",
-                                source_id=db_law_id,
-                                chunk_index=chunk["metadata"].get("chunk_index", 0),
-                                content=chunk["text"],
-                                metadata=chunk["metadata"],
-                            )
-                    except Exception as db_err:
-                        logger.warning(f"법령 DB 적재 실패 ({law_name}): {db_err}")
+                except Exception as db_err:
+                    logger.warning("법령 DB 적재 실패 (%s): %s", law_name, db_err)
 
-                logger.info(f"법령 적재: {law_name} ({len(chunks)}청크)")
+            logger.info("법령 적재: %s (%s청크)", law_name, len(chunks))
 
-        except Exception as e:
-            logger.error(f"법령 상세 조회 실패 ({law_name}): {e}")
-            failed_items.append({"id": law_id, "name": law_name, "reason": str(e)})
-            continue
+    # 적재 루프 종료 후 1회만 디스크에 기록
+    if total_chunks:
+        store.flush()
 
     if failed_items:
-        logger.warning(f"법령 적재 실패 {len(failed_items)}건: {[f['name'] for f in failed_items]}")
+        logger.warning("법령 적재 실패 %s건: %s", len(failed_items), [f['name'] for f in failed_items])
 
     return total_chunks
 
@@ -748,51 +1575,76 @@ def ingest_precedents(query: str, max_items: int = 50) -> int:
         if not isinstance(precs, list):
             precs = [precs] if precs else []
     except Exception as e:
-        logger.error(f"판례 검색 실패: {e}")
+        logger.error("판례 검색 실패: %s", e)
         return 0
 
-    for prec in precs[:max_items]:
+    # 상세 조회는 순수 I/O — 스레드 풀로 병렬 수행 후 순서대로 처리.
+    # 키워드들이 겹치는 판례를 반환하는 경우("저작권 침해"/"콘텐츠 저작권" 등)
+    # 동일 일련번호의 상세 조회를 메모이즈해 중복 API 호출을 제거
+    def _fetch(prec: dict):
+        prec_seq = prec.get("판례일련번호", "")
+        if not prec_seq:
+            return prec, None, None
+        with _detail_cache_lock:
+            cached = _precedent_detail_cache.get(prec_seq)
+            if cached is not None:
+                _precedent_detail_cache.move_to_end(prec_seq)
+                return prec, cached, None
+        try:
+            detail = get_precedent_detail(prec_seq)
+        except Exception as e:
+            return prec, None, e
+        with _detail_cache_lock:
+            _precedent_detail_cache[prec_seq] = detail
+            if len(_precedent_detail_cache) > _DETAIL_CACHE_MAX:
+                _precedent_detail_cache.popitem(last=False)
+        return prec, detail, None
+
+    with ThreadPoolExecutor(max_workers=_FETCH_WORKERS) as ex:
+        fetched = list(ex.map(_fetch, precs[:max_items]))
+
+    to_prepare: list[tuple] = []
+    for prec, detail, fetch_err in fetched:
         prec_seq = prec.get("판례일련번호", "")
         case_name = prec.get("사건명", "")
         if not prec_seq:
             continue
+        if fetch_err is not None:
+            logger.error("판례 상세 조회 실패 (%s): %s", case_name, fetch_err)
+            failed_items.append({"seq": prec_seq, "name": case_name, "reason": str(fetch_err)})
+            continue
+        to_prepare.append((prec, detail))
 
-        try:
-            detail = get_precedent_detail(prec_seq)
-            prec_content = _extract_precedent_text(detail)
+    # 정제·검증·청킹은 CPU 바운드 — 프로세스 풀에서 준비하며 결과를
+    # 스트리밍 소비해 스토어·DB 쓰기와 겹친다. 쓰기 구간은 잠금으로
+    # 직렬화해 여러 스레드의 동시 적재에서도 스토어 상태가 안전하다
+    prepared = _iter_cpu(_prepare_precedent_document, to_prepare)
 
-            # Red Team #1: 빈 내용 또는 노이즈만 추출된 경우 스킵
-            if not prec_content:
+    with _ingest_write_lock:
+        for (prec, _detail), prep in zip(to_prepare, prepared):
+            prec_seq = prec.get("판례일련번호", "")
+            case_name = prec.get("사건명", "")
+
+            if prep["status"] == "empty":
                 skipped_noise += 1
-                logger.warning(f"판례 본문 추출 실패 (노이즈/빈 내용): {case_name} (seq={prec_seq})")
+                logger.warning("판례 본문 추출 실패 (노이즈/빈 내용): %s (seq=%s)", case_name, prec_seq)
                 failed_items.append({"seq": prec_seq, "name": case_name, "reason": "empty_or_noise"})
                 continue
-
-            # Red Team #6: 데이터 품질 검증
-            if not validate_legal_document(prec_content, "precedent"):
+            if prep["status"] == "invalid":
                 skipped_noise += 1
-                logger.warning(f"판례 품질 검증 실패 (스킵): {case_name} (seq={prec_seq})")
+                logger.warning("판례 품질 검증 실패 (스킵): %s (seq=%s)", case_name, prec_seq)
                 failed_items.append({"seq": prec_seq, "name": case_name, "reason": "validation_failed"})
                 continue
+            if prep["status"] == "error":
+                logger.error("판례 처리 실패 (%s): %s", case_name, prep["reason"])
+                failed_items.append({"seq": prec_seq, "name": case_name, "reason": prep["reason"]})
+                continue
 
-            # Red Team #7: 메타데이터 보강
-            prec_detail = detail.get("PrecService", {}) or detail.get("판례", {}) or {}
-            metadata = {
-                "source_type": "precedent",
-                "source_id": f"prec_{prec_seq}",
-                "precedent_seq": str(prec_seq),
-                "case_name": str(case_name),
-                "court_name": str(prec.get("법원명", "")),
-                "judgment_date": str(prec.get("선고일자", "")),
-                "case_number": str(prec.get("사건번호", prec_detail.get("사건번호", ""))),
-                "case_type": str(prec.get("사건종류명", prec_detail.get("사건종류명", ""))),
-                "source_url": f"https://www.law.go.kr/판례/{case_name}",
-            }
-
-            # 판례용 청킹 (Red Team #10)
-            chunks = chunk_precedent_text(prec_content, metadata)
+            prec_content = prep["content"]
+            metadata = prep["metadata"]
+            chunks = prep["chunks"]
             if chunks:
-                store.upsert(
+                store.upsert_many_deferred(
                     ids=[c["id"] for c in chunks],
                     documents=[c["text"] for c in chunks],
                     metadatas=[c["metadata"] for c in chunks],
@@ -822,25 +1674,53 @@ def ingest_precedents(query: str, max_items: int = 50) -> int:
                                 metadata=chunk["metadata"],
                             )
                     except Exception as db_err:
-                        logger.warning(f"판례 DB 적재 실패 ({case_name}): {db_err}")
+                        logger.warning("판례 DB 적재 실패 (%s): %s", case_name, db_err)
 
-                logger.info(f"판례 적재: {case_name} ({len(chunks)}청크)")
+                logger.info("판례 적재: %s (%s청크)", case_name, len(chunks))
 
-        except Exception as e:
-            logger.error(f"판례 상세 조회 실패 ({case_name}): {e}")
-            failed_items.append({"seq": prec_seq, "name": case_name, "reason": str(e)})
-            continue
+        # 적재 루프 종료 후 1회만 디스크에 기록
+        if total_chunks:
+            store.flush()
 
     if skipped_noise > 0:
-        logger.warning(f"판례 노이즈/품질 실패로 {skipped_noise}건 스킵")
+        logger.warning("판례 노이즈/품질 실패로 %s건 스킵", skipped_noise)
     if failed_items:
-        logger.warning(f"판례 적재 실패 총 {len(failed_items)}건")
+        logger.warning("판례 적재 실패 총 %s건", len(failed_items))
 
     return total_chunks
 
 
+def _prepare_policy_document(item: tuple) -> dict:
+    """스토어 정책 1건의 메타데이터 구성 → 청킹 (프로세스 풀 워커용)."""
+    idx, text, metadata = item
+    try:
+        metadata.setdefault("source_type", "store_policy")
+        source_id = metadata.get(
+            "source_id",
+            f"{metadata.get('store', 'unknown')}"
+            f"_{metadata.get('section', 'unknown')}"
+            f"_{metadata.get('subsection', str(idx))}",
+        )
+        metadata["source_id"] = source_id
+        chunks = chunk_law_text(text, metadata)
+        if not chunks:
+            return {"status": "empty"}
+        return {"status": "ok", "text": text, "metadata": metadata, "chunks": chunks}
+    except Exception as e:
+        return {"status": "error", "error": str(e)}
+
+
+def _policy_chunks_unchanged(store: VectorStore, chunks: list[dict]) -> bool:
+    """모든 청크가 동일 ID·동일 본문으로 이미 적재되어 있으면 True"""
+    for chunk in chunks:
+        pos = store._id_pos.get(chunk["id"])
+        if pos is None or store._texts[pos] != chunk["text"]:
+            return False
+    return True
+
+
 def ingest_store_policies(
-    policies: list[dict],
+    policies: Iterable[dict],
     force_refresh: bool = False,
 ) -> int:
     """
@@ -849,7 +1729,7 @@ def ingest_store_policies(
     외부 API가 없으므로 구조화된 정책 데이터를 직접 받아 청킹 후 저장합니다.
 
     Args:
-        policies: 정책 데이터 리스트
+        policies: 정책 데이터 이터러블 (리스트 또는 iter_all_store_policies())
             [{"text": str, "metadata": {"store": str, "section": str, ...}}, ...]
         force_refresh: True면 기존 컬렉션 삭제 후 재적재
 
@@ -863,25 +1743,40 @@ def ingest_store_policies(
         print("[LegalRAG] store_policies 컬렉션 초기화")
 
     total_chunks = 0
-
-    for idx, policy in enumerate(policies):
-        text = policy.get("text", "")
-        metadata = policy.get("metadata", {})
-        if not text:
+    db_chunk_batch: list[dict] = []
+
+    # CPU 바운드 준비(청킹)는 법령·판례 적재와 동일하게 프로세스 풀로 병렬화.
+    # 원본 메타데이터는 읽기 전용일 수 있으므로(store_policy_data의
+    # 동결 엔트리) 복사본에 적재용 필드를 추가
+    items = [
+        (idx, policy.get("text", ""), dict(policy.get("metadata", {})))
+        for idx, policy in enumerate(policies)
+        if policy.get("text", "")
+    ]
+    prepared = _iter_cpu(_prepare_policy_document, items)
+
+    for result in prepared:
+        if result["status"] != "ok":
+            if result["status"] == "error":
+                logger.warning("스토어 정책 준비 실패: %s", result.get("error"))
             continue
 
-        metadata.setdefault("source_type", "store_policy")
-        source_id = metadata.get(
-            "source_id",
-            f"{metadata.get('store', 'unknown')}"
-            f"_{metadata.get('section', 'unknown')}"
-            f"_{metadata.get('subsection', str(idx))}",
-        )
-        metadata["source_id"] = source_id
+        text = result["text"]
+        metadata = result["metadata"]
+        chunks = result["chunks"]
+
+        # 재적재 멱등성 — 청크 ID는 source_id 기반으로 결정적이므로,
+        # 동일 본문이 이미 적재돼 있으면 벡터 스토어·DB 쓰기를 모두 생략
+        if not force_refresh and _policy_chunks_unchanged(store, chunks):
+            logger.debug(
+                "스토어 정책 변경 없음 — 건너뜀: [%s] %s",
+                metadata.get("store", "?"),
+                metadata.get("section", "?"),
+            )
+            continue
 
-        chunks = chunk_law_text(text, metadata)
         if chunks:
-            store.upsert(
+            store.upsert_many_deferred(
                 ids=[c["id"] for c in chunks],
                 documents=[c["text"] for c in chunks],
                 metadatas=[c["metadata"] for c in chunks],
@@ -901,19 +1796,32 @@ def ingest_store_policies(
                         policy_name=metadata.get("policy_name", ""),
                         effective_date=metadata.get("effective_date"),
                     )
-                    for chunk in chunks:
-                        _db.upsert_chunk(
-                            chunk_hash=chunk["id"],
-                            source_type="store_policy",
-                            source_id=db_policy_id,
-                            chunk_index=chunk["metadata"].get("chunk_index", 0),
-                            content=chunk["text"],
-                            metadata=chunk["metadata"],
-                        )
+                    # 청크 행은 모아서 루프 뒤 단일 트랜잭션으로 기록
+                    db_chunk_batch.extend(
+                        {
+                            "chunk_hash": chunk["id"],
+                            "source_type": "store_policy",
+                            "source_id": db_policy_id,
+                            "chunk_index": chunk["metadata"].get("chunk_index", 0),
+                            "content": chunk["text"],
+                            "metadata": chunk["metadata"],
+                        }
+                        for chunk in chunks
+                    )
                 except Exception as db_err:
-                    logger.warning(f"스토어 정책 DB 적재 실패 ([{store_name}] {section}): {db_err}")
+                    logger.warning("스토어 정책 DB 적재 실패 ([%s] %s): %s", store_name, section, db_err)
+
+            logger.info("스토어 정책 적재: [%s] %s (%s청크)", store_name, section, len(chunks))
+
+    if _db and db_chunk_batch:
+        try:
+            _db.upsert_chunks_many(db_chunk_batch)
+        except Exception as db_err:
+            logger.warning("스토어 정책 청크 일괄 적재 실패: %s", db_err)
 
-            logger.info(f"스토어 정책 적재: [{store_name}] {section} ({len(chunks)}청크)")
+    # 적재 루프 종료 후 1회만 디스크에 기록
+    if total_chunks:
+        store.flush()
 
     return total_chunks
 
@@ -961,7 +1869,7 @@ def search_legal_context(
                     results.append(hit)
 
         except Exception as e:
-            logger.error(f"{col_name} 검색 오류: {e}")
+            logger.error("%s 검색 오류: %s", col_name, e)
             continue
 
     # 유사도 내림차순 정렬 → top_k 제한
@@ -981,11 +1889,49 @@ def search_legal_context(
                 duration_ms=duration_ms,
             )
         except Exception as db_err:
-            logger.warning(f"검색 로그 DB 기록 실패: {db_err}")
+            logger.warning("검색 로그 DB 기록 실패: %s", db_err)
 
     return results
 
 
+def search_legal_context_batch(
+    queries: list[str],
+    top_k: int = 5,
+    score_threshold: float = 0.7,
+) -> list[list[dict]]:
+    """
+    여러 쿼리를 일괄 검색 — 쿼리별 결과 리스트를 입력 순서대로 반환
+
+    search_legal_context를 쿼리마다 호출하면 컬렉션 순회와 TF-IDF
+    벡터화가 쿼리 수만큼 반복됩니다. 이 함수는 컬렉션을 한 번만
+    순회하며 query_many로 쿼리 전체를 일괄 변환·채점합니다.
+    (테스트 스크립트 등 배치 경로 전용 — 검색 로그는 기록하지 않음)
+    """
+    if not queries:
+        return []
+
+    all_results: list[list[dict]] = [[] for _ in queries]
+
+    for col_name in ALL_COLLECTIONS:
+        try:
+            store = get_or_create_collection(col_name)
+            if store.count() == 0:
+                continue
+
+            for qi, hits in enumerate(store.query_many(queries, n_results=top_k)):
+                for hit in hits:
+                    if hit["score"] >= score_threshold:
+                        all_results[qi].append(hit)
+
+        except Exception as e:
+            logger.error("%s 일괄 검색 오류: %s", col_name, e)
+            continue
+
+    for hits in all_results:
+        hits.sort(key=lambda x: x["score"], reverse=True)
+    return [hits[:top_k] for hits in all_results]
+
+
 # ─────────────────────────────────────────────────────────────
 # Step 5: 데이터 동기화 (F-6)
 # ─────────────────────────────────────────────────────────────
@@ -1027,7 +1973,9 @@ def _save_sync_metadata(summary: dict, queries: list[str]) -> None:
         "sync_queries": queries,
         "sync_result": summary,
         "collections": collections_status,
-        "sync_history": existing.get("sync_history", []) + [
+        # 이력은 최근 200건만 유지 — 무한 증가하면 동기화마다 파일 전체를
+        # 다시 쓰는 비용이 이력 길이에 비례해 커짐
+        "sync_history": existing.get("sync_history", [])[-199:] + [
             {
                 "timestamp": datetime.now(timezone.utc).isoformat(),
                 "queries": queries,
@@ -1037,10 +1985,14 @@ def _save_sync_metadata(summary: dict, queries: list[str]) -> None:
     }
 
     os.makedirs(DATABASE_PATH, exist_ok=True)
-    with open(metadata_path, "w", encoding="utf-8") as f:
-        json.dump(metadata, f, ensure_ascii=False, indent=2)
+    if _orjson is not None:
+        with open(metadata_path, "wb") as f:
+            f.write(_orjson.dumps(metadata, option=_orjson.OPT_INDENT_2))
+    else:
+        with open(metadata_path, "w", encoding="utf-8") as f:
+            json.dump(metadata, f, ensure_ascii=False, indent=2)
 
-    logger.info(f"동기화 메타데이터 저장: version={new_version}, path={metadata_path}")
+    logger.info("동기화 메타데이터 저장: version=%s, path=%s", new_version, metadata_path)
 
 
 def sync_legal_data(
@@ -1063,13 +2015,13 @@ def sync_legal_data(
         try:
             sync_id = _db.start_sync(sync_type="full", queries=queries)
         except Exception as db_err:
-            logger.warning(f"sync_logs 시작 기록 실패: {db_err}")
+            logger.warning("sync_logs 시작 기록 실패: %s", db_err)
 
     if force_refresh:
         for name in [COLLECTION_LAWS, COLLECTION_PRECEDENTS]:
             store = get_or_create_collection(name)
             store.clear()
-            logger.info(f"컬렉션 초기화: {name}")
+            logger.info("컬렉션 초기화: %s", name)
 
     laws_total = 0
     precs_total = 0
@@ -1077,12 +2029,12 @@ def sync_legal_data(
 
     try:
         for q in queries:
-            logger.info(f"동기화 쿼리: '{q}'")
+            logger.info("동기화 쿼리: '%s'", q)
             laws_total += ingest_laws(q, max_items=50)
             precs_total += ingest_precedents(q, max_items=30)
     except Exception as e:
         sync_error = str(e)
-        logger.error(f"동기화 중 오류: {e}")
+        logger.error("동기화 중 오류: %s", e)
 
     summary = {
         "laws_added": laws_total,
@@ -1103,9 +2055,9 @@ def sync_legal_data(
                 error_message=sync_error,
             )
         except Exception as db_err:
-            logger.warning(f"sync_logs 완료 기록 실패: {db_err}")
+            logger.warning("sync_logs 완료 기록 실패: %s", db_err)
 
-    logger.info(f"동기화 완료: {summary}")
+    logger.info("동기화 완료: %s", summary)
     return summary
 
 
@@ -124,12 +124,18 @@ CREATE TABLE IF NOT EXISTS document_chunks (
     chunk_index     INTEGER NOT NULL,
     content         TEXT NOT NULL,
     content_length  INTEGER NOT NULL DEFAULT 0,
-    metadata_json   TEXT,                       -- JSON: 유연한 메타데이터
+    metadata_json   TEXT,                       -- JSON: 유연한 메타데이터 (전체 보존)
+    meta_store      TEXT,                       -- 자주 쓰는 필터 키 승격: metadata.store
+    meta_section    TEXT,                       -- metadata.section
+    meta_case_name  TEXT,                       -- metadata.case_name
     created_at      TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%SZ', 'now'))
 );
 
 CREATE INDEX IF NOT EXISTS idx_chunks_hash ON document_chunks(chunk_hash);
 CREATE INDEX IF NOT EXISTS idx_chunks_source ON document_chunks(source_type, source_id);
+-- 스토어 정책 청크만 포함하는 부분 인덱스 — store/section 필터를 JSON 파싱 없이 인덱스 탐색으로
+CREATE INDEX IF NOT EXISTS idx_chunks_store_section
+    ON document_chunks(meta_store, meta_section) WHERE meta_store IS NOT NULL;
 
 
 CREATE TABLE IF NOT EXISTS search_logs (
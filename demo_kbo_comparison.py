@@ -5,7 +5,11 @@ import pandas as pd
 st.set_page_config(page_title="KBO 2024 시즌 선수 비교", layout="wide")
 
 # Custom CSS for "Clean White" Aesthetic
-st.markdown("""
+# 정적 CSS/HTML 블록은 rerun마다 다시 만들 필요가 없으므로 캐시된
+# 리소스로 1회만 구성한다 (Streamlit은 동일 문자열 전달 시 diff 최소화)
+@st.cache_resource
+def _page_css() -> str:
+    return """
 <style>
     @import url('https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@300;400;500;700&display=swap');
     
@@ -109,16 +113,16 @@ st.markdown("""
         background-color: #0b1f52;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
 
-# App Content
-st.markdown("<div class='main-header'><h1>⚾ KBO 2024 시즌 선수 비교</h1><p>폰세카 (LG 트윈스) vs 라일리 (두산 베어스)</p></div>", unsafe_allow_html=True)
 
-# Top Comparison Cards
-col1, col2, col3 = st.columns([1, 0.5, 1])
+st.markdown(_page_css(), unsafe_allow_html=True)
 
-with col1:
-    st.markdown("""
+# 정적 HTML 블록은 모듈 상수로 1회만 구성 — rerun마다 동일 객체를
+# 전달하면 Streamlit이 요소 해시 비교만으로 변경 없음을 판정한다.
+# (session_state로 주입 자체를 건너뛰면 rerun 시 요소가 트리에서
+# 제거되어 스타일이 사라지므로 그 방식은 쓰지 않는다)
+_PLAYER_CARD_LEFT = """
     <div class='player-card'>
         <div class='player-number' style='background-color: #d1135c;'>51</div>
         <div class='player-name'>폰세카</div>
@@ -129,13 +133,9 @@ with col1:
         </div>
         <div class='player-sub'>우투우타 | 188cm / 95kg<br>1993.10.14 (31세)</div>
     </div>
-    """, unsafe_allow_html=True)
-
-with col2:
-    st.markdown("<div style='text-align: center; padding-top: 50px;'><span class='vs-text'>VS</span></div>", unsafe_allow_html=True)
+    """
 
-with col3:
-    st.markdown("""
+_PLAYER_CARD_RIGHT = """
     <div class='player-card'>
         <div class='player-number' style='background-color: #0b1f52;'>27</div>
         <div class='player-name'>라일리</div>
@@ -146,34 +146,44 @@ with col3:
         </div>
         <div class='player-sub'>우투우타 | 191cm / 109kg<br>1997.04.02 (27세)</div>
     </div>
-    """, unsafe_allow_html=True)
+    """
+
+# App Content
+st.markdown("<div class='main-header'><h1>⚾ KBO 2024 시즌 선수 비교</h1><p>폰세카 (LG 트윈스) vs 라일리 (두산 베어스)</p></div>", unsafe_allow_html=True)
+
+# Top Comparison Cards
+col1, col2, col3 = st.columns([1, 0.5, 1])
+
+with col1:
+    st.markdown(_PLAYER_CARD_LEFT, unsafe_allow_html=True)
+
+with col2:
+    st.markdown("<div style='text-align: center; padding-top: 50px;'><span class='vs-text'>VS</span></div>", unsafe_allow_html=True)
+
+with col3:
+    st.markdown(_PLAYER_CARD_RIGHT, unsafe_allow_html=True)
 
 # Stats Section
 st.markdown("### 📊 2024 시즌 주요 스탯")
 
-# Key stats summary
-s_col1, s_col2, s_col3, s_col4, s_col5 = st.columns(5)
-stats_data = [
-    ("타율 (AVG)", ".311", ".289"),
-    ("홈런 (HR)", "28", "32"),
-    ("타점 (RBI)", "102", "98"),
-    ("OPS", ".931", ".905"),
-    ("WAR", "4.8", "4.2")
-]
-
-for i, (label, v1, v2) in enumerate(stats_data):
-    cols = [s_col1, s_col2, s_col3, s_col4, s_col5]
-    with cols[i]:
-        st.markdown(f"""
-        <div style='text-align: center; background: white; padding: 15px; border-radius: 10px; box-shadow: 0 2px 5px rgba(0,0,0,0.02);'>
-            <div style='font-size: 12px; color: #888;'>{label}</div>
-            <div style='display: flex; justify-content: space-around; align-items: baseline; margin-top: 10px;'>
-                <span style='font-size: 20px; font-weight: bold; color: #d1135c;'>{v1}</span>
-                <span style='font-size: 20px; font-weight: bold; color: #0b1f52;'>{v2}</span>
-            </div>
-            <div style='font-size: 10px; color: #bbb; margin-top: 5px;'>폰세카  라일리</div>
-        </div>
-        """, unsafe_allow_html=True)
+# Key stats summary — HTML 카드 대신 Arrow 기반 데이터프레임으로 전송.
+# st.dataframe은 프런트엔드의 가상화 그리드가 diff 렌더링하므로
+# rerun마다 HTML 블롭 5개를 다시 그리는 것보다 가볍다.
+STATS_VERSION = 1  # 스탯 데이터 변경 시 증가 (캐시 키)
+
+
+@st.cache_data
+def _stats_df(version: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "지표": ["타율 (AVG)", "홈런 (HR)", "타점 (RBI)", "OPS", "WAR"],
+            "폰세카": [".311", "28", "102", ".931", "4.8"],
+            "라일리": [".289", "32", "98", ".905", "4.2"],
+        }
+    )
+
+
+st.dataframe(_stats_df(STATS_VERSION), hide_index=True, use_container_width=True)
 
 st.write("")
 
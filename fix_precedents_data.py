@@ -7,6 +7,12 @@ case_name을 text로 사용하도록 수정
 import json
 import os
 
+# 선택 의존성: orjson — 수 MB 판례 JSON의 파싱/직렬화 가속 (C 확장)
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
 def fix_precedents_data():
     """판례 데이터의 text 필드를 case_name으로 교체"""
     
@@ -16,9 +22,10 @@ def fix_precedents_data():
         print(f"❌ 파일을 찾을 수 없습니다: {db_path}")
         return
     
-    # 데이터 로드
-    with open(db_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    # 데이터 로드 — 바이너리로 읽어 디코드 경유 없이 파싱
+    with open(db_path, "rb") as f:
+        raw = f.read()
+    data = _orjson.loads(raw) if _orjson is not None else json.loads(raw)
     
     print(f"📊 총 {len(data)}건의 판례 데이터 발견")
     
@@ -37,9 +44,13 @@ def fix_precedents_data():
         doc_data["text"] = new_text
         fixed_count += 1
     
-    # 저장
-    with open(db_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    # 저장 — orjson은 bytes를 반환하므로 바이너리 모드로 직접 기록
+    if _orjson is not None:
+        with open(db_path, "wb") as f:
+            f.write(_orjson.dumps(data, option=_orjson.OPT_INDENT_2))
+    else:
+        with open(db_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
     
     print(f"✅ {fixed_count}건의 판례 데이터 수정 완료!")
     print(f"💾 저장 완료: {db_path}")
@@ -63,8 +63,9 @@ def main():
         "UGC 사용자 생성 콘텐츠 필터링",
     ]
 
-    for query in test_queries:
-        results = store.query(query_text=query, n_results=3)
+    # 쿼리별 transform 반복 대신 배치 1회로 전체 질의를 채점
+    batch_results = store.query_many(test_queries, n_results=3)
+    for query, results in zip(test_queries, batch_results):
         if results:
             top = results[0]
             score = top["score"]
@@ -19,6 +19,20 @@ import json
 import os
 import sys
 import argparse
+from collections import defaultdict
+from itertools import chain, islice
+
+# 선택 의존성: orjson — 수 MB JSON 파싱 가속 (C 확장)
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# 선택 의존성: ijson — 대형 JSON 증분 파싱 (파일 전체를 메모리에 들지 않음)
+try:
+    import ijson as _ijson
+except ImportError:
+    _ijson = None
 
 # 프로젝트 루트를 패스에 추가
 sys.path.insert(0, os.path.dirname(__file__))
@@ -35,8 +49,38 @@ def load_json(filename: str) -> dict:
     if not os.path.exists(path):
         print(f"  [SKIP] {filename} — 파일 없음")
         return {}
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        raw = f.read()
+    return _orjson.loads(raw) if _orjson is not None else json.loads(raw)
+
+
+def iter_json_items(filename: str):
+    """최상위 dict JSON의 (키, 레코드) 쌍을 증분 파싱으로 순회
+
+    수백 MB짜리 판례 파일도 파일 바이트 + 객체 그래프를 동시에 들고
+    있지 않도록 ijson으로 스트리밍합니다 (미설치 시 일괄 로드 폴백).
+    """
+    path = os.path.join(DATABASE_DIR, filename)
+    if not os.path.exists(path):
+        print(f"  [SKIP] {filename} — 파일 없음")
+        return
+    if _ijson is not None:
+        with open(path, "rb") as f:
+            yield from _ijson.kvitems(f, "")
+    else:
+        yield from load_json(filename).items()
+
+
+def _existing_hashes(db: DatabaseManager, source_type: str) -> set:
+    """이미 이관된 chunk_hash 집합 — 재실행 시 파이썬 단계에서 선필터"""
+    with db.connection() as conn:
+        return {
+            row["chunk_hash"]
+            for row in conn.execute(
+                "SELECT chunk_hash FROM document_chunks WHERE source_type=?",
+                (source_type,),
+            )
+        }
 
 
 def migrate_laws(db: DatabaseManager, dry_run: bool = False) -> dict:
@@ -45,36 +89,37 @@ def migrate_laws(db: DatabaseManager, dry_run: bool = False) -> dict:
     print("📚 법령 데이터 마이그레이션")
     print("=" * 50)
 
-    data = load_json("laws.json")
-    if not data:
-        return {"docs": 0, "chunks": 0, "skipped": 0}
-
-    # 메타데이터 기반으로 고유 법령 추출
-    law_groups: dict[str, list] = {}  # law_id → [chunks]
-    for chunk_hash, chunk_data in data.items():
+    # 메타데이터 기반으로 고유 법령 추출 (스트리밍 파싱으로 1패스 그룹화)
+    # defaultdict로 "not in 검사 + 빈 리스트 대입"의 이중 해시 조회 제거
+    total_chunks = 0
+    law_groups: dict[str, list] = defaultdict(list)  # law_id → [chunks]
+    for chunk_hash, chunk_data in iter_json_items("laws.json"):
+        total_chunks += 1
         meta = chunk_data.get("metadata", {})
         law_id = meta.get("law_id", "")
         if not law_id:
             continue
-        if law_id not in law_groups:
-            law_groups[law_id] = []
         law_groups[law_id].append({
             "hash": chunk_hash,
             "text": chunk_data.get("text", ""),
             "metadata": meta,
         })
 
-    print(f"  발견: {len(law_groups)}개 법령, {len(data)}개 청크")
+    if not total_chunks:
+        return {"docs": 0, "chunks": 0, "skipped": 0}
+
+    print(f"  발견: {len(law_groups)}개 법령, {total_chunks}개 청크")
 
     if dry_run:
-        for law_id, chunks in list(law_groups.items())[:3]:
+        for law_id, chunks in islice(law_groups.items(), 3):
             meta = chunks[0]["metadata"]
             print(f"    - {meta.get('law_name', '?')} (ID: {law_id}, {len(chunks)}청크)")
-        return {"docs": len(law_groups), "chunks": len(data), "skipped": 0}
+        return {"docs": len(law_groups), "chunks": total_chunks, "skipped": 0}
 
     # 실제 마이그레이션
     docs_count = 0
     chunks_count = 0
+    chunk_batch: list[dict] = []
 
     for law_id, chunks in law_groups.items():
         meta = chunks[0]["metadata"]
@@ -89,17 +134,25 @@ def migrate_laws(db: DatabaseManager, dry_run: bool = False) -> dict:
         )
         docs_count += 1
 
-        # 청크 생성
-        for chunk in chunks:
-            db.upsert_chunk(
-                chunk_hash=chunk["hash"],
-                source_type="law",
-                source_id=db_law_id,
-                chunk_index=chunk["metadata"].get("chunk_index", 0),
-                content=chunk["text"],
-                metadata=chunk["metadata"],
-            )
-            chunks_count += 1
+        # 청크는 배치에 모아 단일 트랜잭션으로 일괄 삽입
+        chunk_batch.extend(
+            {
+                "chunk_hash": chunk["hash"],
+                "source_type": "law",
+                "source_id": db_law_id,
+                "chunk_index": chunk["metadata"].get("chunk_index", 0),
+                "content": chunk["text"],
+                "metadata": chunk["metadata"],
+            }
+            for chunk in chunks
+        )
+
+    # 재실행 시 이미 있는 해시는 SQLite까지 가기 전에 걸러낸다
+    # (INSERT OR IGNORE는 여전히 안전망으로 유지)
+    existing = _existing_hashes(db, "law")
+    if existing:
+        chunk_batch = [c for c in chunk_batch if c["chunk_hash"] not in existing]
+    chunks_count = db.upsert_chunks_many(chunk_batch)
 
     print(f"  완료: {docs_count}개 법령, {chunks_count}개 청크 이관")
     return {"docs": docs_count, "chunks": chunks_count, "skipped": 0}
@@ -111,35 +164,35 @@ def migrate_precedents(db: DatabaseManager, dry_run: bool = False) -> dict:
     print("⚖️  판례 데이터 마이그레이션")
     print("=" * 50)
 
-    data = load_json("precedents.json")
-    if not data:
-        return {"docs": 0, "chunks": 0, "skipped": 0}
-
-    # 메타데이터 기반으로 고유 판례 추출
-    prec_groups: dict[str, list] = {}
-    for chunk_hash, chunk_data in data.items():
+    # 메타데이터 기반으로 고유 판례 추출 (스트리밍 파싱으로 1패스 그룹화)
+    total_chunks = 0
+    prec_groups: dict[str, list] = defaultdict(list)
+    for chunk_hash, chunk_data in iter_json_items("precedents.json"):
+        total_chunks += 1
         meta = chunk_data.get("metadata", {})
         prec_seq = meta.get("precedent_seq", "")
         if not prec_seq:
             continue
-        if prec_seq not in prec_groups:
-            prec_groups[prec_seq] = []
         prec_groups[prec_seq].append({
             "hash": chunk_hash,
             "text": chunk_data.get("text", ""),
             "metadata": meta,
         })
 
-    print(f"  발견: {len(prec_groups)}개 판례, {len(data)}개 청크")
+    if not total_chunks:
+        return {"docs": 0, "chunks": 0, "skipped": 0}
+
+    print(f"  발견: {len(prec_groups)}개 판례, {total_chunks}개 청크")
 
     if dry_run:
-        for prec_seq, chunks in list(prec_groups.items())[:3]:
+        for prec_seq, chunks in islice(prec_groups.items(), 3):
             meta = chunks[0]["metadata"]
             print(f"    - {meta.get('case_name', '?')} ({meta.get('court_name', '?')}, {len(chunks)}청크)")
-        return {"docs": len(prec_groups), "chunks": len(data), "skipped": 0}
+        return {"docs": len(prec_groups), "chunks": total_chunks, "skipped": 0}
 
     docs_count = 0
     chunks_count = 0
+    chunk_batch: list[dict] = []
 
     for prec_seq, chunks in prec_groups.items():
         meta = chunks[0]["metadata"]
@@ -155,16 +208,24 @@ def migrate_precedents(db: DatabaseManager, dry_run: bool = False) -> dict:
         )
         docs_count += 1
 
-        for chunk in chunks:
-            db.upsert_chunk(
-                chunk_hash=chunk["hash"],
-                source_type="precedent",
-                source_id=db_prec_id,
-                chunk_index=chunk["metadata"].get("chunk_index", 0),
-                content=chunk["text"],
-                metadata=chunk["metadata"],
-            )
-            chunks_count += 1
+        chunk_batch.extend(
+            {
+                "chunk_hash": chunk["hash"],
+                "source_type": "precedent",
+                "source_id": db_prec_id,
+                "chunk_index": chunk["metadata"].get("chunk_index", 0),
+                "content": chunk["text"],
+                "metadata": chunk["metadata"],
+            }
+            for chunk in chunks
+        )
+
+    # 재실행 시 이미 있는 해시는 SQLite까지 가기 전에 걸러낸다
+    # (INSERT OR IGNORE는 여전히 안전망으로 유지)
+    existing = _existing_hashes(db, "precedent")
+    if existing:
+        chunk_batch = [c for c in chunk_batch if c["chunk_hash"] not in existing]
+    chunks_count = db.upsert_chunks_many(chunk_batch)
 
     print(f"  완료: {docs_count}개 판례, {chunks_count}개 청크 이관")
     return {"docs": docs_count, "chunks": chunks_count, "skipped": 0}
@@ -177,53 +238,69 @@ def migrate_store_policies(db: DatabaseManager, dry_run: bool = False) -> dict:
     print("=" * 50)
 
     # 1. 하드코딩된 정책 데이터 (store_policy_data.py)
-    all_policies = APPLE_POLICIES + GOOGLE_POLICIES
-    print(f"  하드코딩 정책: Apple {len(APPLE_POLICIES)}개 + Google {len(GOOGLE_POLICIES)}개 = {len(all_policies)}개")
+    # 1회 순회뿐이므로 리스트 연결 대신 chain으로 복사 없이 이어붙인다
+    total_policies = len(APPLE_POLICIES) + len(GOOGLE_POLICIES)
+    print(f"  하드코딩 정책: Apple {len(APPLE_POLICIES)}개 + Google {len(GOOGLE_POLICIES)}개 = {total_policies}개")
 
     if dry_run:
-        for p in all_policies[:3]:
+        for p in islice(chain(APPLE_POLICIES, GOOGLE_POLICIES), 3):
             meta = p["metadata"]
             print(f"    - [{meta['store']}] {meta['section']} > {meta.get('subsection', '')}")
-        return {"docs": len(all_policies), "chunks": 0, "skipped": 0}
+        return {"docs": total_policies, "chunks": 0, "skipped": 0}
 
     docs_count = 0
     chunks_count = 0
-
-    for policy in all_policies:
-        meta = policy["metadata"]
-        db_policy_id = db.upsert_store_policy(
-            store=meta["store"],
-            section=meta["section"],
-            subsection=meta.get("subsection", ""),
-            content=policy["text"],
-            policy_name=meta.get("policy_name", ""),
-            effective_date=meta.get("effective_date"),
-        )
-        docs_count += 1
+    chunk_batch: list[dict] = []
+
+    # 정책 36건을 연결 1회로 일괄 upsert (정책당 연결·커밋 제거)
+    policy_ids = db.upsert_store_policies_many(
+        [
+            {
+                "store": policy["metadata"]["store"],
+                "section": policy["metadata"]["section"],
+                "subsection": policy["metadata"].get("subsection", ""),
+                "content": policy["text"],
+                "policy_name": policy["metadata"].get("policy_name", ""),
+                "effective_date": policy["metadata"].get("effective_date"),
+            }
+            for policy in chain(APPLE_POLICIES, GOOGLE_POLICIES)
+        ]
+    )
+    docs_count = len(policy_ids)
 
     # 2. JSON 청크 데이터
     data = load_json("store_policies.json")
     if data:
+        # 정책 DB ID는 (store, section) → id 맵을 1회 구성해 O(1)로 해석
+        # (청크마다 SELECT를 날리면 연결 획득 + 왕복이 N회)
+        policy_index: dict[tuple, str] = {}
+        with db.connection() as conn:
+            for row in conn.execute("SELECT id, store, section FROM store_policies"):
+                policy_index.setdefault((row["store"], row["section"]), row["id"])
+
         for chunk_hash, chunk_data in data.items():
             meta = chunk_data.get("metadata", {})
+            source_id = policy_index.get(
+                (meta.get("store", ""), meta.get("section", "")), "unknown"
+            )
 
-            # 매칭되는 정책의 DB ID를 찾기 위해 store+section으로 검색
-            with db.connection() as conn:
-                row = conn.execute(
-                    "SELECT id FROM store_policies WHERE store=? AND section=? LIMIT 1",
-                    (meta.get("store", ""), meta.get("section", "")),
-                ).fetchone()
-                source_id = row["id"] if row else "unknown"
-
-            db.upsert_chunk(
-                chunk_hash=chunk_hash,
-                source_type="store_policy",
-                source_id=source_id,
-                chunk_index=meta.get("chunk_index", 0),
-                content=chunk_data.get("text", ""),
-                metadata=meta,
+            chunk_batch.append(
+                {
+                    "chunk_hash": chunk_hash,
+                    "source_type": "store_policy",
+                    "source_id": source_id,
+                    "chunk_index": meta.get("chunk_index", 0),
+                    "content": chunk_data.get("text", ""),
+                    "metadata": meta,
+                }
             )
-            chunks_count += 1
+
+    # 재실행 시 이미 있는 해시는 SQLite까지 가기 전에 걸러낸다
+    # (INSERT OR IGNORE는 여전히 안전망으로 유지)
+    existing = _existing_hashes(db, "store_policy")
+    if existing:
+        chunk_batch = [c for c in chunk_batch if c["chunk_hash"] not in existing]
+    chunks_count = db.upsert_chunks_many(chunk_batch)
 
     print(f"  완료: {docs_count}개 정책, {chunks_count}개 청크 이관")
     return {"docs": docs_count, "chunks": chunks_count, "skipped": 0}
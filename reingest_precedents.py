@@ -10,6 +10,9 @@
 
 import sys
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
@@ -47,17 +50,26 @@ def main():
 
     total_chunks = 0
 
-    for i, query in enumerate(PRECEDENT_QUERIES, 1):
-        print(f"\n[{i}/{len(PRECEDENT_QUERIES)}] 키워드: '{query}'")
-        print("-" * 40)
-        chunks = ingest_precedents(query, max_items=10)
-        total_chunks += chunks
-        print(f"  → {chunks}청크 적재")
-
-    # 최종 결과
+    # 키워드별 수집은 네트워크 바운드 — 스레드 풀로 동시 실행해 API RTT를
+    # 겹친다 (스토어·DB 쓰기는 ingest_precedents 내부 잠금으로 직렬화됨)
+    print_lock = threading.Lock()
+    done = 0
+    with ThreadPoolExecutor(max_workers=6) as ex:
+        futures = {
+            ex.submit(ingest_precedents, query, 10): query
+            for query in PRECEDENT_QUERIES
+        }
+        for future in as_completed(futures):
+            query = futures[future]
+            chunks = future.result()
+            total_chunks += chunks
+            done += 1
+            with print_lock:
+                print(f"[{done}/{len(PRECEDENT_QUERIES)}] '{query}' → {chunks}청크 적재")
+
+    # 최종 결과 — 적재가 같은 프로세스의 싱글톤 스토어에서 수행되었으므로
+    # JSON 파일 전체를 다시 파싱(_load)할 필요 없이 메모리 상태를 그대로 사용
     store_final = get_or_create_collection(COLLECTION_PRECEDENTS)
-    # 캐시 갱신을 위해 reload
-    store_final._load()
     final_count = store_final.count()
 
     print(f"\n{'=' * 60}")
@@ -71,9 +83,9 @@ def main():
         print(f"\n샘플 데이터 확인 (상위 5건):")
         print("-" * 60)
         count = 0
-        for doc_id, doc in list(store_final._docs.items())[:5]:
-            meta = doc["metadata"]
-            text_preview = doc["text"][:120].replace("\n", " ")
+        for pos, doc_id in islice(enumerate(store_final._ids), 5):
+            meta = store_final._metadata_at(pos)
+            text_preview = store_final._texts[pos][:120].replace("\n", " ")
             print(f"  [{meta.get('case_name', '?')}]")
             print(f"    법원: {meta.get('court_name', '?')} | 날짜: {meta.get('judgment_date', '?')}")
             print(f"    텍스트: {text_preview}...")
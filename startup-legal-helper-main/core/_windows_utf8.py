@@ -0,0 +1,26 @@
+"""
+Windows 콘솔 UTF-8 출력 보정 헬퍼
+startup-legal-helper-main/core/_windows_utf8.py
+
+스크립트들이 제각각 TextIOWrapper로 stdout/stderr를 재포장하던 것을
+하나로 모았습니다. 재포장은 버퍼 계층을 한 겹 더 얹어 print가 많은
+적재 루프에서 write마다 비용이 들므로, 기존 스트림을 reconfigure로
+제자리 전환하고 이미 UTF-8이면 아무것도 하지 않습니다.
+"""
+
+import sys
+
+
+def ensure_utf8_stdio() -> None:
+    """win32 콘솔에서만, 인코딩이 UTF-8이 아닐 때만 스트림을 재구성"""
+    if sys.platform != "win32":
+        return
+    for stream in (sys.stdout, sys.stderr):
+        if stream is None:
+            continue
+        if (getattr(stream, "encoding", "") or "").lower() in ("utf-8", "utf8"):
+            continue
+        try:
+            stream.reconfigure(encoding="utf-8", errors="replace")
+        except AttributeError:
+            pass
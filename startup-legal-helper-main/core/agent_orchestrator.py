@@ -6,43 +6,112 @@ startup-legal-helper-main/core/agent_orchestrator.py
 협업하여 리스크를 분석하고 제보하는 Multi-Agent 워크플로우를 담당합니다.
 """
 
+import asyncio
+import functools
 import os
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 import anthropic
 from core.secret_manager import secret_manager
 
+
+@functools.lru_cache(maxsize=1)
+def _get_clients() -> Tuple[Optional[anthropic.Anthropic], Optional[anthropic.AsyncAnthropic]]:
+    """
+    (동기, 비동기) Claude 클라이언트 싱글톤
+
+    LegalAgentTeam이 요청마다 생성되는 Streamlit 환경에서 키 파싱과
+    커넥션 풀을 매번 다시 만들지 않도록 프로세스당 1회만 구성합니다.
+    """
+    api_key = secret_manager.get_anthropic_key()
+    if not api_key:
+        print("[LegalAgentTeam] Warning: ANTHROPIC_API_KEY가 설정되지 않았습니다.")
+        secret_manager.print_setup_guide()
+        return None, None
+    return anthropic.Anthropic(api_key=api_key), anthropic.AsyncAnthropic(api_key=api_key)
+
+
 class LegalAgentTeam:
     """
     Claude Multi-Agent 팀 관리 클래스
     """
     def __init__(self):
-        # SecretManager를 통한 안전한 키 로드
-        api_key = secret_manager.get_anthropic_key()
-        if not api_key:
-            print("[LegalAgentTeam] Warning: ANTHROPIC_API_KEY가 설정되지 않았습니다.")
-            secret_manager.print_setup_guide()
-            self.client = None
-        else:
-            self.client = anthropic.Anthropic(api_key=api_key)
+        # SecretManager를 통한 안전한 키 로드 (프로세스당 1회 — 캐시됨)
+        self.client, self.async_client = _get_clients()
         self.model = "claude-3-5-sonnet-latest"
 
+    def _build_phase_prompts(self, service_description: str, rag_context: str):
+        """3단계 프롬프트 빌더 — 2·3단계는 앞 단계 결과를 받아 포맷"""
+        legal_prompt = f"당신은 상업 법률 전문가입니다. 다음 서비스 설명과 검색된 법률/판례 근거를 바탕으로 핵심 리스크 3가지를 도출하십시오.\n\n[서비스 설명]\n{service_description}\n\n[검색된 법률 근거]\n{rag_context}"
+        tech_prompt = "당신은 기술 전략가입니다. 다음 리스크를 기술적으로 우회할 솔루션을 제안하십시오.\n\n[리스크]\n{legal}"
+        summary_prompt = "수석 리스크 분석가로서 다음 법률 분석과 기술 솔루션을 종합하여 최종 '출시 전략 리포트'를 작성하십시오.\n\n[법률]\n{legal}\n\n[기술]\n{tech}"
+        return legal_prompt, tech_prompt, summary_prompt
+
     def run_analysis_workflow(self, service_description: str, rag_context: str) -> str:
         """
         1. 법률 전문가 분석 -> 2. 기술 전략가 우회 제안 -> 3. 리스크 분석가 종합 리포트
+
+        비동기 스트리밍 파이프라인의 동기 래퍼 — 이미 이벤트 루프 안에서
+        호출된 경우(노트북 등)에만 순차 동기 경로로 폴백합니다.
+        """
+        try:
+            return asyncio.run(
+                self.run_analysis_workflow_async(service_description, rag_context)
+            )
+        except RuntimeError:
+            legal_prompt, tech_prompt, summary_prompt = self._build_phase_prompts(
+                service_description, rag_context
+            )
+            legal_analysis = self._call_claude([{"role": "user", "content": legal_prompt}])
+            tech_solutions = self._call_claude(
+                [{"role": "user", "content": tech_prompt.format(legal=legal_analysis)}]
+            )
+            return self._call_claude(
+                [{"role": "user", "content": summary_prompt.format(legal=legal_analysis, tech=tech_solutions)}]
+            )
+
+    async def run_analysis_workflow_async(self, service_description: str, rag_context: str) -> str:
+        """
+        3단계 파이프라인의 비동기 본체
+
+        단계 간 의존성(2←1, 3←1+2)은 그대로지만, 각 호출을 스트리밍으로
+        받아 마지막 토큰이 생성되는 즉시 다음 단계를 시작하므로 응답
+        직렬화·전송 대기가 다음 단계 준비와 겹칩니다.
         """
+        legal_prompt, tech_prompt, summary_prompt = self._build_phase_prompts(
+            service_description, rag_context
+        )
+
         # Phase 1: Legal Researcher Analysis
-        legal_prompt = f"당신은 상업 법률 전문가입니다. 다음 서비스 설명과 검색된 법률/판례 근거를 바탕으로 핵심 리스크 3가지를 도출하십시오.\n\n[서비스 설명]\n{service_description}\n\n[검색된 법률 근거]\n{rag_context}"
-        legal_analysis = self._call_claude([{"role": "user", "content": legal_prompt}])
-        
+        legal_analysis = await self._call_claude_async(
+            [{"role": "user", "content": legal_prompt}]
+        )
+
         # Phase 2: Technical Strategist Bypass Solution
-        tech_prompt = f"당신은 기술 전략가입니다. 다음 리스크를 기술적으로 우회할 솔루션을 제안하십시오.\n\n[리스크]\n{legal_analysis}"
-        tech_solutions = self._call_claude([{"role": "user", "content": tech_prompt}])
-        
+        tech_solutions = await self._call_claude_async(
+            [{"role": "user", "content": tech_prompt.format(legal=legal_analysis)}]
+        )
+
         # Phase 3: Final Synthesis
-        summary_prompt = f"수석 리스크 분석가로서 다음 법률 분석과 기술 솔루션을 종합하여 최종 '출시 전략 리포트'를 작성하십시오.\n\n[법률]\n{legal_analysis}\n\n[기술]\n{tech_solutions}"
-        final_report = self._call_claude([{"role": "user", "content": summary_prompt}])
-        
-        return final_report
+        return await self._call_claude_async(
+            [{"role": "user", "content": summary_prompt.format(legal=legal_analysis, tech=tech_solutions)}]
+        )
+
+    async def _call_claude_async(self, messages: List[Dict]) -> str:
+        if not self.async_client:
+            return "API 키가 설정되지 않아 에이전트 분석을 수행할 수 없습니다."
+
+        try:
+            parts: List[str] = []
+            async with self.async_client.messages.stream(
+                model=self.model,
+                max_tokens=4000,
+                messages=messages,
+            ) as stream:
+                async for text in stream.text_stream:
+                    parts.append(text)
+            return "".join(parts)
+        except Exception as e:
+            return f"에러 발생: {str(e)}"
 
     def get_chat_response(self, messages: List[Dict], context: str) -> str:
         """
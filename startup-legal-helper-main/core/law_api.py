@@ -8,11 +8,45 @@ SafeLaunch AI 프로젝트용 Python 버전
 import requests
 import xmltodict
 import json
+import time
+import xml.etree.ElementTree as _ET
+from requests.adapters import HTTPAdapter
 from typing import Optional, Literal
 from dataclasses import dataclass, field
+from urllib3.util.retry import Retry
+
+# 선택 의존성: diskcache — 응답 캐시를 디스크에 영속 (실행 간 공유)
+try:
+    import diskcache as _diskcache
+except ImportError:
+    _diskcache = None
 
 LAW_API_BASE_URL = "https://www.law.go.kr"
 
+# GET 호출은 멱등이므로 동일 질의 응답을 하루 동안 캐시
+_CACHE_TTL = 86400
+_disk_cache = _diskcache.Cache(".law_api_cache") if _diskcache is not None else None
+_mem_cache: dict = {}  # diskcache 부재 시 프로세스 내 TTL 폴백
+
+# 공유 세션 — 호출마다 TCP+TLS 핸드셰이크를 새로 하지 않도록 커넥션 풀을
+# 재사용하고, 일시 오류(429/5xx)는 urllib3 Retry가 지수 백오프로 재시도
+_SESSION = requests.Session()
+_SESSION.mount(
+    LAW_API_BASE_URL,
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=1.0,
+            backoff_jitter=1.0,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"],
+            respect_retry_after_header=True,
+        ),
+    ),
+)
+
 
 @dataclass
 class LawApiParams:
@@ -42,9 +76,60 @@ class LawApiParams:
         return params
 
 
+def _cache_get(key):
+    if _disk_cache is not None:
+        return _disk_cache.get(key)
+    entry = _mem_cache.get(key)
+    if entry is not None:
+        if entry[0] > time.monotonic():
+            return entry[1]
+        del _mem_cache[key]
+    return None
+
+
+def _cache_set(key, value):
+    if _disk_cache is not None:
+        _disk_cache.set(key, value, expire=_CACHE_TTL)
+    else:
+        _mem_cache[key] = (time.monotonic() + _CACHE_TTL, value)
+
+
+def _parse_search_xml(content: bytes) -> Optional[dict]:
+    """
+    lawSearch.do 검색 응답 전용 고속 파서
+
+    검색 응답은 루트 스칼라 + 반복 항목(law/prec)의 2단 평탄 구조라
+    ElementTree(C 구현)로 xmltodict와 동일한 dict 형태를 만들 수 있다.
+    예상 밖 중첩이 보이면 None을 반환해 xmltodict 경로로 폴백한다.
+    """
+    try:
+        root = _ET.fromstring(content)
+    except _ET.ParseError:
+        return None
+
+    out: dict = {}
+    items = []
+    item_tag = None
+    for child in root:
+        if len(child):  # 반복 항목 (law / prec)
+            entry = {}
+            for field_el in child:
+                if len(field_el):
+                    return None  # 항목 내부 중첩 — 일반 파서로 폴백
+                entry[field_el.tag] = field_el.text
+            items.append(entry)
+            item_tag = child.tag
+        else:
+            out[child.tag] = child.text
+    if item_tag is not None:
+        # xmltodict와 동일하게 단일 항목은 dict, 복수는 list
+        out[item_tag] = items if len(items) > 1 else items[0]
+    return {root.tag: out}
+
+
 def law_api_call(url_path: str, params: LawApiParams, timeout: int = 30) -> dict:
     """
-    법제처 API 요청
+    법제처 API 요청 — 구조화 응답(XML/JSON)은 (경로, 파라미터) 키로 TTL 캐시
 
     Args:
         url_path: API URL 경로 (예: "/DRF/lawSearch.do")
@@ -54,18 +139,37 @@ def law_api_call(url_path: str, params: LawApiParams, timeout: int = 30) -> dict
     Returns:
         dict: 파싱된 응답 (XML→dict 또는 JSON→dict)
     """
+    cache_key = None
+    if params.type in ("XML", "JSON"):
+        cache_key = (
+            url_path,
+            tuple(sorted((k, str(v)) for k, v in params.to_dict().items())),
+        )
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return cached
+
     url = LAW_API_BASE_URL + url_path
     try:
-        response = requests.get(url, params=params.to_dict(), timeout=timeout)
+        response = _SESSION.get(url, params=params.to_dict(), timeout=timeout)
         response.raise_for_status()
 
         if params.type == "XML":
-            return xmltodict.parse(response.content)
+            result = None
+            if url_path.endswith("lawSearch.do"):
+                # 검색 응답은 평탄 스키마 — ElementTree 고속 경로 우선
+                result = _parse_search_xml(response.content)
+            if result is None:
+                result = xmltodict.parse(response.content)
         elif params.type == "JSON":
-            return response.json()
+            result = response.json()
         else:
             return {"html": response.text}
 
+        if cache_key is not None:
+            _cache_set(cache_key, result)
+        return result
+
     except requests.exceptions.RequestException as e:
         print(f"[LawAPI Error] {e}")
         raise
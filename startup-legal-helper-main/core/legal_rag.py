@@ -13,14 +13,31 @@ SafeLaunch AI 프로젝트용
   향후 ChromaDB 전환 시 호출부 변경 없이 교체 가능.
 """
 
+import functools
 import json
 import os
 import re
-import hashlib
+import threading
 import numpy as np
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from typing import Optional
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+
+# 선택 의존성: orjson — C 구현 JSON 직렬화 (stdlib 대비 5~10배 빠름)
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# 선택 의존성: rank_bm25 — 역색인 기반 Okapi BM25 스코어러.
+# 쿼리 토큰을 포함한 문서만 채점하므로 전체 행렬 곱(O(N))보다 빠르고
+# 법률 검색에서 랭킹 품질도 대체로 더 좋음
+try:
+    from rank_bm25 import BM25Okapi as _BM25Okapi
+except ImportError:
+    _BM25Okapi = None
 
 from core.law_api import (
     search_laws,
@@ -50,109 +67,377 @@ ALL_COLLECTIONS = [COLLECTION_LAWS, COLLECTION_PRECEDENTS, COLLECTION_POLICIES]
 # Step 1: 벡터 스토어 (JSON 기반 영속 저장)
 # ─────────────────────────────────────────────────────────────
 
+# 무상태 해싱 벡터라이저 (한글 1~3글자 단위 + 공백 토큰) — 어휘 사전을
+# 만들지 않으므로 RAM에 vocabulary dict가 없고 특성 차원이 고정됨.
+# 가중치(IDF)와 정규화는 컬렉션별 TfidfTransformer가 담당
+_HASHER = HashingVectorizer(
+    analyzer="char_wb",
+    ngram_range=(1, 3),
+    n_features=2**18,
+    alternate_sign=False,
+    norm=None,
+    dtype=np.float32,
+)
+
+
+def _bm25_tokenize(text: str) -> list[str]:
+    """
+    BM25용 토크나이저
+
+    형태소 분석기 없이 공백 단어 + 단어 내 3글자 n-gram으로 분해해
+    한글 조사·합성어에 대한 부분 일치를 지원합니다.
+    """
+    tokens: list[str] = []
+    for word in text.split():
+        tokens.append(word)
+        if len(word) > 3:
+            tokens.extend(word[i : i + 3] for i in range(len(word) - 2))
+    return tokens
+
+
 class VectorStore:
     """
     TF-IDF 기반 벡터 스토어
 
     - database/<collection>.json 파일에 문서·메타데이터를 저장
-    - 검색 시 TF-IDF 벡터라이저를 즉시 생성하여 코사인 유사도 계산
+    - TF-IDF 인덱스는 문서 변경 후 첫 검색 시 1회 구축하여 캐시
     - upsert로 중복 방지 (문서 ID 기반)
     """
 
-    def __init__(self, name: str, db_path: str = DATABASE_PATH):
+    def __init__(self, name: str, db_path: str = DATABASE_PATH, backend: str = "tfidf"):
         self.name = name
         self.db_path = db_path
         self._file_path = os.path.join(db_path, f"{name}.json")
-        self._docs: dict[str, dict] = {}  # id → {"text", "metadata"}
+        # 검색 백엔드 — "tfidf"(기본) 또는 "bm25" (rank_bm25 설치 시)
+        if backend == "bm25" and _BM25Okapi is None:
+            print("[LegalRAG] rank_bm25 미설치 — tfidf 백엔드로 대체합니다")
+            backend = "tfidf"
+        self.backend = backend
+        # 메타데이터 정규화 저장 — 청크마다 원천 메타데이터 전체를 복사하는
+        # 대신 sources에 1회만 두고 청크는 source_id로 참조 (파일/RAM 절감)
+        self._chunks: dict[str, dict] = {}  # id → {"text", "source_id", "chunk_index"}
+        self._sources: dict[str, dict] = {}  # source_id → 공통 메타데이터
+        # TF-IDF 인덱스 캐시 — upsert/clear 시 무효화, query 시 지연 재구축
+        self._doc_ids: list[str] = []
+        self._tfidf: Optional[TfidfTransformer] = None
+        self._tfidf_matrix = None
+        self._bm25 = None
+        self._dirty = True
+        self._autoflush = True
+        # JSON 파싱은 첫 접근 시점까지 지연 — 사용하지 않는 컬렉션 때문에
+        # 프로세스 기동이 코퍼스 크기에 비례해 느려지지 않도록 함
+        self._loaded = False
+
+    def _ensure_loaded(self) -> None:
+        """지연 로드 — 실제로 접근하는 첫 시점에 1회만 파싱"""
+        if self._loaded:
+            return
+        self._loaded = True
         self._load()
+        if self._chunks:
+            self._load_index_cache()
 
     def _load(self) -> None:
         """JSON 파일에서 기존 데이터 로드"""
         if os.path.exists(self._file_path):
             try:
-                with open(self._file_path, "r", encoding="utf-8") as f:
-                    self._docs = json.load(f)
-            except (json.JSONDecodeError, OSError):
-                self._docs = {}
+                with open(self._file_path, "rb") as f:
+                    raw = f.read()
+                data = _orjson.loads(raw) if _orjson is not None else json.loads(raw)
+            except (ValueError, OSError):
+                return
+            if "chunks" in data and "sources" in data:
+                self._chunks = data["chunks"]
+                self._sources = data["sources"]
+            else:
+                # 구 포맷(id → {"text", "metadata"}) 호환 — 읽으며 정규화
+                for doc_id, entry in data.items():
+                    self._store_chunk(doc_id, entry["text"], entry["metadata"])
 
     def _save(self) -> None:
-        """현재 데이터를 JSON 파일에 저장"""
+        """현재 데이터를 JSON 파일에 저장 (임시 파일 + os.replace로 원자적 교체)"""
         os.makedirs(self.db_path, exist_ok=True)
-        with open(self._file_path, "w", encoding="utf-8") as f:
-            json.dump(self._docs, f, ensure_ascii=False, indent=2)
+        tmp_path = self._file_path + ".tmp"
+        payload = {"sources": self._sources, "chunks": self._chunks}
+        if _orjson is not None:
+            with open(tmp_path, "wb") as f:
+                f.write(_orjson.dumps(payload, option=_orjson.OPT_INDENT_2))
+        else:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self._file_path)
+
+    def _store_chunk(self, doc_id: str, text: str, metadata: dict) -> None:
+        """청크 1건을 정규화 저장 (공통 메타데이터는 sources에 1회만)"""
+        source_id = metadata.get("source_id") or doc_id
+        self._sources[source_id] = {
+            k: v for k, v in metadata.items() if k != "chunk_index"
+        }
+        self._chunks[doc_id] = {
+            "text": text,
+            "source_id": source_id,
+            "chunk_index": metadata.get("chunk_index", 0),
+        }
+
+    def _metadata_of(self, doc_id: str) -> dict:
+        """청크 메타데이터 복원 (sources 공통분 + chunk_index)"""
+        chunk = self._chunks[doc_id]
+        source_meta = self._sources.get(chunk["source_id"], {})
+        return {**source_meta, "chunk_index": chunk["chunk_index"]}
 
     def upsert(
         self,
         ids: list[str],
         documents: list[str],
         metadatas: list[dict],
+        flush: bool = True,
     ) -> None:
-        """문서 추가/갱신 (ID 기반 중복 방지)"""
+        """
+        문서 추가/갱신 (ID 기반 중복 방지)
+
+        flush=False면 JSON 파일을 즉시 다시 쓰지 않습니다 — 대량 적재
+        루프에서는 bulk_load() 또는 마지막에 flush()를 사용하세요.
+        """
+        self._ensure_loaded()
         for doc_id, text, meta in zip(ids, documents, metadatas):
-            self._docs[doc_id] = {"text": text, "metadata": meta}
+            self._store_chunk(doc_id, text, meta)
+        self._dirty = True
+        if flush and self._autoflush:
+            self._save()
+        _invalidate_search_cache()
+
+    def flush(self) -> None:
+        """지연된 변경 사항을 JSON 파일에 1회 기록"""
         self._save()
 
+    @contextmanager
+    def bulk_load(self):
+        """
+        대량 적재 구간에서 문서별 전체 파일 재기록을 멈추는 컨텍스트 매니저
+
+        블록을 벗어날 때(예외 포함) 1회만 저장합니다.
+        """
+        self._autoflush = False
+        try:
+            yield self
+        finally:
+            self._autoflush = True
+            self._save()
+
     def count(self) -> int:
-        return len(self._docs)
+        self._ensure_loaded()
+        return len(self._chunks)
 
-    def query(
+    def _index_cache_path(self) -> str:
+        return os.path.join(self.db_path, f"{self.name}_index.pkl")
+
+    def _rebuild_index(self) -> None:
+        """
+        TF-IDF 인덱스 (재)구축
+
+        코퍼스 전체 fit은 문서 변경 후 첫 query에서 1회만 수행하고,
+        이후 query는 쿼리문 transform 1회 + 행렬 곱만 수행합니다.
+        """
+        self._doc_ids = list(self._chunks.keys())
+        doc_texts = [self._chunks[d]["text"] for d in self._doc_ids]
+
+        if self.backend == "bm25":
+            # 역색인 기반 — 쿼리 토큰을 포함한 문서만 채점
+            self._bm25 = _BM25Okapi([_bm25_tokenize(t) for t in doc_texts]) if doc_texts else None
+            self._tfidf = None
+            self._tfidf_matrix = None
+            self._dirty = False
+            self._save_index_cache()
+            return
+
+        try:
+            # 해싱은 무상태라 어휘 사전 fit이 필요 없음 — 코퍼스 스캔은
+            # IDF 통계를 위한 TfidfTransformer.fit 한 번으로 충분
+            counts = _HASHER.transform(doc_texts)
+            tfidf = TfidfTransformer().fit(counts)
+            self._tfidf_matrix = tfidf.transform(counts)
+            self._tfidf = tfidf
+        except ValueError:
+            # 문서가 비어있거나 벡터화 실패
+            self._tfidf_matrix = None
+            self._tfidf = None
+
+        self._dirty = False
+        self._save_index_cache()
+
+    def _save_index_cache(self) -> None:
+        """fit된 인덱스를 피클로 저장 (프로세스 재시작 시 전체 재적합 회피)"""
+        try:
+            import pickle
+
+            os.makedirs(self.db_path, exist_ok=True)
+            with open(self._index_cache_path(), "wb") as f:
+                pickle.dump(
+                    {
+                        "backend": self.backend,
+                        "doc_ids": self._doc_ids,
+                        "tfidf": self._tfidf,
+                        "matrix": self._tfidf_matrix,
+                        "bm25": self._bm25,
+                    },
+                    f,
+                )
+        except Exception as e:
+            print(f"[LegalRAG] 인덱스 캐시 저장 실패 (무시): {e}")
+
+    def _load_index_cache(self) -> None:
+        """피클 인덱스 캐시 로드 — 문서 집합과 일치할 때만 사용"""
+        try:
+            import pickle
+
+            path = self._index_cache_path()
+            if not os.path.exists(path):
+                return
+            with open(path, "rb") as f:
+                cached = pickle.load(f)
+            if cached.get("backend", "tfidf") != self.backend:
+                return
+            if set(cached["doc_ids"]) != set(self._chunks.keys()):
+                return
+            self._doc_ids = cached["doc_ids"]
+            self._tfidf = cached["tfidf"]
+            self._tfidf_matrix = cached["matrix"]
+            self._bm25 = cached.get("bm25")
+            self._dirty = False
+        except Exception as e:
+            print(f"[LegalRAG] 인덱스 캐시 로드 실패 — 재구축: {e}")
+
+    def _query_topk(
         self,
         query_text: str,
-        n_results: int = 5,
-    ) -> list[dict]:
+        n_results: int,
+    ) -> tuple[np.ndarray, list[str]]:
         """
-        TF-IDF 코사인 유사도 기반 검색
+        상위 n_results의 (점수 배열, 문서 ID 리스트) 반환 — dict 미생성
 
-        Returns:
-            [{"text": str, "metadata": dict, "score": float}, ...]
-            score가 높을수록 유사 (0~1)
+        배열 경로로 작업하는 내부 호출자(_search_cached)가 컬렉션 간 병합
+        후 생존한 k개에 대해서만 dict를 만들 수 있도록 분리한 검색 본체.
         """
-        if not self._docs:
-            return []
+        empty = (np.empty(0, dtype=np.float32), [])
+        self._ensure_loaded()
+        if not self._chunks:
+            return empty
+
+        if self._dirty or (self._tfidf is None and self._bm25 is None):
+            self._rebuild_index()
+
+        doc_ids = self._doc_ids
+
+        if self.backend == "bm25":
+            if self._bm25 is None:
+                return empty
+            scores = self._bm25.get_scores(_bm25_tokenize(query_text))
+            # BM25 점수는 상한이 없으므로 쿼리별 최대값으로 나눠
+            # 기존 0~1 스케일(임계치 필터)과 맞춤
+            max_score = float(scores.max()) if scores.size else 0.0
+            similarities = scores / max_score if max_score > 0 else scores
+        else:
+            if self._tfidf is None or self._tfidf_matrix is None:
+                return empty
 
-        doc_ids = list(self._docs.keys())
-        doc_texts = [self._docs[d]["text"] for d in doc_ids]
+            try:
+                query_vec = self._tfidf.transform(_HASHER.transform([query_text]))
+            except ValueError:
+                return empty
+
+            # TfidfTransformer가 기본값(norm='l2')으로 행을 정규화해 두므로
+            # 코사인 유사도는 희소 내적만으로 동일하게 계산됨
+            similarities = (self._tfidf_matrix @ query_vec.T).toarray().ravel()
+
+        # 상위 n_results 인덱스 (내림차순) — 전체 정렬 대신 부분 선별 후
+        # 상위 k개만 정렬 (O(N log N) → O(N) + O(k log k))
+        k = min(n_results, similarities.shape[0])
+        idx = np.argpartition(similarities, -k)[-k:]
+        top_indices = idx[np.argsort(similarities[idx])[::-1]]
+
+        top_scores = similarities[top_indices]
+        positive = top_scores > 0
+        top_indices = top_indices[positive]
+        return top_scores[positive], [doc_ids[i] for i in top_indices]
+
+    def _query_topk_many(
+        self,
+        query_texts: list[str],
+        n_results: int,
+    ) -> list[tuple[np.ndarray, list[str]]]:
+        """
+        쿼리 여러 건을 한 번의 변환·행렬곱으로 채점 — 쿼리별 (점수, ID) 반환
 
-        # TF-IDF 벡터라이저 (한글 1~3글자 단위 + 공백 토큰)
-        vectorizer = TfidfVectorizer(
-            analyzer="char_wb",
-            ngram_range=(1, 3),
-            max_features=10000,
-        )
+        TF-IDF 경로는 쿼리 B건을 한 번에 변환한 뒤 (N, V) 문서 행렬과의
+        희소 행렬곱 1회로 동시에 채점합니다. BM25 백엔드는 본질적으로
+        쿼리별 루프이므로 _query_topk를 순회합니다.
+        """
+        empty = (np.empty(0, dtype=np.float32), [])
+        self._ensure_loaded()
+        if not self._chunks:
+            return [empty for _ in query_texts]
 
-        try:
-            tfidf_matrix = vectorizer.fit_transform(doc_texts)
-            query_vec = vectorizer.transform([query_text])
-        except ValueError:
-            # 문서가 비어있거나 벡터화 실패
-            return []
+        if self._dirty or (self._tfidf is None and self._bm25 is None):
+            self._rebuild_index()
 
-        similarities = cosine_similarity(query_vec, tfidf_matrix).flatten()
+        if self.backend == "bm25" or self._tfidf is None or self._tfidf_matrix is None:
+            return [self._query_topk(q, n_results) for q in query_texts]
 
-        # 상위 n_results 인덱스 (내림차순)
-        top_indices = np.argsort(similarities)[::-1][:n_results]
+        try:
+            query_mat = self._tfidf.transform(_HASHER.transform(query_texts))
+        except ValueError:
+            return [empty for _ in query_texts]
+
+        # (N, B) 유사도 — 문서 행이 l2 정규화돼 있어 희소 내적 = 코사인
+        sims = (self._tfidf_matrix @ query_mat.T).toarray()
+
+        doc_ids = self._doc_ids
+        k = min(n_results, sims.shape[0])
+        out: list[tuple[np.ndarray, list[str]]] = []
+        for col in range(sims.shape[1]):
+            similarities = sims[:, col]
+            idx = np.argpartition(similarities, -k)[-k:]
+            top_indices = idx[np.argsort(similarities[idx])[::-1]]
+            top_scores = similarities[top_indices]
+            positive = top_scores > 0
+            top_indices = top_indices[positive]
+            out.append((top_scores[positive], [doc_ids[i] for i in top_indices]))
+        return out
+
+    def _hit_dict(self, doc_id: str, score: float) -> dict:
+        """생존한 상위 결과 1건을 API 경계용 dict로 변환"""
+        return {
+            "text": self._chunks[doc_id]["text"],
+            "metadata": self._metadata_of(doc_id),
+            "score": round(float(score), 4),
+        }
 
-        results = []
-        for idx in top_indices:
-            score = float(similarities[idx])
-            if score <= 0:
-                continue
-            did = doc_ids[idx]
-            results.append(
-                {
-                    "text": self._docs[did]["text"],
-                    "metadata": self._docs[did]["metadata"],
-                    "score": round(score, 4),
-                }
-            )
+    def query(
+        self,
+        query_text: str,
+        n_results: int = 5,
+    ) -> list[dict]:
+        """
+        TF-IDF 코사인 유사도 기반 검색
 
-        return results
+        Returns:
+            [{"text": str, "metadata": dict, "score": float}, ...]
+            score가 높을수록 유사 (0~1)
+        """
+        scores, ids = self._query_topk(query_text, n_results)
+        return [self._hit_dict(did, score) for score, did in zip(scores, ids)]
 
     def clear(self) -> None:
         """컬렉션 초기화"""
-        self._docs = {}
+        self._chunks = {}
+        self._sources = {}
+        self._loaded = True
+        self._dirty = True
         if os.path.exists(self._file_path):
             os.remove(self._file_path)
+        if os.path.exists(self._index_cache_path()):
+            os.remove(self._index_cache_path())
+        _invalidate_search_cache()
 
 
 # 컬렉션 캐시 (싱글톤)
@@ -170,18 +455,48 @@ def get_or_create_collection(name: str) -> VectorStore:
 # Step 2: 데이터 청킹 (Context-aware Chunking)
 # ─────────────────────────────────────────────────────────────
 
+# HTML 정제 패턴 — 청크마다 재컴파일하지 않도록 모듈 로드 시 1회 컴파일
+_RE_TAG = re.compile(r"<[^>]+>")
+_RE_ENT = re.compile(r"&[a-zA-Z]+;")
+_RE_WS = re.compile(r"\s+")
+
+# 선택 의존성: selectolax — C 구현 HTML 파서 (태그·엔티티를 한 번에 처리)
+try:
+    from selectolax.parser import HTMLParser as _HTMLParser
+except ImportError:
+    _HTMLParser = None
+
+
 def _clean_html(text: str) -> str:
     """HTML 태그 및 노이즈 제거"""
-    text = re.sub(r"<[^>]+>", "", text)
-    text = re.sub(r"&[a-zA-Z]+;", " ", text)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
+    if _HTMLParser is not None and "<" in text:
+        return _RE_WS.sub(" ", _HTMLParser(text).text(separator=" ")).strip()
+    return _RE_WS.sub(" ", _RE_ENT.sub(" ", _RE_TAG.sub("", text))).strip()
+
+
+# 청크 ID 해시 — 암호학적 강도가 불필요하므로 MD5 대신 BLAKE 계열 사용
+# (blake3 미설치 시 stdlib blake2b로 대체 — 둘 다 MD5보다 빠름)
+try:
+    from blake3 import blake3 as _id_hasher
+except ImportError:
+    from hashlib import blake2b as _id_hasher
 
 
 def _generate_chunk_id(source_id: str, chunk_index: int) -> str:
     """청크 고유 ID 생성 (중복 적재 방지용)"""
     raw = f"{source_id}_chunk_{chunk_index}"
-    return hashlib.md5(raw.encode()).hexdigest()
+    return _id_hasher(raw.encode()).hexdigest()[:32]
+
+
+# 청킹 결과 메모이제이션 — 동기화 쿼리가 겹치면 동일 본문이 반복 적재되므로
+# 내용 해시 기준으로 분할 결과를 재사용 (LRU, 상한 2048건)
+try:
+    from blake3 import blake3 as _content_hasher
+except ImportError:
+    from hashlib import sha1 as _content_hasher
+
+_chunk_text_cache: OrderedDict[str, list[str]] = OrderedDict()
+_CHUNK_CACHE_MAX = 2048
 
 
 def chunk_law_text(
@@ -211,6 +526,28 @@ def chunk_law_text(
 
     source_id = metadata.get("source_id", "unknown")
 
+    # 내용 해시 기준 캐시 조회 — 동일 본문·동일 파라미터면 분할을 건너뜀
+    cache_key = (
+        f"{_content_hasher(cleaned.encode()).hexdigest()}|{chunk_size}|{overlap}"
+    )
+    texts = _chunk_text_cache.get(cache_key)
+    if texts is not None:
+        _chunk_text_cache.move_to_end(cache_key)
+    else:
+        texts = _split_chunk_texts(cleaned, chunk_size, overlap)
+        _chunk_text_cache[cache_key] = texts
+        if len(_chunk_text_cache) > _CHUNK_CACHE_MAX:
+            _chunk_text_cache.popitem(last=False)
+
+    # ID·메타데이터는 호출마다 현재 값으로 구성 (캐시는 텍스트 분할만 공유)
+    chunks: list[dict] = []
+    for chunk_text in texts:
+        _append_chunk(chunks, chunk_text, metadata, source_id)
+    return chunks
+
+
+def _split_chunk_texts(cleaned: str, chunk_size: int, overlap: int) -> list[str]:
+    """정제된 텍스트를 조문 경계 우선으로 분할해 청크 텍스트 목록 반환"""
     # 조문 경계(제N조) 기준 분할 시도
     segments = re.split(r"(?=제\d+조[\s(])", cleaned)
     segments = [s.strip() for s in segments if s.strip()]
@@ -219,34 +556,42 @@ def chunk_law_text(
     if not segments:
         segments = [cleaned]
 
-    chunks: list[dict] = []
-    current = ""
+    texts: list[str] = []
+    # 문자열 += 대신 리스트 버퍼 + join — 세그먼트가 많은 문서에서
+    # 반복 연결의 O(k²) 재할당을 피함 (길이는 별도 카운터로 추적)
+    buf: list[str] = []
+    buf_len = 0
 
     for segment in segments:
         # 현재 버퍼 + 세그먼트가 한도 내이면 합치기
-        if len(current) + len(segment) + 1 <= chunk_size:
-            current += (" " if current else "") + segment
+        if buf_len + len(segment) + 1 <= chunk_size:
+            buf.append(segment)
+            buf_len += len(segment) + 1
             continue
 
         # 버퍼가 찼으면 청크로 확정
-        if current:
-            _append_chunk(chunks, current, metadata, source_id)
+        if buf:
+            texts.append(" ".join(buf))
+            buf.clear()
+            buf_len = 0
 
         # 세그먼트 자체가 한도 초과이면 글자 수 기반 분할
         if len(segment) > chunk_size:
             for i in range(0, len(segment), chunk_size - overlap):
                 sub = segment[i : i + chunk_size].strip()
                 if sub:
-                    _append_chunk(chunks, sub, metadata, source_id)
-            current = ""
+                    texts.append(sub)
         else:
-            current = segment
+            buf.append(segment)
+            buf_len = len(segment) + 1
 
     # 마지막 잔여 버퍼
-    if current.strip():
-        _append_chunk(chunks, current.strip(), metadata, source_id)
+    if buf:
+        remainder = " ".join(buf).strip()
+        if remainder:
+            texts.append(remainder)
 
-    return chunks
+    return texts
 
 
 def _append_chunk(
@@ -338,32 +683,67 @@ def _extract_precedent_text(detail: dict) -> str:
 
 
 def _extract_text_from_html_dict(html_dict: dict) -> str:
-    """HTML dict 구조에서 텍스트 콘텐츠 추출"""
+    """
+    HTML dict 구조에서 텍스트 콘텐츠 추출
+
+    재귀 대신 명시적 스택으로 순회하고, 정리 후에도 30자를 넘을 수 없는
+    짧은 문자열은 정규식 정리 전에 길이로 걸러냅니다 (XML→dict 출력의
+    노드 대다수가 짧은 문자열이므로 정규식 3회 호출을 대부분 생략).
+    """
     texts: list[str] = []
 
-    def _walk(obj: object) -> None:
+    stack: deque = deque([html_dict])
+    while stack:
+        obj = stack.pop()
         if isinstance(obj, str):
+            if len(obj) <= 30:
+                continue
             cleaned = _clean_html(obj)
             if cleaned and len(cleaned) > 30:
                 texts.append(cleaned)
         elif isinstance(obj, dict):
-            # #text 키는 직접 텍스트 노드
-            if "#text" in obj:
-                val = obj["#text"]
-                if isinstance(val, str):
-                    cleaned = _clean_html(val)
-                    if cleaned and len(cleaned) > 30:
-                        texts.append(cleaned)
-            for v in obj.values():
-                _walk(v)
+            # LIFO 스택이므로 역순으로 넣어 문서 순서 유지
+            # (#text 키는 직접 텍스트 노드 — 값 순회에서 함께 처리됨)
+            stack.extend(reversed(list(obj.values())))
         elif isinstance(obj, list):
-            for item in obj:
-                _walk(item)
+            stack.extend(reversed(obj))
 
-    _walk(html_dict)
     return "\n".join(texts)
 
 
+_FETCH_MAX_WORKERS = 16
+
+
+def _fetch_details_parallel(fetch_fn, items: list[tuple[str, dict]]) -> dict[str, object]:
+    """
+    상세 조회 API 병렬 호출
+
+    상세 조회는 네트워크 지연이 지배적이므로 스레드 풀로 팬아웃합니다
+    (소켓 I/O 동안 GIL이 해제되어 동시 요청이 겹쳐짐).
+    실패한 항목은 예외 객체를 값으로 담아 호출부에서 개별 처리합니다.
+
+    Args:
+        fetch_fn: 상세 조회 함수 (ID 1개 → dict)
+        items: (ID, 원본 검색 항목) 쌍 리스트
+
+    Returns:
+        ID → 상세 dict 또는 Exception
+    """
+    results: dict[str, object] = {}
+    if not items:
+        return results
+    workers = min(_FETCH_MAX_WORKERS, len(items))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(fetch_fn, item_id): item_id for item_id, _ in items}
+        for future in as_completed(futures):
+            item_id = futures[future]
+            try:
+                results[item_id] = future.result()
+            except Exception as e:
+                results[item_id] = e
+    return results
+
+
 def ingest_laws(query: str, max_items: int = 100) -> int:
     """
     법령 검색 → 상세 조회 → 청킹 → 벡터 스토어 저장
@@ -387,40 +767,47 @@ def ingest_laws(query: str, max_items: int = 100) -> int:
         print(f"[LegalRAG] 법령 검색 실패: {e}")
         return 0
 
-    for law in laws[:max_items]:
-        law_id = law.get("법령일련번호", "")
-        law_name = law.get("법령명한글", "")
-        if not law_id:
-            continue
-
-        try:
-            detail = get_law_detail(law_id)
-            law_content = _extract_law_text(detail)
-            if not law_content:
-                continue
+    targets = [
+        (law.get("법령일련번호", ""), law)
+        for law in laws[:max_items]
+        if law.get("법령일련번호", "")
+    ]
+    details = _fetch_details_parallel(get_law_detail, targets)
 
-            metadata = {
-                "source_type": "law",
-                "source_id": f"law_{law_id}",
-                "law_id": str(law_id),
-                "law_name": str(law_name),
-                "proclamation_date": str(law.get("공포일자", "")),
-                "enforcement_date": str(law.get("시행일자", "")),
-            }
+    with store.bulk_load():
+        for law_id, law in targets:
+            law_name = law.get("법령명한글", "")
+            detail = details.get(law_id)
 
-            chunks = chunk_law_text(law_content, metadata)
-            if chunks:
-                store.upsert(
-                    ids=[c["id"] for c in chunks],
-                    documents=[c["text"] for c in chunks],
-                    metadatas=[c["metadata"] for c in chunks],
-                )
-                total_chunks += len(chunks)
-                print(f"[LegalRAG] 법령 적재: {law_name} ({len(chunks)}청크)")
+            try:
+                if isinstance(detail, Exception):
+                    raise detail
+                law_content = _extract_law_text(detail)
+                if not law_content:
+                    continue
+
+                metadata = {
+                    "source_type": "law",
+                    "source_id": f"law_{law_id}",
+                    "law_id": str(law_id),
+                    "law_name": str(law_name),
+                    "proclamation_date": str(law.get("공포일자", "")),
+                    "enforcement_date": str(law.get("시행일자", "")),
+                }
 
-        except Exception as e:
-            print(f"[LegalRAG] 법령 상세 조회 실패 ({law_name}): {e}")
-            continue
+                chunks = chunk_law_text(law_content, metadata)
+                if chunks:
+                    store.upsert(
+                        ids=[c["id"] for c in chunks],
+                        documents=[c["text"] for c in chunks],
+                        metadatas=[c["metadata"] for c in chunks],
+                    )
+                    total_chunks += len(chunks)
+                    print(f"[LegalRAG] 법령 적재: {law_name} ({len(chunks)}청크)")
+
+            except Exception as e:
+                print(f"[LegalRAG] 법령 상세 조회 실패 ({law_name}): {e}")
+                continue
 
     return total_chunks
 
@@ -448,40 +835,47 @@ def ingest_precedents(query: str, max_items: int = 50) -> int:
         print(f"[LegalRAG] 판례 검색 실패: {e}")
         return 0
 
-    for prec in precs[:max_items]:
-        prec_seq = prec.get("판례일련번호", "")
-        case_name = prec.get("사건명", "")
-        if not prec_seq:
-            continue
-
-        try:
-            detail = get_precedent_detail(prec_seq)
-            prec_content = _extract_precedent_text(detail)
-            if not prec_content:
-                continue
+    targets = [
+        (prec.get("판례일련번호", ""), prec)
+        for prec in precs[:max_items]
+        if prec.get("판례일련번호", "")
+    ]
+    details = _fetch_details_parallel(get_precedent_detail, targets)
 
-            metadata = {
-                "source_type": "precedent",
-                "source_id": f"prec_{prec_seq}",
-                "precedent_seq": str(prec_seq),
-                "case_name": str(case_name),
-                "court_name": str(prec.get("법원명", "")),
-                "judgment_date": str(prec.get("선고일자", "")),
-            }
+    with store.bulk_load():
+        for prec_seq, prec in targets:
+            case_name = prec.get("사건명", "")
+            detail = details.get(prec_seq)
 
-            chunks = chunk_law_text(prec_content, metadata)
-            if chunks:
-                store.upsert(
-                    ids=[c["id"] for c in chunks],
-                    documents=[c["text"] for c in chunks],
-                    metadatas=[c["metadata"] for c in chunks],
-                )
-                total_chunks += len(chunks)
-                print(f"[LegalRAG] 판례 적재: {case_name} ({len(chunks)}청크)")
+            try:
+                if isinstance(detail, Exception):
+                    raise detail
+                prec_content = _extract_precedent_text(detail)
+                if not prec_content:
+                    continue
+
+                metadata = {
+                    "source_type": "precedent",
+                    "source_id": f"prec_{prec_seq}",
+                    "precedent_seq": str(prec_seq),
+                    "case_name": str(case_name),
+                    "court_name": str(prec.get("법원명", "")),
+                    "judgment_date": str(prec.get("선고일자", "")),
+                }
 
-        except Exception as e:
-            print(f"[LegalRAG] 판례 상세 조회 실패 ({case_name}): {e}")
-            continue
+                chunks = chunk_law_text(prec_content, metadata)
+                if chunks:
+                    store.upsert(
+                        ids=[c["id"] for c in chunks],
+                        documents=[c["text"] for c in chunks],
+                        metadatas=[c["metadata"] for c in chunks],
+                    )
+                    total_chunks += len(chunks)
+                    print(f"[LegalRAG] 판례 적재: {case_name} ({len(chunks)}청크)")
+
+            except Exception as e:
+                print(f"[LegalRAG] 판례 상세 조회 실패 ({case_name}): {e}")
+                continue
 
     return total_chunks
 
@@ -511,35 +905,36 @@ def ingest_store_policies(
 
     total_chunks = 0
 
-    for idx, policy in enumerate(policies):
-        text = policy.get("text", "")
-        metadata = policy.get("metadata", {})
-        if not text:
-            continue
+    with store.bulk_load():
+        for idx, policy in enumerate(policies):
+            text = policy.get("text", "")
+            metadata = policy.get("metadata", {})
+            if not text:
+                continue
 
-        metadata.setdefault("source_type", "store_policy")
-        source_id = metadata.get(
-            "source_id",
-            f"{metadata.get('store', 'unknown')}"
-            f"_{metadata.get('section', 'unknown')}"
-            f"_{metadata.get('subsection', str(idx))}",
-        )
-        metadata["source_id"] = source_id
-
-        chunks = chunk_law_text(text, metadata)
-        if chunks:
-            store.upsert(
-                ids=[c["id"] for c in chunks],
-                documents=[c["text"] for c in chunks],
-                metadatas=[c["metadata"] for c in chunks],
-            )
-            total_chunks += len(chunks)
-            section = metadata.get("section", "?")
-            store_name = metadata.get("store", "?")
-            print(
-                f"[LegalRAG] 스토어 정책 적재: [{store_name}] {section}"
-                f" ({len(chunks)}청크)"
+            metadata.setdefault("source_type", "store_policy")
+            source_id = metadata.get(
+                "source_id",
+                f"{metadata.get('store', 'unknown')}"
+                f"_{metadata.get('section', 'unknown')}"
+                f"_{metadata.get('subsection', str(idx))}",
             )
+            metadata["source_id"] = source_id
+
+            chunks = chunk_law_text(text, metadata)
+            if chunks:
+                store.upsert(
+                    ids=[c["id"] for c in chunks],
+                    documents=[c["text"] for c in chunks],
+                    metadatas=[c["metadata"] for c in chunks],
+                )
+                total_chunks += len(chunks)
+                section = metadata.get("section", "?")
+                store_name = metadata.get("store", "?")
+                print(
+                    f"[LegalRAG] 스토어 정책 적재: [{store_name}] {section}"
+                    f" ({len(chunks)}청크)"
+                )
 
     return total_chunks
 
@@ -548,6 +943,87 @@ def ingest_store_policies(
 # Step 4: 유사도 검색 (API명세서 3.2 준수)
 # ─────────────────────────────────────────────────────────────
 
+# 컬렉션별 검색은 독립적이고 scipy/NumPy 구간에서 GIL을 해제하므로
+# 공용 스레드 풀로 병렬 수행 (지연 시간 = 3개 합 → 가장 느린 1개 수준)
+_search_pool = ThreadPoolExecutor(max_workers=len(ALL_COLLECTIONS))
+
+
+def _query_collection(col_name: str, query: str, top_k: int):
+    """단일 컬렉션 검색 (검색 풀 워커에서 실행) — (스토어, 점수, ID) 반환"""
+    store = get_or_create_collection(col_name)
+    if store.count() == 0:
+        return store, np.empty(0, dtype=np.float32), []
+    scores, ids = store._query_topk(query_text=query, n_results=top_k)
+    return store, scores, ids
+
+
+@functools.lru_cache(maxsize=512)
+def _search_cached(query: str, top_k: int, score_threshold: float) -> tuple:
+    """검색 본체 — 동일 (쿼리, top_k, 임계치) 재호출은 캐시에서 즉시 반환"""
+    # 컬렉션별 결과를 배열로 모아 병합·정렬까지 마친 뒤, 최종 생존한
+    # top_k 건에 대해서만 dict를 생성 (히트당 dict 할당 제거)
+    score_arrays: list[np.ndarray] = []
+    refs: list[tuple[VectorStore, str]] = []
+
+    futures = {
+        col_name: _search_pool.submit(_query_collection, col_name, query, top_k)
+        for col_name in ALL_COLLECTIONS
+    }
+
+    for col_name, future in futures.items():
+        try:
+            store, scores, ids = future.result()
+        except Exception as e:
+            print(f"[LegalRAG] {col_name} 검색 오류: {e}")
+            continue
+        # 임계치 미달 결과 제외 (개발명세서 4.3 제약)
+        # round(…, 4)된 값과 비교하던 기존 동작 유지를 위해 반올림 후 비교
+        rounded = np.round(scores.astype(np.float64), 4)
+        mask = rounded >= score_threshold
+        score_arrays.append(rounded[mask])
+        refs.extend((store, ids[i]) for i in np.flatnonzero(mask))
+
+    if not refs:
+        return ()
+
+    merged = np.concatenate(score_arrays)
+    order = np.argsort(merged)[::-1][:top_k]
+    return tuple(
+        refs[i][0]._hit_dict(refs[i][1], merged[i]) for i in order
+    )
+
+
+def _invalidate_search_cache() -> None:
+    """문서 변경(upsert/clear/동기화) 시 검색 결과 캐시 무효화"""
+    _search_cached.cache_clear()
+
+
+def warmup(background: bool = True) -> None:
+    """
+    컬렉션 로드와 인덱스 구축을 미리 수행 (콜드 스타트 제거)
+
+    첫 검색 요청이 JSON 파싱 + 인덱스 구축 비용을 전부 지불하지 않도록
+    앱 기동 시점(FastAPI startup 이벤트 등)에 호출합니다.
+
+    Args:
+        background: True면 데몬 스레드에서 수행해 기동을 막지 않음
+    """
+
+    def _do() -> None:
+        for name in ALL_COLLECTIONS:
+            try:
+                store = get_or_create_collection(name)
+                if store.count() and store._dirty:
+                    store._rebuild_index()
+            except Exception as e:
+                print(f"[LegalRAG] {name} 웜업 실패 (무시): {e}")
+
+    if background:
+        threading.Thread(target=_do, name="legal-rag-warmup", daemon=True).start()
+    else:
+        _do()
+
+
 def search_legal_context(
     query: str,
     top_k: int = 5,
@@ -556,6 +1032,8 @@ def search_legal_context(
     """
     쿼리와 유사한 법령·판례·정책 청크 반환
 
+    RAG 워크로드는 동일 쿼리 반복이 잦으므로 결과를 LRU 캐시에 유지합니다.
+
     Args:
         query: 검색문
         top_k: 상위 결과 개수
@@ -564,7 +1042,27 @@ def search_legal_context(
     Returns:
         [{"text": str, "metadata": dict, "score": float}, ...]
     """
-    results: list[dict] = []
+    # 캐시 항목이 호출부에서 변형되지 않도록 얕은 복사로 반환
+    return [dict(hit) for hit in _search_cached(query, top_k, score_threshold)]
+
+
+def search_legal_context_batch(
+    queries: list[str],
+    top_k: int = 5,
+    score_threshold: float = 0.7,
+) -> list[list[dict]]:
+    """
+    여러 쿼리를 일괄 검색 — 쿼리별 결과 리스트를 입력 순서대로 반환
+
+    search_legal_context를 쿼리마다 부르면 쿼리 벡터 변환과 컬렉션
+    순회가 쿼리 수만큼 반복됩니다. 이 함수는 컬렉션당 희소 행렬곱
+    1회로 쿼리 전체를 채점합니다. (테스트 스크립트 등 배치 경로 전용
+    — 결과 캐시는 사용하지 않음)
+    """
+    if not queries:
+        return []
+
+    all_results: list[list[dict]] = [[] for _ in queries]
 
     for col_name in ALL_COLLECTIONS:
         try:
@@ -572,20 +1070,22 @@ def search_legal_context(
             if store.count() == 0:
                 continue
 
-            hits = store.query(query_text=query, n_results=top_k)
-
-            for hit in hits:
-                # 임계치 미달 결과 제외 (개발명세서 4.3 제약)
-                if hit["score"] >= score_threshold:
-                    results.append(hit)
+            for qi, (scores, ids) in enumerate(
+                store._query_topk_many(queries, n_results=top_k)
+            ):
+                # 단일 쿼리 경로와 동일하게 반올림 후 임계치 비교
+                rounded = np.round(scores.astype(np.float64), 4)
+                mask = rounded >= score_threshold
+                for i in np.flatnonzero(mask):
+                    all_results[qi].append(store._hit_dict(ids[i], rounded[i]))
 
         except Exception as e:
-            print(f"[LegalRAG] {col_name} 검색 오류: {e}")
+            print(f"[LegalRAG] {col_name} 일괄 검색 오류: {e}")
             continue
 
-    # 유사도 내림차순 정렬 → top_k 제한
-    results.sort(key=lambda x: x["score"], reverse=True)
-    return results[:top_k]
+    for hits in all_results:
+        hits.sort(key=lambda x: x["score"], reverse=True)
+    return [hits[:top_k] for hits in all_results]
 
 
 # ─────────────────────────────────────────────────────────────
@@ -625,6 +1125,7 @@ def sync_legal_data(
         "precedents_added": precs_total,
         "total_chunks": laws_total + precs_total,
     }
+    _invalidate_search_cache()
     print(f"\n[LegalRAG] 동기화 완료: {summary}")
     return summary
 
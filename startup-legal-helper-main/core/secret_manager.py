@@ -8,9 +8,62 @@ API 키 및 보안 설정을 안전하게 관리하는 중앙화된 시크릿 
 3. .env 파일 (로컬 개발용)
 """
 
+import functools
 import os
+import time
 from typing import Optional
 
+# streamlit import는 모듈 로드 시 1회만 — 호출마다 import 기계를
+# 다시 태우지 않음 (secrets.toml이 없는 환경에서는 None)
+try:
+    import streamlit as _st
+except Exception:
+    _st = None
+
+# dotenv import도 모듈 로드 시 1회 — load_dotenv처럼 os.environ을
+# 오염시키는 대신 .env를 dict로 1회 파싱해 들고 있음
+try:
+    from dotenv import dotenv_values as _dotenv_values, find_dotenv as _find_dotenv
+except ImportError:
+    _dotenv_values = None
+    _find_dotenv = None
+
+_DOTENV_CACHE = None
+
+
+def _dotenv_cache() -> dict:
+    global _DOTENV_CACHE
+    if _DOTENV_CACHE is None:
+        if _dotenv_values is not None:
+            _DOTENV_CACHE = _dotenv_values(_find_dotenv(usecwd=True)) or {}
+        else:
+            _DOTENV_CACHE = {}
+    return _DOTENV_CACHE
+
+
+@functools.lru_cache(maxsize=32)
+def _get_api_key(key_name: str) -> Optional[str]:
+    """
+    키 조회 본체 — 프로세스 내에서 키는 사실상 불변이므로 키 이름당
+    1회만 조회하고 이후에는 캐시에서 반환 (st.secrets 조회·dotenv
+    디스크 I/O가 핫 패스에서 사라짐)
+    """
+    # 1순위: Streamlit Secrets (배포 환경 권장)
+    if _st is not None:
+        try:
+            if key_name in _st.secrets:
+                return _st.secrets[key_name]
+        except Exception:
+            pass  # secrets.toml이 없는 경우 무시
+
+    # 2순위: OS 환경변수 (서버 환경 또는 시스템 설정)
+    value = os.getenv(key_name)
+    if value:
+        return value
+
+    # 3순위: .env 파일 (로컬 개발용 — 1회 파싱된 dict 조회, env 비오염)
+    return _dotenv_cache().get(key_name)
+
 
 class SecretManager:
     """
@@ -18,6 +71,8 @@ class SecretManager:
     UI 입력 방식 없이 시스템 레벨에서만 키를 관리합니다.
     """
     _instance = None
+    _STATUS_TTL = 300.0  # 상태 메시지 캐시 수명(초) — st.secrets 반복 조회 방지
+    _status_cache = None  # (만료 시각, 상태 dict)
 
     def __new__(cls):
         if cls._instance is None:
@@ -26,35 +81,21 @@ class SecretManager:
 
     def get_api_key(self, key_name: str = "ANTHROPIC_API_KEY") -> Optional[str]:
         """
-        지정된 API 키를 안전한 우선순위로 로드합니다.
+        지정된 API 키를 안전한 우선순위로 로드합니다. (키 이름당 1회 조회 후 캐시)
 
         Returns:
             str: API 키 값, 없으면 None
         """
-        # 1순위: Streamlit Secrets (배포 환경 권장)
-        try:
-            import streamlit as st
-            if key_name in st.secrets:
-                return st.secrets[key_name]
-        except Exception:
-            pass  # secrets.toml이 없는 경우 무시
-
-        # 2순위: OS 환경변수 (서버 환경 또는 시스템 설정)
-        value = os.getenv(key_name)
-        if value:
-            return value
+        return _get_api_key(key_name)
 
-        # 3순위: .env 파일 (로컬 개발용)
-        try:
-            from dotenv import load_dotenv
-            load_dotenv()
-            value = os.getenv(key_name)
-            if value:
-                return value
-        except ImportError:
-            pass
+    def invalidate(self) -> None:
+        """조회 캐시 초기화 — 테스트나 런타임 키 교체 시 사용"""
+        _get_api_key.cache_clear()
+        self.invalidate_status()
 
-        return None
+    def invalidate_status(self) -> None:
+        """상태 메시지 캐시만 초기화 (키 조회 캐시는 유지)"""
+        self._status_cache = None
 
     def get_anthropic_key(self) -> Optional[str]:
         """Anthropic API 키를 반환합니다."""
@@ -66,22 +107,32 @@ class SecretManager:
 
     def get_status_message(self) -> dict:
         """
-        보안 상태 정보를 반환합니다.
+        보안 상태 정보를 반환합니다. (짧은 TTL 캐시 — 렌더링마다 st.secrets 재조회 방지)
 
         Returns:
             dict: {"has_key": bool, "source": str, "message": str}
         """
+        now = time.monotonic()
+        if self._status_cache is not None and self._status_cache[0] > now:
+            return self._status_cache[1]
+
+        status = self._build_status_message()
+        self._status_cache = (now + self._STATUS_TTL, status)
+        return status
+
+    @staticmethod
+    def _build_status_message() -> dict:
         # 소스 판별
-        try:
-            import streamlit as st
-            if "ANTHROPIC_API_KEY" in st.secrets:
-                return {
-                    "has_key": True,
-                    "source": "Streamlit Secrets",
-                    "message": "✅ 보안 연결 활성화 (Streamlit Secrets)"
-                }
-        except Exception:
-            pass
+        if _st is not None:
+            try:
+                if "ANTHROPIC_API_KEY" in _st.secrets:
+                    return {
+                        "has_key": True,
+                        "source": "Streamlit Secrets",
+                        "message": "✅ 보안 연결 활성화 (Streamlit Secrets)"
+                    }
+            except Exception:
+                pass
 
         if os.getenv("ANTHROPIC_API_KEY"):
             return {
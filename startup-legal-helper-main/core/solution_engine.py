@@ -6,8 +6,15 @@ startup-legal-helper-main/core/solution_engine.py
 기술적/구조적 우회 전략(Bypass Strategy) 및 대안 솔루션을 제안합니다.
 """
 
+import re
 from typing import List, Dict
 
+# 선택 의존성: pyahocorasick — 카테고리 전 패턴을 텍스트 1패스로 탐지
+try:
+    import ahocorasick as _ahocorasick
+except ImportError:
+    _ahocorasick = None
+
 class SolutionEngine:
     """
     리스크 유형별 솔루션 매핑 및 대안 생성 엔진
@@ -47,14 +54,28 @@ class SolutionEngine:
         """
         suggested = []
         found_categories = set()
+        total_categories = len(self.STRATEGY_MAP)
+        seen_texts = set()
 
         for result in analysis_results:
             text = result.get("text", "")
+            # RAG는 같은 조문의 근접 중복 청크를 자주 반환 — 앞 256자
+            # 해시가 같으면 재스캔 생략
+            text_key = hash(text[:256])
+            if text_key in seen_texts:
+                continue
+            seen_texts.add(text_key)
+
+            # 카테고리×패턴 중첩 substring 검색 대신 텍스트 1패스로
+            # 매칭된 카테고리를 전부 수집
+            matched = _match_categories(text)
             for category, data in self.STRATEGY_MAP.items():
-                if any(p in text for p in data["patterns"]):
-                    if category not in found_categories:
-                        suggested.extend(data["solutions"])
-                        found_categories.add(category)
+                if category in matched and category not in found_categories:
+                    suggested.extend(data["solutions"])
+                    found_categories.add(category)
+            # 전 카테고리가 이미 매칭되면 남은 결과 스캔은 무의미
+            if len(found_categories) == total_categories:
+                break
 
         # 기본 일반 솔루션
         if not suggested:
@@ -62,6 +83,40 @@ class SolutionEngine:
 
         return suggested
 
+
+# 패턴 → 카테고리 매처 — 클래스 로드 시 1회 구축.
+# 오토마톤이 있으면 Aho-Corasick 단일 스캔(O(n)), 없으면 패턴 전체를
+# 하나의 컴파일된 정규식 교대(alternation)로 대체
+_PATTERN_CATEGORY = {
+    p: cat
+    for cat, data in SolutionEngine.STRATEGY_MAP.items()
+    for p in data["patterns"]
+}
+
+if _ahocorasick is not None:
+    _PATTERN_AUTOMATON = _ahocorasick.Automaton()
+    for _p, _cat in _PATTERN_CATEGORY.items():
+        _PATTERN_AUTOMATON.add_word(_p, _cat)
+    _PATTERN_AUTOMATON.make_automaton()
+    _PATTERN_REGEX = None
+else:
+    _PATTERN_AUTOMATON = None
+    _PATTERN_REGEX = re.compile(
+        "|".join(re.escape(p) for p in _PATTERN_CATEGORY)
+    )
+
+
+def _match_categories(text: str) -> set:
+    """텍스트에 등장하는 패턴들의 카테고리 집합을 1패스로 수집"""
+    if not text:
+        return set()
+    if _PATTERN_AUTOMATON is not None:
+        return {cat for _, cat in _PATTERN_AUTOMATON.iter(text)}
+    return {
+        _PATTERN_CATEGORY[m.group(0)] for m in _PATTERN_REGEX.finditer(text)
+    }
+
+
 if __name__ == "__main__":
     # 간단한 테스트
     engine = SolutionEngine()
@@ -3,10 +3,12 @@
 
 import json
 import sys
-sys.stdout.reconfigure(encoding='utf-8')
 
+from core._windows_utf8 import ensure_utf8_stdio
 from core.law_api import search_laws, search_precedents
 
+ensure_utf8_stdio()
+
 print("=" * 60)
 print("국가법령정보 Open API 연결 테스트")
 print("=" * 60)
@@ -2,6 +2,7 @@
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 # Path setup
@@ -14,13 +15,16 @@ from core.agent_orchestrator import LegalAgentTeam
 def test_system_flow():
     load_dotenv()
     print("=== SafeLaunch AI v3.0 System Test ===")
-    
+
     query = "AI를 사용하여 타사 뉴스 기사를 크롤링하고 요약하여 구독 서비스로 제공하는 모델"
     print(f"\n[1] 입력 쿼리: {query}")
-    
-    # 1. RAG Search
+
+    # 1. RAG Search — 에이전트 팀 준비(키 파싱 + 클라이언트 구성)는 RAG와
+    # 독립이므로 백그라운드 스레드에서 겹쳐 실행 (콜드 스타트 단축)
     print("\n[2] RAG 검색 중 (Embedding Search)...")
-    results = search_legal_context(query, top_k=3)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        future_team = pool.submit(LegalAgentTeam)
+        results = search_legal_context(query, top_k=3)
     for i, res in enumerate(results):
         source = res['metadata'].get('law_name') or res['metadata'].get('case_name') or "데이터"
         print(f" - 결과 {i+1} [{source}]: {res['text'][:100]}... (Score: {res['score']:.4f})")
@@ -35,7 +39,7 @@ def test_system_flow():
     # 3. Agent Analysis (If API Key exists)
     if os.getenv("ANTHROPIC_API_KEY"):
         print("\n[4] Claude 에이전트 팀 분석 중 (Multi-Agent)...")
-        team = LegalAgentTeam()
+        team = future_team.result()  # RAG와 겹쳐 준비된 팀 재사용
         context = "\n".join([r['text'] for r in results])
         report = team.run_analysis_workflow(query, context)
         print("\n--- 최종 에이전트 리포트 ---")
@@ -0,0 +1,12 @@
+"""
+SafeLaunch AI -- pytest 공통 설정
+tests/conftest.py
+"""
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "heavy: 임베딩/벡터 인덱스 로드 등 무거운 초기화를 유발하는 테스트 "
+        '(개발 루프에서는 pytest -m "not heavy"로 제외)',
+    )
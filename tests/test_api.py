@@ -12,18 +12,56 @@ import pytest
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
+# pytest-xdist 병렬 실행 시 워커별 DB 사본을 쓰도록 api import 전에
+# SLDB_PATH를 지정 — 워커 간 SQLite 쓰기 잠금 경합 제거
+_worker = os.environ.get("PYTEST_XDIST_WORKER")
+if _worker and "SLDB_PATH" not in os.environ:
+    import shutil
+    import tempfile
+
+    _src = os.path.join(os.path.dirname(__file__), "..", "database", "safelaunch.db")
+    _dst = os.path.join(tempfile.gettempdir(), f"safelaunch_{_worker}.db")
+    shutil.copyfile(_src, _dst)
+    os.environ["SLDB_PATH"] = _dst
+
+import asyncio
+
 from fastapi.testclient import TestClient
-from api import app
+from httpx import ASGITransport, AsyncClient
 
 
 @pytest.fixture(scope="module")
 def client():
+    # api import는 FastAPI 앱 구성·DB 싱글톤 초기화를 동반하는 무거운
+    # 경로 — 수집(collection) 단계가 아닌 첫 사용 시점으로 미룸
+    from api import app
+
     return TestClient(app)
 
 
+@pytest.fixture(scope="module")
+def anyio_backend():
+    return "asyncio"
+
+
 @pytest.fixture()
+async def async_client():
+    """비동기 클라이언트 — 독립 요청을 asyncio.gather로 파이프라인"""
+    from api import app
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as ac:
+        yield ac
+
+
+@pytest.fixture(scope="module")
 def test_user(client):
-    """테스트용 사용자 생성 → user_id 반환 → 종료 후 삭제"""
+    """테스트용 공유 사용자 — 모듈당 1회 생성 (비밀번호 해시 비용 분할 상환)
+
+    사용 테스트는 읽기 전용이거나 사용자 하위 리소스(프로젝트 등)만
+    만들고 지우므로 함수 스코프일 필요가 없다.
+    """
     import uuid
     email = f"test_{uuid.uuid4().hex[:8]}@test.com"
     r = client.post("/api/auth/register", json={
@@ -130,36 +168,37 @@ class TestPrecedents:
 # ──────────────────────────────────────────────
 
 class TestProjects:
-    def test_crud_lifecycle(self, client, test_user):
+    @pytest.mark.anyio
+    async def test_crud_lifecycle(self, async_client, test_user, anyio_backend):
         headers = {"X-User-Id": test_user}
 
         # Create
-        r = client.post("/api/projects", json={
+        r = await async_client.post("/api/projects", json={
             "name": "My App",
             "platforms": ["ios"],
         }, headers=headers)
         assert r.status_code == 201
         proj_id = r.json()["id"]
 
-        # List
-        r = client.get("/api/projects", headers=headers)
-        assert r.status_code == 200
-        assert r.json()["count"] >= 1
-
-        # Get
-        r = client.get(f"/api/projects/{proj_id}", headers=headers)
-        assert r.status_code == 200
-        assert r.json()["name"] == "My App"
+        # List + Get — 서로 독립인 읽기 요청은 동시 실행
+        list_r, get_r = await asyncio.gather(
+            async_client.get("/api/projects", headers=headers),
+            async_client.get(f"/api/projects/{proj_id}", headers=headers),
+        )
+        assert list_r.status_code == 200
+        assert list_r.json()["count"] >= 1
+        assert get_r.status_code == 200
+        assert get_r.json()["name"] == "My App"
 
         # Update
-        r = client.put(f"/api/projects/{proj_id}", json={
+        r = await async_client.put(f"/api/projects/{proj_id}", json={
             "name": "Updated App",
         }, headers=headers)
         assert r.status_code == 200
         assert r.json()["name"] == "Updated App"
 
         # Delete
-        r = client.delete(f"/api/projects/{proj_id}", headers=headers)
+        r = await async_client.delete(f"/api/projects/{proj_id}", headers=headers)
         assert r.status_code == 200
         assert r.json()["deleted"] is True
 
@@ -184,6 +223,7 @@ class TestSearch:
         for item in r.json()["items"]:
             assert item["source_type"] == "law"
 
+    @pytest.mark.heavy  # TF-IDF 인덱스(sklearn) 로드 유발 — pytest -m "not heavy"로 제외 가능
     def test_rag_search(self, client):
         r = client.get("/api/search/rag?q=앱 개인정보 수집&top_k=3&threshold=0.05")
         assert r.status_code == 200
@@ -195,29 +235,32 @@ class TestSearch:
 # ──────────────────────────────────────────────
 
 class TestAnalysis:
-    def test_create_and_list_analysis(self, client, test_user):
+    @pytest.mark.anyio
+    async def test_create_and_list_analysis(self, async_client, test_user, anyio_backend):
         headers = {"X-User-Id": test_user}
 
         # Create project
-        r = client.post("/api/projects", json={"name": "AnalysisTest"}, headers=headers)
+        r = await async_client.post(
+            "/api/projects", json={"name": "AnalysisTest"}, headers=headers
+        )
         proj_id = r.json()["id"]
 
         # Create analysis
-        r = client.post(f"/api/projects/{proj_id}/analyses", json={
+        r = await async_client.post(f"/api/projects/{proj_id}/analyses", json={
             "analysis_type": "quick",
         }, headers=headers)
         assert r.status_code == 201
         analysis_id = r.json()["analysis_id"]
 
-        # List
-        r = client.get(f"/api/projects/{proj_id}/analyses", headers=headers)
-        assert r.status_code == 200
-        assert r.json()["count"] >= 1
-
-        # Get detail
-        r = client.get(f"/api/analyses/{analysis_id}", headers=headers)
-        assert r.status_code == 200
-        assert r.json()["analysis_type"] == "quick"
+        # List + Get detail — 독립 읽기 요청 동시 실행
+        list_r, detail_r = await asyncio.gather(
+            async_client.get(f"/api/projects/{proj_id}/analyses", headers=headers),
+            async_client.get(f"/api/analyses/{analysis_id}", headers=headers),
+        )
+        assert list_r.status_code == 200
+        assert list_r.json()["count"] >= 1
+        assert detail_r.status_code == 200
+        assert detail_r.json()["analysis_type"] == "quick"
 
         # Cleanup
         from core.database import db
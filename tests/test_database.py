@@ -6,9 +6,9 @@ tests/test_database.py
 """
 
 import os
+import sqlite3
 import sys
-import tempfile
-import shutil
+import uuid
 
 import pytest
 
@@ -19,26 +19,19 @@ from core.database import DatabaseManager
 
 @pytest.fixture()
 def tmp_db():
-    """테스트용 임시 DB — 테스트 종료 후 자동 삭제"""
-    tmp_dir = tempfile.mkdtemp()
-    db_path = os.path.join(tmp_dir, "test.db")
+    """테스트용 인메모리 DB — fsync 없이 커밋 (xdist 워커 간 이름 충돌 없음)
 
-    # schema.sql 경로를 복사
-    src_schema = os.path.join(os.path.dirname(__file__), "..", "database", "schema.sql")
-    dst_schema = os.path.join(tmp_dir, "schema.sql")
-    shutil.copy(src_schema, dst_schema)
+    공유 캐시 인메모리 DB는 마지막 연결이 닫히면 사라지므로, 테스트
+    동안 keeper 연결을 하나 열어 수명을 보장한다.
+    """
+    db_uri = f"file:test_{uuid.uuid4().hex}?mode=memory&cache=shared"
+    keeper = sqlite3.connect(db_uri, uri=True)
 
-    # DatabaseManager가 스키마를 찾을 수 있도록 monkey-patch
-    import core.database as dbmod
-    original_schema = dbmod.SCHEMA_PATH
-    dbmod.SCHEMA_PATH = dst_schema
-
-    db = DatabaseManager(db_path=db_path)
+    db = DatabaseManager(db_path=db_uri)
 
     yield db
 
-    dbmod.SCHEMA_PATH = original_schema
-    shutil.rmtree(tmp_dir, ignore_errors=True)
+    keeper.close()
 
 
 # ──────────────────────────────────────────────
@@ -101,8 +94,10 @@ class TestProjects:
 
     def test_list_projects_pagination(self, tmp_db):
         user = tmp_db.create_user(email="list@t.com", password_hash="h")
-        for i in range(5):
-            tmp_db.create_project(user_id=user["id"], name=f"App{i}")
+        created = tmp_db.create_projects_many(
+            user["id"], [{"name": f"App{i}"} for i in range(5)]
+        )
+        assert len(created) == 5
 
         page1 = tmp_db.list_projects(user["id"], limit=3, offset=0)
         page2 = tmp_db.list_projects(user["id"], limit=3, offset=3)
@@ -4,15 +4,14 @@ Self-healing RAG만 테스트 (ANTHROPIC_API_KEY)
 
 import sys
 import os
-import io
-
-if sys.platform == 'win32':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, PROJECT_ROOT)
 
+from core._windows_utf8 import ensure_utf8_stdio
+
+ensure_utf8_stdio()
+
 # .env 로드
 try:
     from dotenv import load_dotenv